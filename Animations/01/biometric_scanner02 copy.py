@@ -1,10 +1,13 @@
+import os
 import sys
-from PySide6.QtWidgets import QApplication, QWidget
+from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QPainter, QPen, QColor, QFont, QRadialGradient, QLinearGradient
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF
+from PySide6.QtCore import Qt, QPointF, QRectF
 from math import cos, sin, pi, sqrt
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from quantumui import AnimatedWidget, text_cache
 
-class ImprovedAIAssistant(QWidget):
+class ImprovedAIAssistant(AnimatedWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Assistente Virtual IA - Melhorada")
@@ -19,9 +22,7 @@ class ImprovedAIAssistant(QWidget):
         self.oscillation = [0.5 * sin(i) for i in range(20)]  # Para movimentar os nós
         
         # Timer para animação
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(30)
+        self.start_animation(30)
     
     def update_animation(self):
         self.angle = (self.angle + 1) % 360
@@ -31,8 +32,6 @@ class ImprovedAIAssistant(QWidget):
         # Atualizar oscilação
         for i in range(len(self.oscillation)):
             self.oscillation[i] = 0.5 * sin(self.pulse + i / 2)
-        
-        self.update()
     
     def draw_neural_network(self, painter, center_x, center_y, scale):
         layers = [4, 6, 6, 4]
@@ -103,7 +102,7 @@ class ImprovedAIAssistant(QWidget):
                 painter.drawLine(QPointF(x1, y1), QPointF(x2, y2))
         
         # Texto central com efeito de escaneamento
-        font = QFont("Arial", int(30 * scale), QFont.Bold)
+        font = text_cache.font("Arial", int(30 * scale), QFont.Bold)
         painter.setFont(font)
         
         # Efeito de brilho no "AI Assistant"
@@ -116,11 +115,11 @@ class ImprovedAIAssistant(QWidget):
                            Qt.AlignCenter, "AI Assistant")
         
         # Status da IA
-        font.setPointSize(int(12 * scale))
+        font = text_cache.font("Arial", int(12 * scale), QFont.Bold)
         painter.setFont(font)
         status = "PROCESSING DATA..."
         painter.setPen(QColor(100, 200, 255, 200))
-        painter.drawText(QRectF(center_x-150*scale, center_y+50*scale, 300*scale, 30*scale),
+        text_cache.draw(painter, QRectF(center_x-150*scale, center_y+50*scale, 300*scale, 30*scale),
                         Qt.AlignCenter, status)
 
     def mousePressEvent(self, event):
@@ -1,10 +1,13 @@
+import os
 import sys
-from PySide6.QtWidgets import QApplication, QWidget
+from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QPainter, QPen, QColor, QFont, QRadialGradient, QLinearGradient
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF
+from PySide6.QtCore import Qt, QPointF, QRectF
 from math import cos, sin, pi, sqrt
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from quantumui import AnimatedWidget, text_cache
 
-class IntenseAIAssistant(QWidget):
+class IntenseAIAssistant(AnimatedWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Assistente Virtual IA - Intensa")
@@ -19,9 +22,7 @@ class IntenseAIAssistant(QWidget):
         self.oscillation = [0.5 * sin(i) for i in range(20)]  # Para movimentar os nós
         
         # Timer para animação
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(30)
+        self.start_animation(30)
     
     def update_animation(self):
         self.angle = (self.angle + 1) % 360
@@ -31,8 +32,6 @@ class IntenseAIAssistant(QWidget):
         # Atualizar oscilação
         for i in range(len(self.oscillation)):
             self.oscillation[i] = 0.5 * sin(self.pulse + i / 2)
-        
-        self.update()
     
     def draw_neural_network(self, painter, center_x, center_y, scale):
         layers = [4, 6, 6, 4]
@@ -103,7 +102,7 @@ class IntenseAIAssistant(QWidget):
                 painter.drawLine(QPointF(x1, y1), QPointF(x2, y2))
         
         # Texto central com brilho intenso
-        font = QFont("Arial", int(30 * scale), QFont.Bold)
+        font = text_cache.font("Arial", int(30 * scale), QFont.Bold)
         painter.setFont(font)
         for i in range(5):
             brightness = (5 - i) * 50
@@ -112,11 +111,11 @@ class IntenseAIAssistant(QWidget):
                              Qt.AlignCenter, "AI Assistant")
         
         # Status da IA
-        font.setPointSize(int(12 * scale))
+        font = text_cache.font("Arial", int(12 * scale), QFont.Bold)
         painter.setFont(font)
         painter.setPen(QColor(255, 0, 100, 200))
-        painter.drawText(QRectF(center_x-150*scale, center_y+50*scale, 300*scale, 30*scale),
-                         Qt.AlignCenter, "PROCESSING DATA...")
+        text_cache.draw(painter, QRectF(center_x-150*scale, center_y+50*scale, 300*scale, 30*scale),
+                        Qt.AlignCenter, "PROCESSING DATA...")
 
     def mousePressEvent(self, event):
         self.old_pos = event.globalPosition().toPoint()
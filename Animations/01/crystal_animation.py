@@ -1,10 +1,13 @@
+import os
 import sys
-from PySide6.QtWidgets import QApplication, QWidget
+from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QPainter, QPen, QColor, QFont, QRadialGradient
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF
+from PySide6.QtCore import Qt, QPointF, QRectF
 from math import cos, sin, pi
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from quantumui import AnimatedWidget, text_cache
 
-class CrystalWidget(QWidget):
+class CrystalWidget(AnimatedWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Cristais Mágicos")
@@ -16,15 +19,12 @@ class CrystalWidget(QWidget):
         self.crystal_pulse = 0
         self.magic_wave = 0
         
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(30)
+        self.start_animation(30)
     
     def update_animation(self):
         self.angle = (self.angle + 1) % 360
         self.crystal_pulse = (self.crystal_pulse + 0.08) % (2 * pi)
         self.magic_wave = (self.magic_wave + 0.05) % (2 * pi)
-        self.update()
     
     def draw_crystal(self, painter, x, y, size, rotation):
         points = []
@@ -98,7 +98,7 @@ class CrystalWidget(QWidget):
             painter.drawEllipse(QPointF(x, y), size, size)
         
         # Texto central
-        font = QFont("Arial", 35, QFont.Bold)
+        font = text_cache.font("Arial", 35, QFont.Bold)
         painter.setFont(font)
         
         # Sombra mágica do texto
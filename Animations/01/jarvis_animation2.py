@@ -1,11 +1,14 @@
+import os
 import sys
-from PySide6.QtWidgets import QApplication, QWidget
+from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QPainter, QPen, QColor, QFont, QRadialGradient, QLinearGradient
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF
+from PySide6.QtCore import Qt, QPointF, QRectF
 from math import cos, sin, pi, sqrt
-import random
+import numpy as np
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from quantumui import AnimatedWidget, PrimitiveBatch, text_cache
 
-class AdvancedGysinIA(QWidget):
+class AdvancedGysinIA(AnimatedWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Advanced Gysin-IA")
@@ -22,14 +25,12 @@ class AdvancedGysinIA(QWidget):
         self.generate_data_points()
         
         # Configurar timer para animação
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(20)  # Animação mais suave
+        self.start_animation(20)  # Animação mais suave
         
     def generate_data_points(self):
         for _ in range(50):
-            angle = random.uniform(0, 2*pi)
-            radius = random.uniform(100, 280)
+            angle = self.random.uniform(0, 2*pi)
+            radius = self.random.uniform(100, 280)
             self.data_points.append((angle, radius))
         
     def update_animation(self):
@@ -37,7 +38,6 @@ class AdvancedGysinIA(QWidget):
         self.pulse_angle = (self.pulse_angle + 3) % 360
         self.pulse_size = 10 + sin(self.pulse_angle * pi / 180) * 5
         self.text_opacity = 155 + int(abs(sin(self.pulse_angle * pi / 180)) * 100)
-        self.update()
         
     def draw_tech_circle(self, painter, radius, segments):
         for i in range(segments):
@@ -95,26 +95,26 @@ class AdvancedGysinIA(QWidget):
             painter.drawArc(QRectF(-320, -320, 640, 640), start_angle, 30 * 16)
         
         # Pontos de dados
-        for angle, radius in self.data_points:
-            x = cos(angle + self.angle * pi / 180) * radius
-            y = sin(angle + self.angle * pi / 180) * radius
-            opacity = 100 + abs(sin(angle + self.pulse_angle * pi / 180)) * 155
-            painter.setPen(QPen(QColor(0, 255, 255, int(opacity)), 2))
-            painter.drawPoint(QPointF(x, y))
-        
-        # Linhas de conexão
-        for i in range(len(self.data_points)):
-            for j in range(i+1, min(i+5, len(self.data_points))):
-                x1, y1 = cos(self.data_points[i][0] + self.angle * pi / 180) * self.data_points[i][1], sin(self.data_points[i][0] + self.angle * pi / 180) * self.data_points[i][1]
-                x2, y2 = cos(self.data_points[j][0] + self.angle * pi / 180) * self.data_points[j][1], sin(self.data_points[j][0] + self.angle * pi / 180) * self.data_points[j][1]
-                distance = sqrt((x2-x1)**2 + (y2-y1)**2)
-                if distance < 100:
-                    opacity = int((1 - distance/100) * 100)
-                    painter.setPen(QPen(QColor(0, 255, 255, opacity), 1))
-                    painter.drawLine(QPointF(x1, y1), QPointF(x2, y2))
+        angles, radii = np.array(self.data_points).T
+        rotated = angles + self.angle * pi / 180
+        xs, ys = np.cos(rotated) * radii, np.sin(rotated) * radii
+        opacities = (100 + np.abs(np.sin(angles + self.pulse_angle * pi / 180)) * 155).astype(int)
+        batch = PrimitiveBatch()
+        batch.add_points(xs, ys, (0, 255, 255, opacities), width=2)
+        batch.flush(painter)
+        
+        # Linhas de conexão (cada ponto com os quatro seguintes)
+        first, second = np.triu_indices(len(xs), 1)
+        first, second = first[second - first < 5], second[second - first < 5]
+        distance = np.hypot(xs[second] - xs[first], ys[second] - ys[first])
+        near = distance < 100
+        first, second = first[near], second[near]
+        opacities = ((1 - distance[near] / 100) * 100).astype(int)
+        batch.add_lines(xs[first], ys[first], xs[second], ys[second], (0, 255, 255, opacities))
+        batch.flush(painter)
         
         # Texto Gysin-IA com efeito futurista
-        font = QFont("Arial", 40, QFont.Bold)
+        font = text_cache.font("Arial", 40, QFont.Bold)
         painter.setFont(font)
         
         # Efeito de brilho dinâmico
@@ -133,7 +133,7 @@ class AdvancedGysinIA(QWidget):
         painter.drawText(QRectF(-200, -30, 400, 60), Qt.AlignCenter, "Gysin-IA")
         
         # Detalhes técnicos
-        detail_font = QFont("Arial", 10)
+        detail_font = text_cache.font("Arial", 10)
         painter.setFont(detail_font)
         for i in range(12):
             angle = (i * 30 + self.angle) * pi / 180
@@ -146,10 +146,10 @@ class AdvancedGysinIA(QWidget):
 
         # Status dinâmico
         status_text = "ANALYZING..." if self.angle % 180 < 90 else "PROCESSING..."
-        painter.setFont(QFont("Arial", 14))
+        painter.setFont(text_cache.font("Arial", 14))
         pen.setColor(QColor(0, 255, 255, 200))
         painter.setPen(pen)
-        painter.drawText(QRectF(-100, 320, 200, 30), Qt.AlignCenter, status_text)
+        text_cache.draw(painter, QRectF(-100, 320, 200, 30), Qt.AlignCenter, status_text)
 
     def mousePressEvent(self, event):
         self.old_pos = event.globalPosition().toPoint()
@@ -1,10 +1,13 @@
+import os
 import sys
-from PySide6.QtWidgets import QApplication, QWidget
+from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QPainter, QPen, QColor, QFont, QRadialGradient, QLinearGradient
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF
+from PySide6.QtCore import Qt, QPointF, QRectF
 from math import cos, sin, pi
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from quantumui import AnimatedWidget, text_cache
 
-class PortalWidget(QWidget):
+class PortalWidget(AnimatedWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Portal Energético")
@@ -16,15 +19,12 @@ class PortalWidget(QWidget):
         self.portal_pulse = 0
         self.energy_wave = 0
         
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(30)
+        self.start_animation(30)
     
     def update_animation(self):
         self.angle = (self.angle + 2) % 360
         self.portal_pulse = (self.portal_pulse + 0.1) % (2 * pi)
         self.energy_wave = (self.energy_wave + 0.05) % (2 * pi)
-        self.update()
     
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -86,7 +86,7 @@ class PortalWidget(QWidget):
             painter.drawEllipse(QPointF(x2, y2), particle_size, particle_size)
         
         # Texto central com efeito de brilho
-        font = QFont("Arial", 35, QFont.Bold)
+        font = text_cache.font("Arial", 35, QFont.Bold)
         painter.setFont(font)
         
         # Sombra do texto
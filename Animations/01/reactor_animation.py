@@ -1,10 +1,13 @@
+import os
 import sys
-from PySide6.QtWidgets import QApplication, QWidget
+from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QPainter, QPen, QColor, QFont, QRadialGradient
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF
+from PySide6.QtCore import Qt, QPointF, QRectF
 from math import cos, sin, pi
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from quantumui import AnimatedWidget, text_cache
 
-class ReactorWidget(QWidget):
+class ReactorWidget(AnimatedWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Reator de Energia")
@@ -16,15 +19,12 @@ class ReactorWidget(QWidget):
         self.energy_level = 0
         self.pulse = 0
         
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(30)
+        self.start_animation(30)
     
     def update_animation(self):
         self.angle = (self.angle + 3) % 360
         self.energy_level = (self.energy_level + 0.05) % (2 * pi)
         self.pulse = (self.pulse + 0.1) % (2 * pi)
-        self.update()
     
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -82,7 +82,7 @@ class ReactorWidget(QWidget):
             painter.drawEllipse(QPointF(x, y), particle_size, particle_size)
         
         # Medidores de energia
-        font = QFont("Arial", 8)
+        font = text_cache.font("Arial", 8)
         painter.setFont(font)
         for i in range(8):
             angle = i * 45 * pi / 180
@@ -97,7 +97,7 @@ class ReactorWidget(QWidget):
             painter.drawText(QPointF(x-30, y), text)
         
         # Texto central
-        font = QFont("Arial", 30, QFont.Bold)
+        font = text_cache.font("Arial", 30, QFont.Bold)
         painter.setFont(font)
         
         # Efeito de energia pulsante
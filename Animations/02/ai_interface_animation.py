@@ -1,10 +1,13 @@
+import os
 import sys
-from PySide6.QtWidgets import QApplication, QWidget
+from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QPainter, QPen, QColor, QFont, QRadialGradient, QPainterPath
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF
+from PySide6.QtCore import Qt, QPointF, QRectF
 from math import cos, sin, pi, exp
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from quantumui import AnimatedWidget, text_cache
 
-class AIInterfaceWidget(QWidget):
+class AIInterfaceWidget(AnimatedWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Interface Neural")
@@ -29,9 +32,7 @@ class AIInterfaceWidget(QWidget):
         self.current_message = 0
         self.message_progress = 0
         
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(30)
+        self.start_animation(30)
     
     def update_animation(self):
         self.wave_offset = (self.wave_offset + 0.1) % (2 * pi)
@@ -45,7 +46,6 @@ class AIInterfaceWidget(QWidget):
             self.current_message = (self.current_message + 1) % len(self.messages)
             
         self.conversation_phase = (self.conversation_phase + 0.03) % (2 * pi)
-        self.update()
     
     def draw_neural_connection(self, painter, start, end, intensity):
         path = QPainterPath()
@@ -69,15 +69,18 @@ class AIInterfaceWidget(QWidget):
         painter.setPen(pen)
         painter.drawPath(path)
     
+    def paint_background(self, painter, width, height):
+        gradient = QRadialGradient(width / 2, height / 2, 400)
+        gradient.setColorAt(0, QColor(40, 0, 60, 30))
+        gradient.setColorAt(1, QColor(0, 0, 0, 0))
+        painter.fillRect(0, 0, width, height, gradient)
+    
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
         # Fundo com gradiente
-        gradient = QRadialGradient(self.width()/2, self.height()/2, 400)
-        gradient.setColorAt(0, QColor(40, 0, 60, 30))
-        gradient.setColorAt(1, QColor(0, 0, 0, 0))
-        painter.fillRect(0, 0, self.width(), self.height(), gradient)
+        self.draw_layer(painter, 'background', self.paint_background)
         
         # Círculo central da IA
         center_x = self.width() / 2
@@ -135,7 +138,7 @@ class AIInterfaceWidget(QWidget):
                     self.draw_neural_connection(painter, points[i], points[j], intensity)
         
         # Texto da conversa
-        font = QFont("Arial", 12, QFont.Bold)
+        font = text_cache.font("Arial", 12, QFont.Bold)
         painter.setFont(font)
         
         current_text = self.messages[self.current_message]
@@ -146,17 +149,17 @@ class AIInterfaceWidget(QWidget):
         text_y = self.height() - 100
         pen = QPen(QColor(255, 255, 255))
         painter.setPen(pen)
-        painter.drawText(QRectF(50, text_y, self.width() - 100, 30),
+        text_cache.draw(painter, QRectF(50, text_y, self.width() - 100, 30),
                         Qt.AlignLeft | Qt.AlignVCenter,
                         display_text)
         
         # Cursor piscante
         if sin(self.conversation_phase * 5) > 0:
-            painter.drawText(QRectF(50 + len(display_text) * 7, text_y, 10, 30),
-                           Qt.AlignLeft | Qt.AlignVCenter, "_")
+            text_cache.draw(painter, QRectF(50 + len(display_text) * 7, text_y, 10, 30),
+                            Qt.AlignLeft | Qt.AlignVCenter, "_")
         
         # Logo Gysin-IA
-        font = QFont("Arial", 35, QFont.Bold)
+        font = text_cache.font("Arial", 35, QFont.Bold)
         painter.setFont(font)
         
         # Efeito de brilho no texto
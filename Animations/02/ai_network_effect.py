@@ -1,12 +1,14 @@
+import os
 import sys
-from PySide6.QtWidgets import QApplication, QWidget
+from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QPainter, QPen, QColor, QFont, QRadialGradient, QLinearGradient
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF
+from PySide6.QtCore import Qt, QPointF, QRectF
 from math import cos, sin, pi, exp, sqrt
-import random
 import string
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from quantumui import AnimatedWidget, PrimitiveBatch, glow_sprite, text_cache
 
-class AINetworkEffect(QWidget):
+class AINetworkEffect(AnimatedWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("AI Network Effect")
@@ -33,13 +35,15 @@ class AINetworkEffect(QWidget):
             QColor(150, 0, 255)   # Roxo
         ]
         
+        # Sorteios em bloco para os laços por nó e por conexão
+        self.sim_pool = self.streams.pool()
+        
         # Inicializar rede
         self.initialize_network()
+        self.roll_glitches()
         
         # Timer para animação
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(30)
+        self.start_animation(30)
     
     def initialize_network(self):
         # Criar nós em uma estrutura de rede neural
@@ -52,32 +56,32 @@ class AINetworkEffect(QWidget):
                 node = {
                     'x': horizontal_spacing * (node_idx + 1),
                     'y': vertical_spacing * (layer_idx + 1),
-                    'size': random.uniform(5, 15),
-                    'pulse': random.uniform(0, 2*pi),
-                    'color_idx': random.randint(0, len(self.colors)-1),
-                    'energy': random.uniform(0.5, 1.0)
+                    'size': self.random.uniform(5, 15),
+                    'pulse': self.random.uniform(0, 2*pi),
+                    'color_idx': self.random.randint(0, len(self.colors)-1),
+                    'energy': self.random.uniform(0.5, 1.0)
                 }
                 self.nodes.append(node)
         
         # Criar conexões entre nós
         for i, node1 in enumerate(self.nodes):
             for node2 in self.nodes[i+1:]:
-                if random.random() < 0.2:  # 20% de chance de conexão
+                if self.random.random() < 0.2:  # 20% de chance de conexão
                     self.connections.append({
                         'start': node1,
                         'end': node2,
-                        'strength': random.uniform(0.1, 1.0),
+                        'strength': self.random.uniform(0.1, 1.0),
                         'active': False,
                         'energy_particle': 0.0
                     })
     
     def create_thought_bubble(self):
         bubble = {
-            'x': random.uniform(0, self.width()),
+            'x': self.random.uniform(0, self.width()),
             'y': self.height(),
-            'size': random.uniform(20, 40),
-            'speed': random.uniform(2, 5),
-            'text': random.choice([
+            'size': self.random.uniform(20, 40),
+            'speed': self.random.uniform(2, 5),
+            'text': self.random.choice([
                 "Analyzing patterns...",
                 "Processing data...",
                 "Learning...",
@@ -96,20 +100,22 @@ class AINetworkEffect(QWidget):
         self.energy_flow = (self.energy_flow + 0.02) % 1.0
         
         # Atualizar nós
-        for node in self.nodes:
+        recharges = (self.sim_pool.random(len(self.nodes)) < 0.01).tolist()
+        for node, recharge in zip(self.nodes, recharges):
             node['pulse'] = (node['pulse'] + 0.05) % (2 * pi)
-            if random.random() < 0.01:
-                node['energy'] = random.uniform(0.5, 1.0)
+            if recharge:
+                node['energy'] = self.random.uniform(0.5, 1.0)
         
         # Atualizar conexões
-        for conn in self.connections:
-            if random.random() < 0.05:
+        toggles = (self.sim_pool.random(len(self.connections)) < 0.05).tolist()
+        for conn, toggle in zip(self.connections, toggles):
+            if toggle:
                 conn['active'] = not conn['active']
             if conn['active']:
                 conn['energy_particle'] = (conn['energy_particle'] + 0.05) % 1.0
         
         # Gerenciar bolhas de pensamento
-        if random.random() < 0.02:
+        if self.random.random() < 0.02:
             self.create_thought_bubble()
         
         # Atualizar bolhas existentes
@@ -119,68 +125,79 @@ class AINetworkEffect(QWidget):
             if bubble['y'] < self.height() / 2:
                 bubble['opacity'] = max(0, bubble['opacity'] - 5)
         
-        self.update()
+        self.roll_glitches()
+    
+    def roll_glitches(self):
+        # Cores das bolhas e glitches sorteados no passo: repintar o mesmo quadro não os muda
+        for bubble in self.thought_bubbles:
+            bubble['color_idx'] = self.cosmetic.randint(0, len(self.colors)-1)
+        self.glitch_offsets = []
+        for i in range(3):
+            offset_x = self.cosmetic.uniform(-2, 2) if self.cosmetic.random() < 0.1 else 0
+            offset_y = self.cosmetic.uniform(-2, 2) if self.cosmetic.random() < 0.1 else 0
+            self.glitch_offsets.append((offset_x, offset_y))
     
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
-        # Desenhar conexões
+        dpr = self.devicePixelRatioF()
+        
+        # Desenhar conexões em lotes: primeiro as linhas apagadas, depois os
+        # brilhos das partículas de energia por cima delas
+        particles = PrimitiveBatch()
+        lines = PrimitiveBatch()
         for conn in self.connections:
             start = conn['start']
             end = conn['end']
             
-            # Gradiente para a linha
             if conn['active']:
-                color = self.colors[start['color_idx']]
+                # Conexão ativa: só a partícula de energia aparece (a linha sai sem caneta)
+                color = QColor(self.colors[start['color_idx']])
                 color.setAlpha(100)
-                pen = QPen(color)
-                pen.setWidth(2)
-                painter.setPen(pen)
                 
-                # Partícula de energia
-                if conn['active']:
-                    particle_x = start['x'] + (end['x'] - start['x']) * conn['energy_particle']
-                    particle_y = start['y'] + (end['y'] - start['y']) * conn['energy_particle']
-                    
-                    radial = QRadialGradient(particle_x, particle_y, 10)
-                    glow_color = self.colors[start['color_idx']]
-                    radial.setColorAt(0, QColor(glow_color.red(), glow_color.green(), glow_color.blue(), 150))
-                    radial.setColorAt(1, QColor(0, 0, 0, 0))
-                    painter.setBrush(radial)
-                    painter.setPen(Qt.NoPen)
-                    painter.drawEllipse(QPointF(particle_x, particle_y), 10, 10)
+                particle_x = start['x'] + (end['x'] - start['x']) * conn['energy_particle']
+                particle_y = start['y'] + (end['y'] - start['y']) * conn['energy_particle']
+                glow = glow_sprite(color.red(), color.green(), color.blue(), 150, 10, dpr)
+                particles.add_sprite(glow, particle_x, particle_y)
             else:
-                painter.setPen(QPen(QColor(100, 100, 100, 50)))
-            
-            painter.drawLine(start['x'], start['y'], end['x'], end['y'])
-        
-        # Desenhar nós
+                # Pontas truncadas para inteiros, como fazia drawLine(x1, y1, x2, y2)
+                lines.add_line(int(start['x']), int(start['y']), int(end['x']), int(end['y']),
+                               (100, 100, 100, 50))
+        lines.flush(painter)
+        particles.flush(painter)
+        
+        # Desenhar nós: todos os brilhos e depois todos os núcleos. Nó a nó, o
+        # brilho de um vizinho sobreposto cobria o núcleo; em lote os núcleos
+        # ficam sempre por cima (aproximação aceita)
+        glows = PrimitiveBatch()
+        cores = PrimitiveBatch()
         for node in self.nodes:
-            # Brilho do nó
+            # Brilho do nó (sprite de raio 30, escalado para o dobro do tamanho)
             glow = abs(sin(node['pulse']))
             color = self.colors[node['color_idx']]
-            radial = QRadialGradient(node['x'], node['y'], node['size'] * 2)
-            radial.setColorAt(0, QColor(color.red(), color.green(), color.blue(), int(200 * glow)))
-            radial.setColorAt(1, QColor(0, 0, 0, 0))
-            painter.setBrush(radial)
-            painter.setPen(Qt.NoPen)
-            painter.drawEllipse(QPointF(node['x'], node['y']), node['size'] * 2, node['size'] * 2)
+            sprite = glow_sprite(color.red(), color.green(), color.blue(), 200, 30, dpr)
+            glows.add_sprite(sprite, node['x'], node['y'], scale=node['size'] * 2 / 30, opacity=glow)
             
             # Núcleo do nó
-            painter.setBrush(color)
-            painter.drawEllipse(QPointF(node['x'], node['y']), node['size'], node['size'])
+            cores.add_ellipse(node['x'], node['y'], node['size'], node['size'], color.getRgb())
+        glows.flush(painter)
+        cores.flush(painter)
+        
+        # Os círculos centrais continuam preenchidos com o pincel do último núcleo
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(color))
         
         # Desenhar bolhas de pensamento
-        font = QFont("Arial", 10)
+        font = text_cache.font("Arial", 10)
         painter.setFont(font)
         
         for bubble in self.thought_bubbles:
-            color = self.colors[random.randint(0, len(self.colors)-1)]
+            color = QColor(self.colors[bubble['color_idx']])
             color.setAlpha(bubble['opacity'])
             painter.setPen(color)
-            painter.drawText(QRectF(bubble['x']-50, bubble['y']-10, 100, 20),
-                           Qt.AlignCenter, bubble['text'])
+            text_cache.draw(painter, QRectF(bubble['x']-50, bubble['y']-10, 100, 20),
+                            Qt.AlignCenter, bubble['text'])
         
         # Interface central
         center_x = self.width() / 2
@@ -196,15 +213,13 @@ class AINetworkEffect(QWidget):
             painter.drawEllipse(QPointF(center_x, center_y), radius + i * 20, radius + i * 20)
         
         # Logo central
-        font = QFont("Arial", 40, QFont.Bold)
+        font = text_cache.font("Arial", 40, QFont.Bold)
         painter.setFont(font)
         text = "NEURAL-AI"
         
         # Efeito de glitch no texto
-        for i in range(3):
-            offset_x = random.uniform(-2, 2) if random.random() < 0.1 else 0
-            offset_y = random.uniform(-2, 2) if random.random() < 0.1 else 0
-            color = self.colors[i % len(self.colors)]
+        for i, (offset_x, offset_y) in enumerate(self.glitch_offsets):
+            color = QColor(self.colors[i % len(self.colors)])
             color.setAlpha(150)
             painter.setPen(color)
             painter.drawText(QRectF(center_x-200+offset_x, center_y-30+offset_y, 400, 60),
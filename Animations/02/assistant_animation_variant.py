@@ -1,11 +1,14 @@
+import os
 import sys
 import math
-from PySide6.QtWidgets import QApplication, QWidget
+from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QPainter, QPen, QColor, QFont, QRadialGradient, QPainterPath
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF
+from PySide6.QtCore import Qt, QPointF, QRectF
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from quantumui import AnimatedWidget, text_cache
 
 
-class VariantAssistantWidget(QWidget):
+class VariantAssistantWidget(AnimatedWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Assistente Criativo")
@@ -20,16 +23,13 @@ class VariantAssistantWidget(QWidget):
         self.hue = 0
 
         # Configurar timer para animação a aproximadamente 60 FPS
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(16)
+        self.start_animation(16)
 
     def update_animation(self):
         self.angle = (self.angle + 2) % 360
         self.pulse += 0.1
         self.energy = 0.5 + 0.3 * math.sin(self.pulse)
         self.hue = (self.hue + 1) % 360
-        self.update()
 
     def draw_spinning_circles(self, painter, center_x, center_y):
         num_circles = 4
@@ -65,7 +65,7 @@ class VariantAssistantWidget(QWidget):
         self.draw_spinning_circles(painter, center_x, center_y)
 
         # Desenhar texto central com efeito de brilho
-        font = QFont("Arial", 32, QFont.Bold)
+        font = text_cache.font("Arial", 32, QFont.Bold)
         painter.setFont(font)
         text = "Assistente Criativo"
         text_rect = QRectF(center_x - 200, center_y - 40, 400, 80)
@@ -81,11 +81,11 @@ class VariantAssistantWidget(QWidget):
 
         # Desenhar indicação de status usando energia dinâmica
         status = "Ativo" if self.energy > 0.7 else "Inativo"
-        font_status = QFont("Arial", 14)
+        font_status = text_cache.font("Arial", 14)
         painter.setFont(font_status)
         status_rect = QRectF(center_x - 50, center_y + 50, 100, 30)
         painter.setPen(QPen(QColor(200, 200, 200)))
-        painter.drawText(status_rect, Qt.AlignCenter, status)
+        text_cache.draw(painter, status_rect, Qt.AlignCenter, status)
 
     def mousePressEvent(self, event):
         self.old_pos = event.globalPosition().toPoint()
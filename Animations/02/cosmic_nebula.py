@@ -1,11 +1,20 @@
+import os
 import sys
-from PySide6.QtWidgets import QApplication, QWidget
+from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QPainter, QPen, QColor, QFont, QRadialGradient, QPainterPath
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF
+from PySide6.QtCore import Qt, QPointF, QRectF
 from math import cos, sin, pi, exp, sqrt
-import random
+import numpy as np
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from quantumui import AnimatedWidget, ParticleSystem, PrimitiveBatch, angular_basis, polar_polygon, text_cache
 
-class CosmicNebula(QWidget):
+class CosmicNebula(AnimatedWidget):
+    PARTICLE_COLORS = [
+        (180, 100, 255, 150),  # roxo
+        (100, 150, 255, 150),  # azul
+        (255, 100, 200, 150),  # rosa
+    ]
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Nebulosa Cósmica")
@@ -21,75 +30,55 @@ class CosmicNebula(QWidget):
         self.is_active = True
         
         # Timer para animação
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(16)  # 60 FPS
+        self.start_animation(16)  # 60 FPS
     
     def generate_stars(self, num_stars):
-        stars = []
-        for _ in range(num_stars):
-            stars.append({
-                'x': random.randint(0, self.width()),
-                'y': random.randint(0, self.height()),
-                'brightness': random.random(),
-                'pulse_offset': random.uniform(0, 2 * pi)
-            })
+        stars = ParticleSystem(num_stars, extra=('brightness',), rng=self.streams.numpy())
+        stars.x = stars.integers(0, self.width()).astype(float)
+        stars.y = stars.integers(0, self.height()).astype(float)
+        stars.brightness = stars.uniform(0, 1)
+        stars.phase = stars.uniform(0, 2 * pi)
         return stars
     
     def generate_particles(self, num_particles):
-        particles = []
-        for _ in range(num_particles):
-            particles.append({
-                'x': self.width() / 2,
-                'y': self.height() / 2,
-                'angle': random.uniform(0, 2 * pi),
-                'speed': random.uniform(0.5, 2),
-                'size': random.uniform(2, 6),
-                'color': random.choice(['purple', 'blue', 'pink'])
-            })
+        particles = ParticleSystem(num_particles, extra=('angle', 'speed'), rng=self.streams.numpy())
+        particles.x[:] = self.width() / 2
+        particles.y[:] = self.height() / 2
+        particles.angle = particles.uniform(0, 2 * pi)
+        particles.speed = particles.uniform(0.5, 2)
+        particles.size = particles.uniform(2, 6)
+        # Índice em PARTICLE_COLORS (roxo, azul, rosa)
+        particles.color = particles.integers(0, len(self.PARTICLE_COLORS) - 1)
         return particles
     
     def update_animation(self):
-        self.time += 0.016  # Incremento baseado no FPS
+        self.time += self.dt  # Incremento baseado no passo do relógio
         self.nebula_pulse = (self.nebula_pulse + 0.02) % (2 * pi)
         
         # Atualizar partículas cósmicas
-        for particle in self.cosmic_particles:
-            # Movimento em espiral
-            radius = self.time * particle['speed'] * 20
-            angle = particle['angle'] + self.time * particle['speed']
-            
-            particle['x'] = self.width()/2 + radius * cos(angle)
-            particle['y'] = self.height()/2 + radius * sin(angle)
-            
-            # Reiniciar partícula quando sair da tela
-            if radius > sqrt(self.width()**2 + self.height()**2):
-                particle['x'] = self.width() / 2
-                particle['y'] = self.height() / 2
-                particle['angle'] = random.uniform(0, 2 * pi)
+        particles = self.cosmic_particles
+        # Movimento em espiral
+        radius = self.time * particles.speed * 20
+        angle = particles.angle + self.time * particles.speed
         
-        self.update()
+        particles.x = self.width()/2 + radius * np.cos(angle)
+        particles.y = self.height()/2 + radius * np.sin(angle)
+        
+        # Reiniciar partículas quando saírem da tela
+        particles.respawn(radius > sqrt(self.width()**2 + self.height()**2),
+                          x=self.width() / 2, y=self.height() / 2,
+                          angle=lambda n: particles.uniform(0, 2 * pi, n))
     
     def draw_nebula_cloud(self, painter, center_x, center_y):
         # Criar várias nuvens nebulosas sobrepostas
+        angles, _, _ = angular_basis(36, endpoint=False)
         for i in range(5):
-            path = QPainterPath()
             radius = 200 + i * 30
-            points = []
-            
-            # Gerar pontos para forma orgânica
-            for angle in range(0, 360, 10):
-                rad = angle * pi / 180
-                r = radius + 50 * sin(self.nebula_pulse + i + rad * 2)
-                x = center_x + r * cos(rad)
-                y = center_y + r * sin(rad)
-                points.append(QPointF(x, y))
             
-            # Criar caminho suave
-            path.moveTo(points[0])
-            for j in range(len(points)):
-                next_j = (j + 1) % len(points)
-                path.quadTo(points[j], points[next_j])
+            # Gerar pontos para forma orgânica (um a cada 10 graus)
+            r = radius + 50 * np.sin(self.nebula_pulse + i + angles * 2)
+            path = QPainterPath()
+            path.addPolygon(polar_polygon(center_x, center_y, r, 36, endpoint=False))
             
             # Gradiente nebuloso
             gradient = QRadialGradient(center_x, center_y, radius)
@@ -113,11 +102,12 @@ class CosmicNebula(QWidget):
         painter.fillRect(0, 0, self.width(), self.height(), QColor(0, 0, 20, 255))
         
         # Desenhar estrelas
-        for star in self.star_positions:
-            brightness = abs(sin(self.time * 2 + star['pulse_offset'])) * star['brightness']
-            color = QColor(255, 255, 255, int(100 + 155 * brightness))
-            painter.setPen(color)
-            painter.drawPoint(QPointF(star['x'], star['y']))
+        stars = self.star_positions
+        brightness = np.abs(np.sin(self.time * 2 + stars.phase)) * stars.brightness
+        alphas = (100 + 155 * brightness).astype(int)
+        batch = PrimitiveBatch()
+        batch.add_points(stars.x, stars.y, (255, 255, 255, alphas))
+        batch.flush(painter)
         
         # Centro da tela
         center_x = self.width() / 2
@@ -127,18 +117,17 @@ class CosmicNebula(QWidget):
         self.draw_nebula_cloud(painter, center_x, center_y)
         
         # Desenhar partículas cósmicas
-        for particle in self.cosmic_particles:
-            if particle['color'] == 'purple':
-                color = QColor(180, 100, 255, 150)
-            elif particle['color'] == 'blue':
-                color = QColor(100, 150, 255, 150)
-            else:
-                color = QColor(255, 100, 200, 150)
-            
-            painter.setPen(Qt.NoPen)
-            painter.setBrush(color)
-            size = particle['size'] * (1 + 0.3 * sin(self.nebula_pulse))
-            painter.drawEllipse(QPointF(particle['x'], particle['y']), size, size)
+        particles = self.cosmic_particles
+        sizes = particles.size * (1 + 0.3 * sin(self.nebula_pulse))
+        batch = PrimitiveBatch()
+        for x, y, size, color in zip(particles.x.tolist(), particles.y.tolist(),
+                                     sizes.tolist(), particles.color.tolist()):
+            batch.add_ellipse(x, y, size, size, self.PARTICLE_COLORS[color])
+        batch.flush(painter)
+        
+        # Os círculos concêntricos continuam preenchidos com a cor da última partícula
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(*self.PARTICLE_COLORS[color]))
         
         # Círculos concêntricos pulsantes
         for i in range(3):
@@ -149,7 +138,7 @@ class CosmicNebula(QWidget):
             painter.drawEllipse(QPointF(center_x, center_y), radius, radius)
         
         # Texto Gysin-IA com efeito cósmico
-        font = QFont("Arial", 40, QFont.Bold)
+        font = text_cache.font("Arial", 40, QFont.Bold)
         painter.setFont(font)
         
         # Efeito de brilho estelar
@@ -168,11 +157,11 @@ class CosmicNebula(QWidget):
         
         # Status cósmico
         status = "EXPLORANDO O COSMOS..." if self.is_active else "NEBULOSA ESTÁVEL"
-        font.setPointSize(12)
+        font = text_cache.font("Arial", 12, QFont.Bold)
         painter.setFont(font)
         y_offset = 5 * sin(self.nebula_pulse * 2)
         painter.setPen(QColor(180, 100, 255, 200))
-        painter.drawText(QRectF(center_x-200, center_y+40+y_offset, 400, 30),
+        text_cache.draw(painter, QRectF(center_x-200, center_y+40+y_offset, 400, 30),
                         Qt.AlignCenter, status)
 
     def mousePressEvent(self, event):
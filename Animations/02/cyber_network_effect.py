@@ -1,13 +1,18 @@
+import os
 import sys
-from PySide6.QtWidgets import QApplication, QWidget
+from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QPainter, QPen, QColor, QFont, QRadialGradient
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF
+from PySide6.QtCore import Qt, QPointF, QRectF
 from math import cos, sin, pi, exp, sqrt
-import random
 import string
+import numpy as np
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from quantumui import AnimatedWidget, NeighborList, ParticleSystem, PrimitiveBatch, text_cache
 
-class CyberNetworkEffect(QWidget):
-    def __init__(self):
+class CyberNetworkEffect(AnimatedWidget):
+    LINK_DISTANCE = 200  # Nós mais próximos que isso ficam conectados
+    
+    def __init__(self, node_count=30):
         super().__init__()
         self.setWindowTitle("Cyber Network")
         self.showFullScreen()
@@ -15,59 +20,46 @@ class CyberNetworkEffect(QWidget):
         self.setWindowFlags(Qt.FramelessWindowHint)
         
         # Nós da rede
-        self.nodes = []
-        self.connections = []
+        self.nodes = ParticleSystem(node_count, rng=self.streams.numpy())
+        self.connections = NeighborList(self.LINK_DISTANCE, skin=20)
         self.data_packets = []
         
         # Estados e animação
         self.time = 0
         self.pulse = 0
         self.is_listening = False
+        self.roll_glitches()
         
         # Inicializar rede
         self.initialize_network()
         
         # Timer para animação
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(30)  # 30ms para animação mais suave
+        self.start_animation(30)  # 30ms para animação mais suave
     
     def initialize_network(self):
         # Criar nós da rede
-        num_nodes = 30
-        for _ in range(num_nodes):
-            node = {
-                'x': random.randint(100, self.width() - 100),
-                'y': random.randint(100, self.height() - 100),
-                'size': random.uniform(5, 15),
-                'pulse': random.uniform(0, 2 * pi),
-                'velocity_x': random.uniform(-0.5, 0.5),
-                'velocity_y': random.uniform(-0.5, 0.5)
-            }
-            self.nodes.append(node)
+        nodes = self.nodes
+        nodes.x = nodes.integers(100, self.width() - 100).astype(float)
+        nodes.y = nodes.integers(100, self.height() - 100).astype(float)
+        nodes.size = nodes.uniform(5, 15)
+        nodes.phase = nodes.uniform(0, 2 * pi)
+        nodes.vx = nodes.uniform(-0.5, 0.5)
+        nodes.vy = nodes.uniform(-0.5, 0.5)
         
         # Criar conexões entre nós próximos
-        for i in range(len(self.nodes)):
-            for j in range(i + 1, len(self.nodes)):
-                if self.calculate_distance(self.nodes[i], self.nodes[j]) < 200:
-                    self.connections.append((i, j))
-    
-    def calculate_distance(self, node1, node2):
-        return sqrt((node1['x'] - node2['x'])**2 + (node1['y'] - node2['y'])**2)
+        self.connections.update(nodes.x, nodes.y)
     
     def create_data_packet(self):
-        if len(self.connections) > 0 and random.random() < 0.1:
-            connection = random.choice(self.connections)
-            start_node = self.nodes[connection[0]]
-            end_node = self.nodes[connection[1]]
+        if len(self.connections) > 0 and self.random.random() < 0.1:
+            start, end = self.connections.pair(self.random.randrange(len(self.connections)))
             
             packet = {
-                'x': start_node['x'],
-                'y': start_node['y'],
-                'target_x': end_node['x'],
-                'target_y': end_node['y'],
+                'x': float(self.nodes.x[start]),
+                'y': float(self.nodes.y[start]),
+                'target_x': float(self.nodes.x[end]),
+                'target_y': float(self.nodes.y[end]),
                 'progress': 0,
-                'color': QColor(0, random.randint(150, 255), random.randint(150, 255), 200)
+                'color': QColor(0, self.random.randint(150, 255), self.random.randint(150, 255), 200)
             }
             self.data_packets.append(packet)
     
@@ -76,16 +68,14 @@ class CyberNetworkEffect(QWidget):
         self.pulse = (self.pulse + 0.05) % (2 * pi)
         
         # Atualizar posição dos nós
-        for node in self.nodes:
-            node['x'] += node['velocity_x']
-            node['y'] += node['velocity_y']
-            node['pulse'] = (node['pulse'] + 0.1) % (2 * pi)
-            
-            # Inverter direção ao atingir bordas
-            if node['x'] < 100 or node['x'] > self.width() - 100:
-                node['velocity_x'] *= -1
-            if node['y'] < 100 or node['y'] > self.height() - 100:
-                node['velocity_y'] *= -1
+        self.nodes.step()
+        self.nodes.phase = (self.nodes.phase + 0.1) % (2 * pi)
+        
+        # Inverter direção ao atingir bordas
+        self.nodes.bounce(100, 100, self.width() - 100, self.height() - 100)
+        
+        # Conexões se refazem conforme os nós se aproximam ou se afastam
+        self.connections.update(self.nodes.x, self.nodes.y)
         
         # Criar novos pacotes de dados
         self.create_data_packet()
@@ -96,28 +86,39 @@ class CyberNetworkEffect(QWidget):
             if packet['progress'] >= 1:
                 self.data_packets.remove(packet)
         
-        self.update()
+        self.roll_glitches()
+    
+    def roll_glitches(self):
+        # Glitches sorteados no passo: repintar o mesmo quadro não os muda
+        self.glitch_offsets = []
+        for i in range(5):
+            offset_x = self.cosmetic.uniform(-2, 2) if self.cosmetic.random() < 0.1 else 0
+            offset_y = self.cosmetic.uniform(-2, 2) if self.cosmetic.random() < 0.1 else 0
+            self.glitch_offsets.append((offset_x, offset_y))
     
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
         # Fundo escuro semi-transparente
+        # A janela é translúcida e chega limpa: copiar a cor dispensa a mistura
+        painter.setCompositionMode(QPainter.CompositionMode_Source)
         painter.fillRect(0, 0, self.width(), self.height(), QColor(0, 0, 20, 230))
+        painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
         
         # Desenhar conexões
-        for conn in self.connections:
-            node1 = self.nodes[conn[0]]
-            node2 = self.nodes[conn[1]]
+        if len(self.connections):
+            first, second = self.connections.first, self.connections.second
+            x1, y1 = self.nodes.x[first], self.nodes.y[first]
+            x2, y2 = self.nodes.x[second], self.nodes.y[second]
             
             # Calcular opacidade baseada na distância
-            distance = self.calculate_distance(node1, node2)
-            opacity = int(255 * (1 - distance/300))
-            if opacity > 0:
-                pen = QPen(QColor(0, 150, 255, opacity))
-                pen.setWidth(1)
-                painter.setPen(pen)
-                painter.drawLine(node1['x'], node1['y'], node2['x'], node2['y'])
+            opacities = (255 * (1 - self.connections.distance / 300)).astype(int)
+            visible = opacities > 0
+            batch = PrimitiveBatch()
+            batch.add_lines(x1[visible], y1[visible], x2[visible], y2[visible],
+                            (0, 150, 255, opacities[visible]))
+            batch.flush(painter)
         
         # Desenhar pacotes de dados
         for packet in self.data_packets:
@@ -129,22 +130,20 @@ class CyberNetworkEffect(QWidget):
             painter.drawEllipse(QPointF(x, y), 4, 4)
         
         # Desenhar nós
-        for node in self.nodes:
-            # Efeito de pulso
-            glow = abs(sin(node['pulse']))
-            size = node['size'] * (1 + 0.2 * glow)
-            
+        # Efeito de pulso
+        sizes = self.nodes.size * (1 + 0.2 * np.abs(np.sin(self.nodes.phase)))
+        for x, y, size in zip(self.nodes.x.tolist(), self.nodes.y.tolist(), sizes.tolist()):
             # Gradiente para cada nó
-            gradient = QRadialGradient(node['x'], node['y'], size * 2)
+            gradient = QRadialGradient(x, y, size * 2)
             gradient.setColorAt(0, QColor(0, 200, 255, 150))
             gradient.setColorAt(1, QColor(0, 100, 255, 0))
             
             painter.setPen(Qt.NoPen)
             painter.setBrush(gradient)
-            painter.drawEllipse(QPointF(node['x'], node['y']), size * 2, size * 2)
+            painter.drawEllipse(QPointF(x, y), size * 2, size * 2)
             
             painter.setBrush(QColor(0, 220, 255))
-            painter.drawEllipse(QPointF(node['x'], node['y']), size, size)
+            painter.drawEllipse(QPointF(x, y), size, size)
         
         # Interface central
         center_x = self.width() / 2
@@ -162,14 +161,11 @@ class CyberNetworkEffect(QWidget):
             painter.drawEllipse(QPointF(center_x, center_y), radius, radius)
         
         # Texto Gysin-IA com efeito cyber
-        font = QFont("Courier New", 40, QFont.Bold)
+        font = text_cache.font("Courier New", 40, QFont.Bold)
         painter.setFont(font)
         
         # Efeito de glitch digital
-        for i in range(5):
-            offset_x = random.uniform(-2, 2) if random.random() < 0.1 else 0
-            offset_y = random.uniform(-2, 2) if random.random() < 0.1 else 0
-            
+        for i, (offset_x, offset_y) in enumerate(self.glitch_offsets):
             opacity = int(200 + 55 * sin(self.pulse + i))
             color = QColor(0, 200, 255, opacity)
             
@@ -179,7 +175,7 @@ class CyberNetworkEffect(QWidget):
         
         # Status com efeito cyber
         status = "NETWORK SCAN..." if self.is_listening else "ANALYZING DATA..."
-        font.setPointSize(12)
+        font = text_cache.font("Courier New", 12, QFont.Bold)
         painter.setFont(font)
         
         for i, char in enumerate(status):
@@ -1,11 +1,13 @@
+import os
 import sys
-from PySide6.QtWidgets import QApplication, QWidget
-from PySide6.QtGui import QPainter, QPen, QColor, QFont, QRadialGradient
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF
+from PySide6.QtWidgets import QApplication
+from PySide6.QtGui import QPainter, QPen, QColor, QRadialGradient
+from PySide6.QtCore import Qt, QPointF, QRectF
 from math import cos, sin, pi, sqrt, atan2
-import random
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from quantumui import AnimatedWidget, text_cache
 
-class DigitalFaceWidget(QWidget):
+class DigitalFaceWidget(AnimatedWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Digital Face")
@@ -29,9 +31,7 @@ class DigitalFaceWidget(QWidget):
         self.is_blinking = False
         
         # Configurar timer para animação
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(30)
+        self.start_animation(30)
         
     def update_animation(self):
         self.angle = (self.angle + 2) % 360
@@ -60,7 +60,7 @@ class DigitalFaceWidget(QWidget):
         
         # Gerenciar piscada
         if not self.is_blinking:
-            if random.random() < 0.01:  # 1% de chance de piscar
+            if self.cosmetic.random() < 0.01:  # 1% de chance de piscar
                 self.is_blinking = True
                 self.blink_timer = 0
         else:
@@ -68,8 +68,6 @@ class DigitalFaceWidget(QWidget):
             if self.blink_timer > 10:  # Duração da piscada
                 self.is_blinking = False
         
-        self.update()
-        
     def draw_tech_circle(self, painter, radius, segments):
         for i in range(segments):
             angle = (i * 360 / segments + self.angle) * pi / 180
@@ -161,7 +159,7 @@ class DigitalFaceWidget(QWidget):
             painter.drawLine(points[i], points[i+1])
         
         # Detalhes técnicos
-        detail_font = QFont("Arial", 8)
+        detail_font = text_cache.font("Arial", 8)
         painter.setFont(detail_font)
         for i in range(8):
             angle = (i * 45 + self.angle) * pi / 180
@@ -1,12 +1,15 @@
+import os
 import sys
-from PySide6.QtWidgets import QApplication, QWidget
+from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QPainter, QPen, QColor, QFont, QRadialGradient
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF
+from PySide6.QtCore import Qt, QPointF, QRectF
 from math import cos, sin, pi, exp
-import random
 import string
+import numpy as np
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from quantumui import AnimatedWidget, glitch_text, glyph_atlas, text_cache
 
-class FullMatrixEffect(QWidget):
+class FullMatrixEffect(AnimatedWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Matrix Effect")
@@ -25,13 +28,16 @@ class FullMatrixEffect(QWidget):
         self.pulse = 0
         self.is_listening = False
         
+        # Sorteios em bloco para os laços por coluna e por glifo
+        self.sim_pool = self.streams.pool()
+        self.cosmetic_pool = self.streams.pool('cosmetic')
+        
         # Inicializar streams
         self.initialize_streams()
+        self.roll_glitches()
         
         # Timer para animação
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(50)  # Velocidade da animação
+        self.start_animation(50)  # Velocidade da animação
     
     def initialize_streams(self):
         spacing = 25  # Espaçamento entre colunas
@@ -40,75 +46,93 @@ class FullMatrixEffect(QWidget):
         for i in range(num_columns):
             stream = {
                 'x': i * spacing,
-                'y': random.randint(-1000, 0),
-                'speed': random.uniform(3, 10),
-                'length': random.randint(15, 30),
-                'chars': self.generate_chars(random.randint(15, 30)),
-                'brightness': random.uniform(0.5, 1.0)
+                'y': self.random.randint(-1000, 0),
+                'speed': self.random.uniform(3, 10),
+                'length': self.random.randint(15, 30),
+                'chars': self.generate_chars(self.random.randint(15, 30)),
+                'brightness': self.random.uniform(0.5, 1.0)
             }
             self.matrix_streams.append(stream)
     
     def generate_chars(self, length):
-        return [random.choice(self.all_chars) for _ in range(length)]
+        return self.random.choices(self.all_chars, k=length)
     
     def update_animation(self):
         self.time += 0.1
         self.pulse = (self.pulse + 0.05) % (2 * pi)
         
         # Atualizar streams
-        for stream in self.matrix_streams:
+        changes = self.sim_pool.random(len(self.matrix_streams)) < 0.05
+        for stream, change in zip(self.matrix_streams, changes.tolist()):
             stream['y'] += stream['speed']
             
             # Resetar stream quando sair da tela
             if stream['y'] - len(stream['chars']) * 20 > self.height():
-                stream['y'] = random.randint(-500, 0)
+                stream['y'] = self.random.randint(-500, 0)
                 stream['chars'] = self.generate_chars(len(stream['chars']))
-                stream['speed'] = random.uniform(3, 10)
-                stream['brightness'] = random.uniform(0.5, 1.0)
+                stream['speed'] = self.random.uniform(3, 10)
+                stream['brightness'] = self.random.uniform(0.5, 1.0)
             
             # Chance de mudar caracteres aleatoriamente
-            if random.random() < 0.05:
-                idx = random.randint(0, len(stream['chars']) - 1)
-                stream['chars'][idx] = random.choice(self.all_chars)
+            if change:
+                idx = self.random.randint(0, len(stream['chars']) - 1)
+                stream['chars'][idx] = self.random.choice(self.all_chars)
         
-        self.update()
+        self.roll_glitches()
+    
+    def roll_glitches(self):
+        # Brilhos e glitches sorteados no passo: repintar o mesmo quadro não os muda
+        # Um sorteio por glifo de todas as colunas de uma vez (1% de chance de brilho)
+        lengths = [len(stream['chars']) for stream in self.matrix_streams]
+        starts = np.cumsum([0] + lengths[:-1])
+        hits = np.flatnonzero(self.cosmetic_pool.random(sum(lengths)) < 0.01)
+        columns = np.searchsorted(starts, hits, side='right') - 1
+        for stream in self.matrix_streams:
+            stream['flashes'] = []
+        for column, i in zip(columns.tolist(), (hits - starts[columns]).tolist()):
+            if i:  # O primeiro glifo já é o mais brilhante
+                self.matrix_streams[column]['flashes'].append(i)
+        self.glitch_offsets = []
+        for i in range(5):
+            if self.cosmetic.random() < 0.1:  # Chance de glitch
+                offset_x = self.cosmetic.uniform(-2, 2)
+                offset_y = self.cosmetic.uniform(-2, 2)
+            else:
+                offset_x = offset_y = 0
+            self.glitch_offsets.append((offset_x, offset_y))
+        status = "SCANNING..." if self.is_listening else "ANALYZING..."
+        self.status_text = glitch_text(status, self.cosmetic, 0.05, self.all_chars)  # Chance de glitch
     
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
         # Fundo preto semi-transparente
+        # A janela é translúcida e chega limpa: copiar a cor dispensa a mistura
+        painter.setCompositionMode(QPainter.CompositionMode_Source)
         painter.fillRect(0, 0, self.width(), self.height(), QColor(0, 0, 0, 200))
+        painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
         
-        # Desenhar streams matrix
-        font = QFont("Courier New", 14)
-        painter.setFont(font)
+        # Desenhar streams matrix (colunas e glifos copiados do atlas)
+        atlas = glyph_atlas("Courier New", 14, self.all_chars, self.devicePixelRatioF())
         
         for stream in self.matrix_streams:
             x = stream['x']
             y = stream['y']
             chars = stream['chars']
             brightness = stream['brightness']
+            highlight = (200, 255, 200, int(255 * brightness))
             
-            for i, char in enumerate(chars):
-                # Calcular opacidade baseada na posição
+            # Primeiro caractere mais brilhante, os demais esmaecem pela posição
+            colors = [highlight]
+            for i in range(1, len(chars)):
                 fade = 1 - (i / len(chars))
-                glow = abs(sin(self.pulse + i * 0.1))
-                
-                # Primeiro caractere mais brilhante
-                if i == 0:
-                    color = QColor(200, 255, 200, int(255 * brightness))
-                else:
-                    green = int(180 * fade * brightness)
-                    opacity = int(255 * fade * brightness)
-                    color = QColor(0, green, 0, opacity)
-                
-                # Adicionar efeito de brilho
-                if random.random() < 0.01:
-                    color = QColor(200, 255, 200, int(255 * brightness))
-                
-                painter.setPen(color)
-                painter.drawText(QPointF(x, y - i * 20), char)
+                colors.append((0, int(180 * fade * brightness), 0, int(255 * fade * brightness)))
+            
+            # Adicionar efeito de brilho: o glifo troca de cor na própria coluna
+            for i in stream['flashes']:
+                colors[i] = highlight
+            atlas.draw_column(painter, x, y, chars, colors, -20)
         
         # Desenhar interface central
         center_x = self.width() / 2
@@ -124,31 +148,22 @@ class FullMatrixEffect(QWidget):
             painter.drawEllipse(QPointF(center_x, center_y), radius + i * 20, radius + i * 20)
         
         # Texto Gysin-IA com efeito glitch
-        font = QFont("Courier New", 40, QFont.Bold)
+        font = text_cache.font("Courier New", 40, QFont.Bold)
         painter.setFont(font)
         
         # Efeito de glitch no texto
-        for i in range(5):
-            if random.random() < 0.1:  # Chance de glitch
-                offset_x = random.uniform(-2, 2)
-                offset_y = random.uniform(-2, 2)
-            else:
-                offset_x = offset_y = 0
-            
+        for i, (offset_x, offset_y) in enumerate(self.glitch_offsets):
             opacity = int(200 + 55 * sin(self.pulse + i))
             painter.setPen(QColor(0, 255, 0, opacity))
             painter.drawText(QRectF(center_x-150+offset_x, center_y-25+offset_y, 300, 50),
                            Qt.AlignCenter, "Gysin-IA")
         
         # Status com efeito matrix
-        status = "SCANNING..." if self.is_listening else "ANALYZING..."
-        font.setPointSize(12)
+        status = self.status_text
+        font = text_cache.font("Courier New", 12, QFont.Bold)
         painter.setFont(font)
         
         for i, char in enumerate(status):
-            if random.random() < 0.05:  # Chance de glitch
-                char = random.choice(self.all_chars)
-            
             x = center_x - len(status)*5 + i*10
             y = center_y + 50
             
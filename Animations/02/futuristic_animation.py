@@ -1,10 +1,14 @@
+import os
 import sys
-from PySide6.QtWidgets import QApplication, QWidget
+from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QPainter, QPen, QColor, QFont, QRadialGradient, QPainterPath
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF
+from PySide6.QtCore import Qt, QPointF, QRectF
 from math import cos, sin, pi, exp
+import numpy as np
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from quantumui import AnimatedWidget, PrimitiveBatch, angular_basis, polar_polygon, text_cache
 
-class AssistantWidget(QWidget):
+class AssistantWidget(AnimatedWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Assistente Virtual")
@@ -12,6 +16,9 @@ class AssistantWidget(QWidget):
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.setWindowFlags(Qt.FramelessWindowHint)
         
+        # Parâmetros de qualidade, do nível mais caro ao mais leve
+        self.quality.declare(wave_points=(180, 120, 72), glow_stride=(1, 2, 3), antialiasing=(True, True, False))
+        
         # Estados da animação
         self.is_listening = False
         self.is_speaking = True
@@ -24,9 +31,7 @@ class AssistantWidget(QWidget):
         self.particle_time = 0
         
         # Configurar timer
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(16)  # 60 FPS para animação mais suave
+        self.start_animation(16)  # 60 FPS para animação mais suave
     
     def update_animation(self):
         # Atualizar variáveis de animação
@@ -37,64 +42,49 @@ class AssistantWidget(QWidget):
         
         # Simular níveis de energia variáveis
         self.energy_level = 0.5 + 0.3 * sin(self.pulse)
-        self.update()
     
     def draw_energy_ring(self, painter, center_x, center_y, radius, num_particles):
-        for i in range(num_particles):
-            angle = (i * 360 / num_particles + self.ring_rotation) * pi / 180
-            
-            # Posição da partícula
-            x = center_x + radius * cos(angle)
-            y = center_y + radius * sin(angle)
+        index = np.arange(num_particles)
+        angles = (index * 360 / num_particles + self.ring_rotation) * pi / 180
+        
+        # Posição das partículas
+        xs = (center_x + radius * np.cos(angles)).tolist()
+        ys = (center_y + radius * np.sin(angles)).tolist()
+        
+        # Tamanho e opacidade variáveis
+        sizes = (4 + 2 * np.sin(self.pulse + index * 0.2)).tolist()
+        opacities = (100 + 100 * np.abs(np.sin(self.pulse + index * 0.1))).astype(int).tolist()
+        
+        # Desenhar partículas agrupadas por opacidade
+        batch = PrimitiveBatch()
+        for x, y, size, opacity in zip(xs, ys, sizes, opacities):
+            batch.add_ellipse(x, y, size, size, (180, 0, 255, opacity))
+        batch.flush(painter)
+        
+        # Conectar cada partícula com a anterior (cada linha tem seu próprio gradiente)
+        for i in range(1, num_particles):
+            prev_x, prev_y = xs[i - 1], ys[i - 1]
+            x, y, opacity = xs[i], ys[i], opacities[i]
             
-            # Tamanho e opacidade variáveis
-            size = 4 + 2 * sin(self.pulse + i * 0.2)
-            opacity = int(100 + 100 * abs(sin(self.pulse + i * 0.1)))
+            # Linha de energia
+            gradient = QRadialGradient(x, y, 20)
+            gradient.setColorAt(0, QColor(180, 0, 255, opacity))
+            gradient.setColorAt(1, QColor(180, 0, 255, 0))
             
-            # Desenhar partícula
-            painter.setPen(Qt.NoPen)
-            painter.setBrush(QColor(180, 0, 255, opacity))
-            painter.drawEllipse(QPointF(x, y), size, size)
-            
-            # Conectar com próxima partícula
-            if i > 0:
-                prev_angle = ((i-1) * 360 / num_particles + self.ring_rotation) * pi / 180
-                prev_x = center_x + radius * cos(prev_angle)
-                prev_y = center_y + radius * sin(prev_angle)
-                
-                # Linha de energia
-                gradient = QRadialGradient(x, y, 20)
-                gradient.setColorAt(0, QColor(180, 0, 255, opacity))
-                gradient.setColorAt(1, QColor(180, 0, 255, 0))
-                
-                pen = QPen()
-                pen.setBrush(gradient)
-                pen.setWidth(2)
-                painter.setPen(pen)
-                painter.drawLine(QPointF(prev_x, prev_y), QPointF(x, y))
+            pen = QPen()
+            pen.setBrush(gradient)
+            pen.setWidth(2)
+            painter.setPen(pen)
+            painter.drawLine(QPointF(prev_x, prev_y), QPointF(x, y))
     
     def draw_wave_circle(self, painter, center_x, center_y, base_radius):
-        num_points = 180
-        path = QPainterPath()
-        first_point = None
-        
-        for i in range(num_points + 1):
-            angle = (i * 360 / num_points) * pi / 180
-            # Raio variável baseado em várias ondas
-            radius = base_radius + 20 * sin(4 * angle + self.wave_time) * self.energy_level
-            radius += 10 * cos(8 * angle - self.wave_time * 2) * self.energy_level
-            
-            x = center_x + radius * cos(angle)
-            y = center_y + radius * sin(angle)
-            
-            if i == 0:
-                path.moveTo(x, y)
-                first_point = (x, y)
-            else:
-                path.lineTo(x, y)
+        num_points = self.quality['wave_points']
+        angles, _, _ = angular_basis(num_points)
         
-        if first_point:
-            path.lineTo(first_point[0], first_point[1])
+        # Raio variável baseado em várias ondas
+        radius = base_radius + 20 * np.sin(4 * angles + self.wave_time) * self.energy_level
+        radius += 10 * np.cos(8 * angles - self.wave_time * 2) * self.energy_level
+        polygon = polar_polygon(center_x, center_y, radius, num_points)
         
         # Desenhar com gradiente
         gradient = QRadialGradient(center_x, center_y, base_radius * 2)
@@ -103,21 +93,24 @@ class AssistantWidget(QWidget):
         
         painter.setPen(QPen(QColor(180, 0, 255, 100), 2))
         painter.setBrush(gradient)
-        painter.drawPath(path)
+        painter.drawPolygon(polygon)
+    
+    def paint_background(self, painter, width, height):
+        gradient = QRadialGradient(width / 2, height / 2, 400)
+        gradient.setColorAt(0, QColor(0, 0, 0, 0))
+        gradient.setColorAt(1, QColor(0, 255, 255, 80))
+        painter.fillRect(0, 0, width, height, gradient)
     
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.Antialiasing, self.quality['antialiasing'])
         
         # Centro da tela
         center_x = self.width() / 2
         center_y = self.height() / 2
         
         # Fundo com gradiente
-        gradient = QRadialGradient(center_x, center_y, 400)
-        gradient.setColorAt(0, QColor(0, 0, 0, 0))
-        gradient.setColorAt(1, QColor(0, 255, 255, 80))
-        painter.fillRect(0, 0, self.width(), self.height(), gradient)
+        self.draw_layer(painter, 'background', self.paint_background)
         
         # Círculos de energia pulsantes
         for i in range(3):
@@ -158,11 +151,11 @@ class AssistantWidget(QWidget):
                 prev_x, prev_y1, prev_y2 = x, y1, y2
         
         # Texto Gysin-IA com efeito de brilho
-        font = QFont("Arial", 40, QFont.Bold)
+        font = text_cache.font("Arial", 40, QFont.Bold)
         painter.setFont(font)
         
         # Sombra do texto
-        for i in range(10):
+        for i in range(0, 10, self.quality['glow_stride']):
             opacity = int((10 - i) * 15 * (0.7 + 0.3 * sin(self.pulse)))
             pen = QPen(QColor(180, 0, 255, opacity))
             painter.setPen(pen)
@@ -178,9 +171,9 @@ class AssistantWidget(QWidget):
         
         # Status do assistente
         status_text = "Ouvindo..." if self.is_listening else "Respondendo..."
-        font.setPointSize(12)
+        font = text_cache.font("Arial", 12, QFont.Bold)
         painter.setFont(font)
-        painter.drawText(QRectF(center_x - 100, center_y + 30, 200, 30),
+        text_cache.draw(painter, QRectF(center_x - 100, center_y + 30, 200, 30),
                         Qt.AlignCenter, status_text)
 
     def mousePressEvent(self, event):
@@ -1,10 +1,13 @@
+import os
 import sys
-from PySide6.QtWidgets import QApplication, QWidget
+from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QPainter, QPen, QColor, QFont, QRadialGradient, QLinearGradient
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF
+from PySide6.QtCore import Qt, QPointF, QRectF
 from math import cos, sin, pi, sqrt
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from quantumui import AnimatedWidget, text_cache
 
-class JarvisWidget(QWidget):
+class JarvisWidget(AnimatedWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Gysin-IA")
@@ -19,16 +22,13 @@ class JarvisWidget(QWidget):
         self.pulse_size = 0
         
         # Configurar timer para animação
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(30)  # Mais rápido para animação mais suave
+        self.start_animation(30)  # Mais rápido para animação mais suave
         
     def update_animation(self):
         self.angle = (self.angle + 3) % 360
         self.pulse_angle = (self.pulse_angle + 5) % 360
         self.pulse_size = 10 + sin(self.pulse_angle * pi / 180) * 5
         self.text_opacity = 155 + int(abs(sin(self.pulse_angle * pi / 180)) * 100)
-        self.update()
         
     def draw_tech_circle(self, painter, radius, segments):
         for i in range(segments):
@@ -105,7 +105,7 @@ class JarvisWidget(QWidget):
             painter.drawEllipse(QPointF(end_x, end_y), 3, 3)
         
         # Texto Gysin-IA com efeito futurista
-        font = QFont("Arial", 30, QFont.Bold)
+        font = text_cache.font("Arial", 30, QFont.Bold)
         painter.setFont(font)
         
         # Efeito de brilho dinâmico
@@ -124,7 +124,7 @@ class JarvisWidget(QWidget):
         painter.drawText(QRectF(-150, -20, 300, 40), Qt.AlignCenter, "Gysin-IA")
         
         # Pequenos detalhes técnicos
-        detail_font = QFont("Arial", 8)
+        detail_font = text_cache.font("Arial", 8)
         painter.setFont(detail_font)
         for i in range(8):
             angle = (i * 45 + self.angle) * pi / 180
@@ -1,10 +1,12 @@
+import os
 import sys
-from PySide6.QtWidgets import QApplication, QWidget
-from PySide6.QtGui import QPainter, QPainterPath, QColor
+from PySide6.QtWidgets import QApplication
+from PySide6.QtGui import QPainter, QColor
 from PySide6.QtCore import Qt
-from math import cos, sin, pi
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from quantumui import AnimatedWidget, path_cache
 
-class HeartWidget(QWidget):
+class HeartWidget(AnimatedWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Coração")
@@ -21,19 +23,9 @@ class HeartWidget(QWidget):
         # Centralizar o coração
         painter.translate(self.width() / 2, self.height() / 2)
         
-        # Desenhar o coração
-        path = QPainterPath()
+        # Desenhar o coração (caminho com um ponto por grau, construído uma vez)
         size = 100
-        
-        # Criar o caminho do coração
-        for t in range(0, 360):
-            t_rad = t * pi / 180
-            x = size * 16 * sin(t_rad) ** 3 / 16
-            y = -size * (13 * cos(t_rad) - 5 * cos(2 * t_rad) - 2 * cos(3 * t_rad) - cos(4 * t_rad)) / 16
-            if t == 0:
-                path.moveTo(x, y)
-            else:
-                path.lineTo(x, y)
+        path = path_cache.path('heart', size, 360, self.devicePixelRatioF())
         
         # Preencher o coração com vermelho
         painter.fillPath(path, QColor(255, 0, 0))
@@ -1,10 +1,13 @@
+import os
 import sys
-from PySide6.QtWidgets import QApplication, QWidget
-from PySide6.QtGui import QPainter, QPen, QColor, QFont, QRadialGradient, QPainterPath, QLinearGradient
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF
+from PySide6.QtWidgets import QApplication
+from PySide6.QtGui import QPainter, QPen, QColor, QFont, QRadialGradient, QPainterPath, QLinearGradient, QPolygonF, QTransform
+from PySide6.QtCore import Qt, QPointF, QRectF
 from math import cos, sin, pi, exp, sqrt, atan2
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from quantumui import AnimatedWidget
 
-class CrystalWidget(QWidget):
+class CrystalWidget(AnimatedWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Cristal Sombrio")
@@ -23,12 +26,12 @@ class CrystalWidget(QWidget):
         self.particle_time = 0
         self.shadow_intensity = 0
         self.crystal_vertices = self.generate_crystal_vertices()
+        # Caminho do cristal em coordenadas locais, montado uma vez por widget
+        self.crystal_path = self.build_crystal_path()
         self.energy_particles = []
         
         # Configurar timer
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(16)
+        self.start_animation(16)
 
     def generate_crystal_vertices(self):
         # Gera vértices para um cristal mais complexo e assimétrico
@@ -42,6 +45,11 @@ class CrystalWidget(QWidget):
             vertices.append(QPointF(x, y))
         return vertices
 
+    def build_crystal_path(self):
+        crystal_path = QPainterPath()
+        crystal_path.addPolygon(QPolygonF(self.crystal_vertices + self.crystal_vertices[:1]))
+        return crystal_path
+
     def update_animation(self):
         self.time += 0.05
         self.crystal_rotation += 0.01
@@ -49,24 +57,12 @@ class CrystalWidget(QWidget):
         self.particle_time += 0.02
         self.darkness_level = 0.5 + 0.3 * sin(self.time)
         self.shadow_intensity = 0.7 + 0.3 * sin(self.time * 0.5)
-        self.update()
 
     def draw_crystal(self, painter, center_x, center_y):
         # Desenha o cristal principal com gradiente vermelho sangue
-        crystal_path = QPainterPath()
-        
-        # Transformação dos vértices
-        transformed_vertices = []
-        for vertex in self.crystal_vertices:
-            x = vertex.x() * cos(self.crystal_rotation) - vertex.y() * sin(self.crystal_rotation)
-            y = vertex.x() * sin(self.crystal_rotation) + vertex.y() * cos(self.crystal_rotation)
-            transformed_vertices.append(QPointF(center_x + x, center_y + y))
-
-        # Criar caminho do cristal
-        crystal_path.moveTo(transformed_vertices[0])
-        for vertex in transformed_vertices[1:]:
-            crystal_path.lineTo(vertex)
-        crystal_path.lineTo(transformed_vertices[0])
+        # Rotação e posição aplicadas ao caminho pronto
+        transform = QTransform().translate(center_x, center_y).rotateRadians(self.crystal_rotation)
+        crystal_path = transform.map(self.crystal_path)
 
         # Gradiente principal do cristal
         gradient = QLinearGradient(center_x - 100, center_y - 100, center_x + 100, center_y + 100)
@@ -110,6 +106,19 @@ class CrystalWidget(QWidget):
             painter.setPen(Qt.NoPen)
             painter.drawEllipse(QPointF(x, y), size, size)
 
+    def paint_background(self, painter, width, height):
+        background_gradient = QRadialGradient(width / 2, height / 2, 400)
+        background_gradient.setColorAt(0, QColor(20, 0, 0, 200))
+        background_gradient.setColorAt(1, QColor(0, 0, 0, 255))
+        painter.fillRect(0, 0, width, height, background_gradient)
+
+    def paint_aura(self, painter, width, height, i):
+        radius = 200 + i * 30
+        aura_gradient = QRadialGradient(width / 2, height / 2, radius)
+        aura_gradient.setColorAt(0, QColor(100, 0, 0, int(100 * (1 - i/3))))
+        aura_gradient.setColorAt(1, QColor(0, 0, 0, 0))
+        painter.fillRect(0, 0, width, height, aura_gradient)
+
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
@@ -119,19 +128,12 @@ class CrystalWidget(QWidget):
         center_y = self.height() / 2
         
         # Fundo escuro com névoa
-        background_gradient = QRadialGradient(center_x, center_y, 400)
-        background_gradient.setColorAt(0, QColor(20, 0, 0, 200))
-        background_gradient.setColorAt(1, QColor(0, 0, 0, 255))
-        painter.fillRect(0, 0, self.width(), self.height(), background_gradient)
+        self.draw_layer(painter, 'background', self.paint_background)
         
-        # Desenhar aura sombria
+        # Desenhar aura sombria (pintada com intensidade máxima e atenuada na cópia)
         for i in range(3):
-            radius = 200 + i * 30
-            aura_gradient = QRadialGradient(center_x, center_y, radius)
-            opacity = int(100 * (1 - i/3) * self.shadow_intensity)
-            aura_gradient.setColorAt(0, QColor(100, 0, 0, opacity))
-            aura_gradient.setColorAt(1, QColor(0, 0, 0, 0))
-            painter.fillRect(0, 0, self.width(), self.height(), aura_gradient)
+            self.draw_layer(painter, f'aura_{i}', lambda p, w, h, i=i: self.paint_aura(p, w, h, i),
+                            opacity=self.shadow_intensity)
         
         # Desenhar cristal principal
         self.draw_crystal(painter, center_x, center_y)
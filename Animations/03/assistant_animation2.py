@@ -1,11 +1,20 @@
+import os
 import sys
-from PySide6.QtWidgets import QApplication, QWidget
-from PySide6.QtGui import QPainter, QPen, QColor, QFont, QRadialGradient, QPainterPath, QLinearGradient, QBrush
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF
+from PySide6.QtWidgets import QApplication
+from PySide6.QtGui import QPainter, QPen, QColor, QFont, QRadialGradient, QLinearGradient, QBrush
+from PySide6.QtCore import Qt, QPointF, QRectF
 from math import cos, sin, pi, exp
-import random
+import numpy as np
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from quantumui import (AnimatedWidget, ParticleSystem, PrimitiveBatch, angular_basis, paint_pool,
+                       polar_polygon, text_cache)
 
-class QuantumAssistantWidget(QWidget):
+class QuantumAssistantWidget(AnimatedWidget):
+    # Cores do gradiente de cada segmento das ondas de voz
+    WAVE_STOPS = ((0, (0, 255, 255)), (0.5, (100, 200, 255)), (1, (255, 0, 255)))
+    # Cores das linhas que ligam as partículas dos anéis
+    RING_STOPS = ((0, (0, 255, 255)), (1, (255, 0, 255)))
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Quantum Assistant")
@@ -13,6 +22,10 @@ class QuantumAssistantWidget(QWidget):
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.setWindowFlags(Qt.FramelessWindowHint)
         
+        # Parâmetros de qualidade, do nível mais caro ao mais leve
+        self.quality.declare(wave_points=(180, 120, 72), particles=(50, 30, 15),
+                             glow_stride=(1, 2, 4), antialiasing=(True, True, False))
+        
         # Estados da animação
         self.is_listening = False
         self.is_speaking = True
@@ -23,24 +36,18 @@ class QuantumAssistantWidget(QWidget):
         self.ring_rotation = 0
         self.pulse = 0
         self.particle_time = 0
-        self.quantum_particles = []
+        self.quantum_particles = ParticleSystem(50, rng=self.streams.numpy())
         self.generate_quantum_particles()
         
         # Configurar timer
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(16)  # 60 FPS para animação mais suave
+        self.start_animation(16)  # 60 FPS para animação mais suave
     
     def generate_quantum_particles(self):
-        for _ in range(50):
-            particle = {
-                'x': random.uniform(0, self.width()),
-                'y': random.uniform(0, self.height()),
-                'size': random.uniform(2, 6),
-                'speed': random.uniform(0.5, 2),
-                'angle': random.uniform(0, 2*pi)
-            }
-            self.quantum_particles.append(particle)
+        particles = self.quantum_particles
+        particles.x = particles.uniform(0, self.width())
+        particles.y = particles.uniform(0, self.height())
+        particles.size = particles.uniform(2, 6)
+        particles.set_polar_velocity(particles.uniform(0, 2*pi), particles.uniform(0.5, 2))
     
     def update_animation(self):
         # Atualizar variáveis de animação
@@ -50,76 +57,50 @@ class QuantumAssistantWidget(QWidget):
         self.particle_time += 0.02
         
         # Atualizar partículas quânticas
-        for particle in self.quantum_particles:
-            particle['x'] += cos(particle['angle']) * particle['speed']
-            particle['y'] += sin(particle['angle']) * particle['speed']
-            
-            # Manter partículas dentro da tela
-            if particle['x'] < 0 or particle['x'] > self.width():
-                particle['angle'] = pi - particle['angle']
-            if particle['y'] < 0 or particle['y'] > self.height():
-                particle['angle'] = -particle['angle']
+        self.quantum_particles.step()
+        
+        # Manter partículas dentro da tela
+        self.quantum_particles.bounce(0, 0, self.width(), self.height())
         
         # Simular níveis de energia variáveis
         self.energy_level = 0.5 + 0.3 * sin(self.pulse)
-        self.update()
     
     def draw_energy_ring(self, painter, center_x, center_y, radius, num_particles):
-        for i in range(num_particles):
-            angle = (i * 360 / num_particles + self.ring_rotation) * pi / 180
-            
-            # Posição da partícula
-            x = center_x + radius * cos(angle)
-            y = center_y + radius * sin(angle)
-            
-            # Tamanho e opacidade variáveis
-            size = 4 + 2 * sin(self.pulse + i * 0.2)
-            opacity = int(100 + 100 * abs(sin(self.pulse + i * 0.1)))
-            
-            # Desenhar partícula
-            painter.setPen(Qt.NoPen)
-            painter.setBrush(QColor(0, 255, 255, opacity))
-            painter.drawEllipse(QPointF(x, y), size, size)
+        index = np.arange(num_particles)
+        angles = (index * 360 / num_particles + self.ring_rotation) * pi / 180
+        
+        # Posição das partículas
+        xs = (center_x + radius * np.cos(angles)).tolist()
+        ys = (center_y + radius * np.sin(angles)).tolist()
+        
+        # Tamanho e opacidade variáveis
+        sizes = (4 + 2 * np.sin(self.pulse + index * 0.2)).tolist()
+        opacities = (100 + 100 * np.abs(np.sin(self.pulse + index * 0.1))).astype(int).tolist()
+        
+        # Desenhar partículas agrupadas por opacidade
+        batch = PrimitiveBatch()
+        for x, y, size, opacity in zip(xs, ys, sizes, opacities):
+            batch.add_ellipse(x, y, size, size, (0, 255, 255, opacity))
+        batch.flush(painter)
+        
+        # Conectar cada partícula com a anterior (cada linha tem seu próprio gradiente)
+        for i in range(1, num_particles):
+            prev_x, prev_y = xs[i - 1], ys[i - 1]
+            x, y, opacity = xs[i], ys[i], opacities[i]
             
-            # Conectar com próxima partícula
-            if i > 0:
-                prev_angle = ((i-1) * 360 / num_particles + self.ring_rotation) * pi / 180
-                prev_x = center_x + radius * cos(prev_angle)
-                prev_y = center_y + radius * sin(prev_angle)
-                
-                # Linha de energia
-                gradient = QLinearGradient(prev_x, prev_y, x, y)
-                gradient.setColorAt(0, QColor(0, 255, 255, opacity))
-                gradient.setColorAt(1, QColor(255, 0, 255, opacity))
-                
-                pen = QPen()
-                pen.setBrush(gradient)
-                pen.setWidth(2)
-                painter.setPen(pen)
-                painter.drawLine(QPointF(prev_x, prev_y), QPointF(x, y))
+            # Linha de energia
+            painter.setPen(paint_pool.gradient_pen(self.RING_STOPS, opacity, 2, prev_x, prev_y, x, y,
+                                                   Qt.SquareCap, Qt.BevelJoin))
+            painter.drawLine(QPointF(prev_x, prev_y), QPointF(x, y))
     
     def draw_wave_circle(self, painter, center_x, center_y, base_radius):
-        num_points = 180
-        path = QPainterPath()
-        first_point = None
-        
-        for i in range(num_points + 1):
-            angle = (i * 360 / num_points) * pi / 180
-            # Raio variável baseado em várias ondas
-            radius = base_radius + 20 * sin(4 * angle + self.wave_time) * self.energy_level
-            radius += 10 * cos(8 * angle - self.wave_time * 2) * self.energy_level
-            
-            x = center_x + radius * cos(angle)
-            y = center_y + radius * sin(angle)
-            
-            if i == 0:
-                path.moveTo(x, y)
-                first_point = (x, y)
-            else:
-                path.lineTo(x, y)
+        num_points = self.quality['wave_points']
+        angles, _, _ = angular_basis(num_points)
         
-        if first_point:
-            path.lineTo(first_point[0], first_point[1])
+        # Raio variável baseado em várias ondas
+        radius = base_radius + 20 * np.sin(4 * angles + self.wave_time) * self.energy_level
+        radius += 10 * np.cos(8 * angles - self.wave_time * 2) * self.energy_level
+        polygon = polar_polygon(center_x, center_y, radius, num_points)
         
         # Desenhar com gradiente
         gradient = QRadialGradient(center_x, center_y, base_radius * 2)
@@ -129,28 +110,34 @@ class QuantumAssistantWidget(QWidget):
         
         painter.setPen(QPen(QColor(0, 255, 255, 100), 2))
         painter.setBrush(gradient)
-        painter.drawPath(path)
+        painter.drawPolygon(polygon)
+    
+    def paint_background(self, painter, width, height):
+        gradient = QRadialGradient(width / 2, height / 2, 500)
+        gradient.setColorAt(0, QColor(0, 20, 40, 30))
+        gradient.setColorAt(1, QColor(0, 0, 0, 0))
+        painter.fillRect(0, 0, width, height, gradient)
     
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.Antialiasing, self.quality['antialiasing'])
         
         # Centro da tela
         center_x = self.width() / 2
         center_y = self.height() / 2
         
         # Fundo com gradiente
-        gradient = QRadialGradient(center_x, center_y, 500)
-        gradient.setColorAt(0, QColor(0, 20, 40, 30))
-        gradient.setColorAt(1, QColor(0, 0, 0, 0))
-        painter.fillRect(0, 0, self.width(), self.height(), gradient)
+        self.draw_layer(painter, 'background', self.paint_background)
         
         # Partículas quânticas
-        for particle in self.quantum_particles:
-            opacity = int(100 + 100 * abs(sin(self.pulse + particle['x'] * 0.01)))
-            painter.setPen(Qt.NoPen)
-            painter.setBrush(QColor(255, 255, 255, opacity))
-            painter.drawEllipse(QPointF(particle['x'], particle['y']), particle['size'], particle['size'])
+        particles = self.quantum_particles
+        count = self.quality['particles']
+        xs, ys, sizes = particles.x[:count], particles.y[:count], particles.size[:count]
+        opacities = (100 + 100 * np.abs(np.sin(self.pulse + xs * 0.01))).astype(int)
+        batch = PrimitiveBatch()
+        for x, y, size, opacity in zip(xs.tolist(), ys.tolist(), sizes.tolist(), opacities.tolist()):
+            batch.add_ellipse(x, y, size, size, (255, 255, 255, opacity))
+        batch.flush(painter)
         
         # Círculos de energia pulsantes
         for i in range(3):
@@ -188,16 +175,8 @@ class QuantumAssistantWidget(QWidget):
                     opacity = int(200 * exp(-abs(x - center_x)/(wave_width/3)))
                     
                     # Gradiente mais vibrante para as ondas
-                    gradient = QLinearGradient(prev_x, prev_y1, x, y1)
-                    gradient.setColorAt(0, QColor(0, 255, 255, opacity))
-                    gradient.setColorAt(0.5, QColor(100, 200, 255, opacity))
-                    gradient.setColorAt(1, QColor(255, 0, 255, opacity))
-                    
-                    # Linha mais grossa com ponta arredondada
-                    pen = QPen(QBrush(gradient), wave_thickness)
-                    pen.setCapStyle(Qt.RoundCap)
-                    pen.setJoinStyle(Qt.RoundJoin)
-                    painter.setPen(pen)
+                    painter.setPen(paint_pool.gradient_pen(self.WAVE_STOPS, opacity, wave_thickness,
+                                                           prev_x, prev_y1, x, y1))
                     
                     # Desenhar linhas com suavização
                     painter.drawLine(QPointF(prev_x, prev_y1), QPointF(x, y1))
@@ -206,18 +185,18 @@ class QuantumAssistantWidget(QWidget):
                     # Adicionar pontos de brilho nas intersecções
                     glow_size = wave_thickness * 1.5
                     painter.setPen(Qt.NoPen)
-                    painter.setBrush(QColor(255, 255, 255, opacity))
+                    painter.setBrush(paint_pool.brush(255, 255, 255, opacity))
                     painter.drawEllipse(QPointF(x, y1), glow_size/2, glow_size/2)
                     painter.drawEllipse(QPointF(x, y2), glow_size/2, glow_size/2)
                 
                 prev_x, prev_y1, prev_y2 = x, y1, y2
         
         # Texto Staley IA com efeito futurista
-        font = QFont("Arial", 60, QFont.Bold)
+        font = text_cache.font("Arial", 60, QFont.Bold)
         painter.setFont(font)
         
         # Efeito de energia futurista
-        for i in range(25):
+        for i in range(0, 25, self.quality['glow_stride']):
             # Efeito de pulso dinâmico
             pulse_effect = sin(self.wave_time * 3 + i * 0.2)
             scale = 1 + 0.05 * pulse_effect
@@ -249,7 +228,7 @@ class QuantumAssistantWidget(QWidget):
                 500 * scale,
                 100 * scale
             )
-            painter.drawText(rect, Qt.AlignCenter, "Staley IA")
+            text_cache.draw(painter, rect, Qt.AlignCenter, "Staley IA")
         
         # Efeito de brilho central
         glow_radius = 50 + 20 * sin(self.pulse * 2)
@@ -274,7 +253,7 @@ class QuantumAssistantWidget(QWidget):
         pen.setBrush(QBrush(main_gradient))
         pen.setWidth(2)
         painter.setPen(pen)
-        painter.drawText(QRectF(center_x - 250, center_y - 50, 500, 100),
+        text_cache.draw(painter, QRectF(center_x - 250, center_y - 50, 500, 100),
                         Qt.AlignCenter, "Staley IA")
                         
         # Linhas de energia horizontais
@@ -298,9 +277,9 @@ class QuantumAssistantWidget(QWidget):
         
         # Status do assistente
         status_text = "Analisando Dados Quânticos..." if self.is_listening else "Processando Realidade..."
-        font.setPointSize(16)
+        font = text_cache.font("Arial", 16, QFont.Bold)
         painter.setFont(font)
-        painter.drawText(QRectF(center_x - 250, center_y + 60, 500, 40),
+        text_cache.draw(painter, QRectF(center_x - 250, center_y + 60, 500, 40),
                         Qt.AlignCenter, status_text)
 
     def mousePressEvent(self, event):
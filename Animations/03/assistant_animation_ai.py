@@ -1,10 +1,13 @@
+import os
 import sys
 from math import cos, sin, pi, exp
-from PySide6.QtWidgets import QApplication, QWidget
+from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QPainter, QPen, QColor, QFont, QRadialGradient, QPainterPath, QGuiApplication
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF
+from PySide6.QtCore import Qt, QPointF, QRectF
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from quantumui import AnimatedWidget, text_cache
 
-class AssistantAIModule(QWidget):
+class AssistantAIModule(AnimatedWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Assistente Virtual - Módulo AI Avançada")
@@ -27,9 +30,7 @@ class AssistantAIModule(QWidget):
         self.grid_offset = 0
 
         # Configurar timer para animação
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(16)  # Aproximadamente 60 FPS
+        self.start_animation(16)  # Aproximadamente 60 FPS
     
     def update_animation(self):
         self.wave_time = (self.wave_time + 0.07) % (2 * pi)
@@ -38,8 +39,6 @@ class AssistantAIModule(QWidget):
         self.pulse_expansion = (self.pulse_expansion + 2) % 300
         self.grid_offset = (self.grid_offset + 0.5) % 20
         
-        self.update()
-        
     def draw_digital_pulse(self, painter, center_x, center_y):
         # Desenha um pulso digital em expansão, simulando uma tecnologia avançada
         max_radius = 250
@@ -111,7 +110,7 @@ class AssistantAIModule(QWidget):
                 prev_y_down = y_down
         
         # Texto com efeito futurístico
-        font = QFont("Consolas", 36, QFont.Bold)
+        font = text_cache.font("Consolas", 36, QFont.Bold)
         painter.setFont(font)
         # Sombra do texto
         for i in range(8):
@@ -127,11 +126,11 @@ class AssistantAIModule(QWidget):
                          Qt.AlignCenter, "Staley IA")
         
         # Exibição do status do assistente
-        font.setPointSize(12)
+        font = text_cache.font("Consolas", 12, QFont.Bold)
         painter.setFont(font)
         status_text = "Ouvindo..." if self.is_listening else "Respondendo..."
-        painter.drawText(QRectF(center_x - 100, center_y + 30, 200, 30),
-                         Qt.AlignCenter, status_text)
+        text_cache.draw(painter, QRectF(center_x - 100, center_y + 30, 200, 30),
+                        Qt.AlignCenter, status_text)
     
     def mousePressEvent(self, event):
         self.old_pos = event.globalPosition().toPoint()
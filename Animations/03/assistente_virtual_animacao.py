@@ -1,10 +1,13 @@
+import os
 import sys
-from PySide6.QtWidgets import QApplication, QWidget
+from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QPainter, QPen, QColor, QFont, QRadialGradient, QLinearGradient
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF
+from PySide6.QtCore import Qt, QPointF, QRectF
 from math import cos, sin, pi
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from quantumui import AnimatedWidget, text_cache
 
-class VirtualAssistantAnimation(QWidget):
+class VirtualAssistantAnimation(AnimatedWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Assistente Virtual - Animação")
@@ -24,15 +27,12 @@ class VirtualAssistantAnimation(QWidget):
         self.phase = 0       # Fase adicional para variações
         
         # Timer para atualizar a animação
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(30)
+        self.start_animation(30)
     
     def update_animation(self):
         self.angle = (self.angle + 2) % 360
         self.pulse = (self.pulse + 0.1) % (2 * pi)
         self.phase += 0.02
-        self.update()
     
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -85,18 +85,18 @@ class VirtualAssistantAnimation(QWidget):
         painter.drawEllipse(QPointF(center_x, center_y), core_radius, core_radius)
         
         # Texto central com sombra sutil
-        font = QFont("Helvetica", 24, QFont.Bold)
+        font = text_cache.font("Helvetica", 24, QFont.Bold)
         painter.setFont(font)
         text = "Assistente Virtual"
         
         # Desenhando sombra
         shadow_offset = 2
         painter.setPen(QColor(0, 0, 0, 120))
-        painter.drawText(QRectF(center_x - 200 + shadow_offset, center_y - 40 + shadow_offset, 400, 80), Qt.AlignCenter, text)
+        text_cache.draw(painter, QRectF(center_x - 200 + shadow_offset, center_y - 40 + shadow_offset, 400, 80), Qt.AlignCenter, text)
         
         # Desenhando o texto principal
         painter.setPen(QColor(0, 190, 255, 230))
-        painter.drawText(QRectF(center_x - 200, center_y - 40, 400, 80), Qt.AlignCenter, text)
+        text_cache.draw(painter, QRectF(center_x - 200, center_y - 40, 400, 80), Qt.AlignCenter, text)
         
         # NOVOS ELEMENTOS: Efeitos tecnológicos e mais vivos
         
@@ -1,10 +1,14 @@
+import os
 import sys
-from PySide6.QtWidgets import QApplication, QWidget
+from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QPainter, QPen, QColor, QFont, QRadialGradient, QLinearGradient
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF
+from PySide6.QtCore import Qt, QPointF, QRectF
 from math import cos, sin, pi, sqrt
+import numpy as np
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from quantumui import AnimatedWidget, angular_basis, polar_points, text_cache, to_polygon
 
-class BiometricScanner(QWidget):
+class BiometricScanner(AnimatedWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Scanner Biométrico")
@@ -19,9 +23,7 @@ class BiometricScanner(QWidget):
         self.scan_active = True
         
         # Timer para animação
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(30)
+        self.start_animation(30)
     
     def update_animation(self):
         self.angle = (self.angle + 2) % 360
@@ -31,31 +33,39 @@ class BiometricScanner(QWidget):
         if self.scan_active:
             self.scan_line = (self.scan_line + 3) % 200
         
-        self.update()
+        # Tudo que se move fica dentro do anel externo; o resto da janela não muda
+        self.damage(self.scanner_rect())
+    
+    def scanner_rect(self):
+        # Anel externo (raio 200) mais os textos BIO_xx à direita dos círculos de dados
+        center_x = self.width() / 2
+        center_y = self.height() / 2
+        return QRectF(center_x - 202, center_y - 202, 440, 404)
     
     def draw_fingerprint(self, painter, center_x, center_y):
         # Desenhar padrões de impressão digital
+        angles, _, _ = angular_basis(18)
         for i in range(8):
             radius = 50 + i * 15
             pen = QPen(QColor(0, 255, 200, 100 - i * 10))
             pen.setWidth(2)
             painter.setPen(pen)
             
-            for j in range(0, 360, 20):
-                angle = (j + self.angle + i * 10) * pi / 180
-                next_angle = (j + 20 + self.angle + i * 10) * pi / 180
-                
-                x1 = center_x + radius * cos(angle)
-                y1 = center_y + radius * sin(angle)
-                x2 = center_x + radius * cos(next_angle)
-                y2 = center_y + radius * sin(next_angle)
-                
-                # Adicionar ondulação
-                wave = sin(angle * 3 + self.pulse) * 5
-                y1 += wave
-                y2 += wave
-                
-                painter.drawLine(QPointF(x1, y1), QPointF(x2, y2))
+            # Segmentos de 20 graus, todos de uma vez
+            rotation = (self.angle + i * 10) * pi / 180
+            x, y = polar_points(center_x, center_y, radius, 18, rotation=rotation)
+            
+            # Adicionar ondulação (a do início de cada segmento vale para as duas pontas)
+            wave = np.sin((angles[:-1] + rotation) * 3 + self.pulse) * 5
+            line_x = np.column_stack((x[:-1], x[1:])).ravel()
+            line_y = np.column_stack((y[:-1] + wave, y[1:] + wave)).ravel()
+            painter.drawLines(to_polygon(line_x, line_y))
+    
+    def paint_background(self, painter, width, height):
+        gradient = QRadialGradient(width / 2, height / 2, 300)
+        gradient.setColorAt(0, QColor(0, 40, 30, 30))
+        gradient.setColorAt(1, QColor(0, 0, 0, 0))
+        painter.fillRect(0, 0, width, height, gradient)
     
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -66,10 +76,11 @@ class BiometricScanner(QWidget):
         center_y = self.height() / 2
         
         # Gradiente de fundo
-        gradient = QRadialGradient(center_x, center_y, 300)
-        gradient.setColorAt(0, QColor(0, 40, 30, 30))
-        gradient.setColorAt(1, QColor(0, 0, 0, 0))
-        painter.fillRect(0, 0, self.width(), self.height(), gradient)
+        self.draw_layer(painter, 'background', self.paint_background)
+        
+        # Nada do scanner precisa ser pintado fora da área exposta
+        if not self.exposed(event, self.scanner_rect()):
+            return
         
         # Círculo externo com segmentos
         radius = 200
@@ -91,18 +102,19 @@ class BiometricScanner(QWidget):
                 painter.drawLine(QPointF(x1, y1), QPointF(x2, y2))
         
         # Desenhar impressão digital
-        self.draw_fingerprint(painter, center_x, center_y)
+        if self.exposed(event, QRectF(center_x - 162, center_y - 162, 324, 324)):
+            self.draw_fingerprint(painter, center_x, center_y)
         
         # Linha de escaneamento
-        if self.scan_active:
+        scan_rect = QRectF(center_x - 150, center_y - 100 + self.scan_line, 300, 2)
+        if self.scan_active and self.exposed(event, scan_rect):
             scan_gradient = QLinearGradient(0, center_y - 100 + self.scan_line,
                                           0, center_y - 98 + self.scan_line)
             scan_gradient.setColorAt(0, QColor(0, 255, 200, 0))
             scan_gradient.setColorAt(0.5, QColor(0, 255, 200, 150))
             scan_gradient.setColorAt(1, QColor(0, 255, 200, 0))
             
-            painter.fillRect(QRectF(center_x - 150, center_y - 100 + self.scan_line,
-                                  300, 2), scan_gradient)
+            painter.fillRect(scan_rect, scan_gradient)
         
         # Círculos de dados
         for i in range(8):
@@ -118,32 +130,34 @@ class BiometricScanner(QWidget):
             painter.drawEllipse(QPointF(x, y), size, size)
             
             # Texto de dados
-            font = QFont("Courier New", 8)
+            font = text_cache.font("Courier New", 8)
             painter.setFont(font)
             painter.setPen(QColor(0, 255, 200, 150))
             text = f"BIO_{i:02X}"
             painter.drawText(QPointF(x + 10, y), text)
         
         # Texto central com efeito de escaneamento
-        font = QFont("Arial", 30, QFont.Bold)
+        font = text_cache.font("Arial", 30, QFont.Bold)
         painter.setFont(font)
         
         # Efeito de brilho
-        for i in range(10):
-            opacity = (10 - i) * 15
-            y_offset = sin(self.pulse) * 3
-            color = QColor(0, 255, 200, opacity)
-            painter.setPen(color)
-            painter.drawText(QRectF(center_x-150, center_y-20+y_offset-i/2, 300, 40),
-                           Qt.AlignCenter, "Gysin-IA")
+        if self.exposed(event, QRectF(center_x - 150, center_y - 29, 300, 52)):
+            for i in range(10):
+                opacity = (10 - i) * 15
+                y_offset = sin(self.pulse) * 3
+                color = QColor(0, 255, 200, opacity)
+                painter.setPen(color)
+                painter.drawText(QRectF(center_x-150, center_y-20+y_offset-i/2, 300, 40),
+                               Qt.AlignCenter, "Gysin-IA")
         
         # Status do escaneamento
-        font.setPointSize(12)
-        painter.setFont(font)
-        status = "SCANNING BIOMETRICS..." if self.scan_active else "SCAN COMPLETE"
-        painter.setPen(QColor(0, 255, 200, 200))
-        painter.drawText(QRectF(center_x-150, center_y+50, 300, 30),
-                        Qt.AlignCenter, status)
+        status_rect = QRectF(center_x-150, center_y+50, 300, 30)
+        if self.exposed(event, status_rect):
+            font = text_cache.font("Arial", 12, QFont.Bold)
+            painter.setFont(font)
+            status = "SCANNING BIOMETRICS..." if self.scan_active else "SCAN COMPLETE"
+            painter.setPen(QColor(0, 255, 200, 200))
+            text_cache.draw(painter, status_rect, Qt.AlignCenter, status)
 
     def mousePressEvent(self, event):
         self.old_pos = event.globalPosition().toPoint()
@@ -1,10 +1,13 @@
+import os
 import sys
-from PySide6.QtWidgets import QApplication, QWidget
+from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QPainter, QPen, QColor, QFont, QRadialGradient, QLinearGradient, QPainterPath
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF
+from PySide6.QtCore import Qt, QPointF, QRectF
 from math import cos, sin, pi, sqrt, exp
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from quantumui import AnimatedWidget, text_cache
 
-class DarkCrystalAnimation(QWidget):
+class DarkCrystalAnimation(AnimatedWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Cristal Sombrio")
@@ -28,9 +31,7 @@ class DarkCrystalAnimation(QWidget):
         self.eye_color = QColor(255, 0, 0)
         
         # Timer para animação
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(16)  # ~60 FPS
+        self.start_animation(16)  # ~60 FPS
     
     def update_animation(self):
         self.angle = (self.angle + 0.5) % 360
@@ -40,7 +41,6 @@ class DarkCrystalAnimation(QWidget):
         self.darkness_intensity = (sin(self.pulse * 0.5) + 1) * 0.5
         self.eye_pulse = (self.eye_pulse + 0.03) % (2 * pi)
         self.crystal_rotation = (self.crystal_rotation - 0.02) % (2 * pi)
-        self.update()
     
     def draw_eye(self, painter, center_x, center_y, scale):
         # Tamanho do olho
@@ -162,11 +162,11 @@ class DarkCrystalAnimation(QWidget):
         self.draw_crystal(painter, center_x, center_y, scale)
         
         # Texto ameaçador
-        font = QFont("Arial", int(20 * scale), QFont.Bold)
+        font = text_cache.font("Arial", int(20 * scale), QFont.Bold)
         painter.setFont(font)
         text_color = QColor(150, 0, 0, int(255 * self.darkness_intensity))
         painter.setPen(text_color)
-        painter.drawText(QRectF(0, center_y + 250 * scale, self.width(), 40 * scale),
+        text_cache.draw(painter, QRectF(0, center_y + 250 * scale, self.width(), 40 * scale),
                         Qt.AlignCenter, "SISTEMA ATIVO")
     
     def mousePressEvent(self, event):
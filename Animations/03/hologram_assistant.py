@@ -1,10 +1,13 @@
+import os
 import sys
-from PySide6.QtWidgets import QApplication, QWidget
+from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QPainter, QPen, QColor, QFont, QRadialGradient, QPainterPath
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF
+from PySide6.QtCore import Qt, QPointF, QRectF
 from math import cos, sin, pi, exp
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from quantumui import AnimatedWidget, text_cache
 
-class HologramAssistant(QWidget):
+class HologramAssistant(AnimatedWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Hologram Interface")
@@ -19,15 +22,21 @@ class HologramAssistant(QWidget):
         self.scan_line = 0
         
         # Timer para animação
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(16)  # 60 FPS
+        self.start_animation(16)  # 60 FPS
     
     def update_animation(self):
         self.rotation = (self.rotation + 1) % 360
         self.wave_time = (self.wave_time + 0.1) % (2 * pi)
         self.scan_line = (self.scan_line + 2) % self.height()
-        self.update()
+        
+        # Só a área do holograma muda; o resto da janela é fundo estático
+        self.damage(self.hologram_rect())
+    
+    def hologram_rect(self):
+        # Grade de 400 px com ondulação de 5 px, círculos 3D e textos
+        center_x = self.width() / 2
+        center_y = self.height() / 2
+        return QRectF(center_x - 206, center_y - 206, 412, 412)
     
     def draw_3d_circle(self, painter, cx, cy, radius, num_circles=20):
         for i in range(num_circles):
@@ -77,6 +86,12 @@ class HologramAssistant(QWidget):
             
             prev_x, prev_y = x, y
     
+    def paint_background(self, painter, width, height):
+        gradient = QRadialGradient(width / 2, height / 2, 400)
+        gradient.setColorAt(0, QColor(0, 40, 60, 30))
+        gradient.setColorAt(1, QColor(0, 0, 0, 0))
+        painter.fillRect(0, 0, width, height, gradient)
+    
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
@@ -86,20 +101,24 @@ class HologramAssistant(QWidget):
         center_y = self.height() / 2
         
         # Fundo com gradiente
-        gradient = QRadialGradient(center_x, center_y, 400)
-        gradient.setColorAt(0, QColor(0, 40, 60, 30))
-        gradient.setColorAt(1, QColor(0, 0, 0, 0))
-        painter.fillRect(0, 0, self.width(), self.height(), gradient)
+        self.draw_layer(painter, 'background', self.paint_background)
+        
+        # Nada do holograma precisa ser pintado fora da área exposta
+        if not self.exposed(event, self.hologram_rect()):
+            return
         
         # Círculos 3D girando
-        self.draw_3d_circle(painter, center_x, center_y, 150)
+        if self.exposed(event, QRectF(center_x - 152, center_y - 167, 304, 334)):
+            self.draw_3d_circle(painter, center_x, center_y, 150)
         
         # Pontos de dados e conexões
-        self.draw_data_points(painter, center_x, center_y, 120)
+        if self.exposed(event, QRectF(center_x - 125, center_y - 125, 250, 250)):
+            self.draw_data_points(painter, center_x, center_y, 120)
         
         # Área do holograma
         holo_rect = QRectF(center_x - 200, center_y - 200, 400, 400)
-        self.draw_hologram_scan(painter, holo_rect)
+        if self.exposed(event, QRectF(holo_rect.x(), self.scan_line - 2, holo_rect.width(), 4)):
+            self.draw_hologram_scan(painter, holo_rect)
         
         # Grade holográfica
         num_lines = 20
@@ -122,29 +141,31 @@ class HologramAssistant(QWidget):
                            QPointF(x + x_offset, center_y + 200))
         
         # Texto holográfico
-        font = QFont("Arial", 40, QFont.Bold)
+        font = text_cache.font("Arial", 40, QFont.Bold)
         painter.setFont(font)
         
         # Efeito de distorção holográfica
-        for i in range(5):
-            offset = 2 * sin(self.wave_time + i)
-            opacity = int(150 + 100 * sin(self.wave_time + i))
-            color = QColor(0, 200, 255, opacity)
-            
-            painter.setPen(color)
-            painter.drawText(QRectF(center_x-150, center_y-25+offset, 300, 50),
-                           Qt.AlignCenter, "Gysin-IA")
+        if self.exposed(event, QRectF(center_x - 150, center_y - 27, 300, 54)):
+            for i in range(5):
+                offset = 2 * sin(self.wave_time + i)
+                opacity = int(150 + 100 * sin(self.wave_time + i))
+                color = QColor(0, 200, 255, opacity)
+                
+                painter.setPen(color)
+                painter.drawText(QRectF(center_x-150, center_y-25+offset, 300, 50),
+                               Qt.AlignCenter, "Gysin-IA")
         
         # Status holográfico
-        status = "SCANNING..." if self.is_listening else "ANALYZING..."
-        font.setPointSize(12)
-        painter.setFont(font)
-        
-        # Efeito de flutuação no status
-        y_offset = 5 * sin(self.wave_time * 2)
-        painter.setPen(QColor(0, 200, 255, 200))
-        painter.drawText(QRectF(center_x-100, center_y+40+y_offset, 200, 30),
-                        Qt.AlignCenter, status)
+        if self.exposed(event, QRectF(center_x - 100, center_y + 35, 200, 40)):
+            status = "SCANNING..." if self.is_listening else "ANALYZING..."
+            font = text_cache.font("Arial", 12, QFont.Bold)
+            painter.setFont(font)
+            
+            # Efeito de flutuação no status
+            y_offset = 5 * sin(self.wave_time * 2)
+            painter.setPen(QColor(0, 200, 255, 200))
+            text_cache.draw(painter, QRectF(center_x-100, center_y+40+y_offset, 200, 30),
+                            Qt.AlignCenter, status)
 
     def mousePressEvent(self, event):
         self.old_pos = event.globalPosition().toPoint()
@@ -1,12 +1,14 @@
+import os
 import sys
-from PySide6.QtWidgets import QApplication, QWidget
+from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QPainter, QPen, QColor, QFont, QRadialGradient
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF
-from math import cos, sin, pi, exp
-import random
+from PySide6.QtCore import Qt, QPointF, QRectF
+from math import cos, sin, pi, exp, degrees
 import string
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from quantumui import AnimatedWidget, glitch_text, glyph_atlas, path_cache, text_cache
 
-class MatrixAssistant(QWidget):
+class MatrixAssistant(AnimatedWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Matrix Interface")
@@ -22,21 +24,20 @@ class MatrixAssistant(QWidget):
         self.is_listening = False
         self.time = 0
         self.pulse = 0
+        self.roll_glitches()
         
         # Timer para animação
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(30)
+        self.start_animation(30)
     
     def generate_matrix_chars(self):
         num_columns = 30
         for i in range(num_columns):
             column = {
-                'x': random.randint(0, self.width()),
-                'y': random.randint(-500, 0),
-                'speed': random.uniform(2, 5),
-                'chars': ''.join(random.choices(string.ascii_letters + string.digits, k=20)),
-                'opacity': random.randint(100, 255)
+                'x': self.random.randint(0, self.width()),
+                'y': self.random.randint(-500, 0),
+                'speed': self.random.uniform(2, 5),
+                'chars': ''.join(self.random.choices(string.ascii_letters + string.digits, k=20)),
+                'opacity': self.random.randint(100, 255)
             }
             self.matrix_chars.append(column)
     
@@ -48,36 +49,43 @@ class MatrixAssistant(QWidget):
         for column in self.matrix_chars:
             column['y'] += column['speed']
             if column['y'] > self.height():
-                column['y'] = random.randint(-500, 0)
-                column['chars'] = ''.join(random.choices(string.ascii_letters + string.digits, k=20))
-                column['opacity'] = random.randint(100, 255)
+                column['y'] = self.random.randint(-500, 0)
+                column['chars'] = ''.join(self.random.choices(string.ascii_letters + string.digits, k=20))
+                column['opacity'] = self.random.randint(100, 255)
         
-        self.update()
+        self.roll_glitches()
+    
+    def roll_glitches(self):
+        # Glitches sorteados no passo: repintar o mesmo quadro não os muda
+        self.glitch_offsets = [self.cosmetic.uniform(-1, 1) for i in range(5)]
+        status = "SCANNING..." if self.is_listening else "PROCESSING..."
+        self.status_text = glitch_text(status, self.cosmetic, 0.1,  # 10% de chance de glitch
+                                       string.ascii_uppercase + string.digits)
+    
+    def paint_background(self, painter, width, height):
+        gradient = QRadialGradient(width / 2, height / 2, 400)
+        gradient.setColorAt(0, QColor(0, 20, 0, 30))
+        gradient.setColorAt(1, QColor(0, 0, 0, 0))
+        painter.fillRect(0, 0, width, height, gradient)
     
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
         # Fundo escuro com gradiente
-        gradient = QRadialGradient(self.width()/2, self.height()/2, 400)
-        gradient.setColorAt(0, QColor(0, 20, 0, 30))
-        gradient.setColorAt(1, QColor(0, 0, 0, 0))
-        painter.fillRect(0, 0, self.width(), self.height(), gradient)
+        self.draw_layer(painter, 'background', self.paint_background)
         
         # Desenhar caracteres Matrix
-        font = QFont("Courier New", 14)
-        painter.setFont(font)
+        # Cada coluna vira uma única cópia do atlas de glifos
+        atlas = glyph_atlas("Courier New", 14, string.ascii_letters + string.digits,
+                            self.devicePixelRatioF())
         
         for column in self.matrix_chars:
             x, y = column['x'], column['y']
             chars = column['chars']
-            for i, char in enumerate(chars):
-                opacity = max(0, column['opacity'] - i * 10)
-                color = QColor(0, 255, 0, opacity)
-                if i == 0:  # Primeiro caractere mais brilhante
-                    color = QColor(200, 255, 200, opacity)
-                painter.setPen(color)
-                painter.drawText(QPointF(x, y + i * 20), char)
+            colors = [(0, 255, 0, max(0, column['opacity'] - i * 10)) for i in range(len(chars))]
+            colors[0] = (200, 255, 200, colors[0][3])  # Primeiro caractere mais brilhante
+            atlas.draw_column(painter, x, y, chars, colors, 20)
         
         # Círculo central
         center_x = self.width() / 2
@@ -92,41 +100,39 @@ class MatrixAssistant(QWidget):
         self.draw_digital_text(painter, center_x, center_y)
         
         # Status com efeito digital
-        status = "SCANNING..." if self.is_listening else "PROCESSING..."
-        self.draw_status_text(painter, center_x, center_y + 50, status)
+        self.draw_status_text(painter, center_x, center_y + 50, self.status_text)
         
         # Desenho de raios
         self.draw_rays(painter, center_x, center_y, 300, 0)
 
     def draw_hexagon(self, painter, cx, cy, size, rotation):
-        points = []
-        for i in range(6):
-            angle = rotation + i * pi / 3
-            x = cx + size * cos(angle)
-            y = cy + size * sin(angle)
-            points.append(QPointF(x, y))
+        # Contorno e pontos vêm prontos do cache; só a transformação muda
+        dpr = self.devicePixelRatioF()
+        outline = path_cache.path('polygon', size, 6, dpr)
+        dots = path_cache.path(('vertex_dots', 3), size, 6, dpr)
         
         # Desenhar linhas do hexágono
         pen = QPen(QColor(0, 255, 0, 100))
         pen.setWidth(2)
         painter.setPen(pen)
         
-        for i in range(6):
-            j = (i + 1) % 6
-            painter.drawLine(points[i], points[j])
+        painter.save()
+        painter.translate(cx, cy)
+        painter.rotate(degrees(rotation))
+        painter.strokePath(outline, pen)
         
         # Pontos nos vértices
-        for point in points:
-            painter.drawEllipse(point, 3, 3)
+        painter.drawPath(dots)
+        painter.restore()
     
     def draw_digital_text(self, painter, cx, cy):
         text = "Gysin-IA"
-        font = QFont("Courier New", 40, QFont.Bold)
+        font = text_cache.font("Courier New", 40, QFont.Bold)
         painter.setFont(font)
         
         # Efeito de glitch
-        for i in range(5):
-            offset = random.uniform(-1, 1) * sin(self.pulse)
+        for i, glitch in enumerate(self.glitch_offsets):
+            offset = glitch * sin(self.pulse)
             opacity = int(200 + 55 * sin(self.pulse + i))
             painter.setPen(QColor(0, 255, 0, opacity))
             painter.drawText(QRectF(cx-150, cy-25+offset, 300, 50),
@@ -138,16 +144,11 @@ class MatrixAssistant(QWidget):
                         Qt.AlignCenter, text)
     
     def draw_status_text(self, painter, cx, cy, text):
-        font = QFont("Courier New", 12)
+        font = text_cache.font("Courier New", 12)
         painter.setFont(font)
         
         # Efeito de digitalização
-        for i in range(len(text)):
-            if random.random() < 0.1:  # 10% de chance de glitch
-                char = random.choice(string.ascii_uppercase + string.digits)
-            else:
-                char = text[i]
-            
+        for i, char in enumerate(text):
             x = cx - len(text)*5 + i*10
             y = cy
             
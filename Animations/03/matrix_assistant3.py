@@ -1,12 +1,14 @@
+import os
 import sys
-from PySide6.QtWidgets import QApplication, QWidget
+from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QPainter, QPen, QColor, QFont, QRadialGradient, QLinearGradient
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF, QLineF
-from math import cos, sin, pi, exp, sqrt
-import random
+from PySide6.QtCore import Qt, QPointF, QRectF, QLineF
+from math import cos, sin, pi, exp, sqrt, degrees
 import string
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from quantumui import AnimatedWidget, LayerCompositor, glitch_text, glyph_atlas, path_cache, text_cache
 
-class EnhancedMatrixAssistant(QWidget):
+class EnhancedMatrixAssistant(AnimatedWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Enhanced Matrix Interface")
@@ -14,6 +16,9 @@ class EnhancedMatrixAssistant(QWidget):
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.setWindowFlags(Qt.FramelessWindowHint)
         
+        # Parâmetros de qualidade, do nível mais caro ao mais leve
+        self.quality.declare(lightning_bolts=(5, 3, 1), antialiasing=(True, True, False))
+        
         # Caracteres Matrix
         self.matrix_chars = []
         self.generate_matrix_chars()
@@ -22,25 +27,31 @@ class EnhancedMatrixAssistant(QWidget):
         self.is_listening = False
         self.time = 0
         self.pulse = 0
+        self.roll_glitches()
         
         # Raios
         self.lightning_bolts = []
         self.generate_lightning_bolts()
         
+        # Camadas independentes, pintadas em paralelo e compostas na ordem
+        self.compositor = LayerCompositor(self)
+        self.compositor.add('matrix', lambda painter, width, height: self.draw_matrix_rain(painter))
+        self.compositor.add('energy', self.paint_energy)
+        self.compositor.add('interface', self.paint_interface,
+                            bounds=lambda width, height: QRectF(width/2 - 220, height/2 - 60, 440, 160))
+        
         # Timer para animação
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(30)
+        self.start_animation(30)
     
     def generate_matrix_chars(self):
         num_columns = 50
         for i in range(num_columns):
             column = {
-                'x': random.randint(0, self.width()),
-                'y': random.randint(-500, 0),
-                'speed': random.uniform(2, 5),
-                'chars': ''.join(random.choices(string.ascii_letters + string.digits, k=30)),
-                'opacity': random.randint(100, 255)
+                'x': self.random.randint(0, self.width()),
+                'y': self.random.randint(-500, 0),
+                'speed': self.random.uniform(2, 5),
+                'chars': ''.join(self.random.choices(string.ascii_letters + string.digits, k=30)),
+                'opacity': self.random.randint(100, 255)
             }
             self.matrix_chars.append(column)
     
@@ -48,10 +59,10 @@ class EnhancedMatrixAssistant(QWidget):
         num_bolts = 5
         for _ in range(num_bolts):
             bolt = {
-                'start': QPointF(random.randint(0, self.width()), 0),
-                'end': QPointF(random.randint(0, self.width()), self.height()),
+                'start': QPointF(self.random.randint(0, self.width()), 0),
+                'end': QPointF(self.random.randint(0, self.width()), self.height()),
                 'segments': [],
-                'lifetime': random.randint(10, 30),
+                'lifetime': self.random.randint(10, 30),
                 'alpha': 255
             }
             self.generate_bolt_segments(bolt)
@@ -64,8 +75,8 @@ class EnhancedMatrixAssistant(QWidget):
         segments.append(start)
         
         while start.y() < end.y():
-            next_x = start.x() + random.uniform(-50, 50)
-            next_y = start.y() + random.uniform(20, 60)
+            next_x = start.x() + self.random.uniform(-50, 50)
+            next_y = start.y() + self.random.uniform(20, 60)
             next_point = QPointF(next_x, next_y)
             segments.append(next_point)
             start = next_point
@@ -81,9 +92,9 @@ class EnhancedMatrixAssistant(QWidget):
         for column in self.matrix_chars:
             column['y'] += column['speed']
             if column['y'] > self.height():
-                column['y'] = random.randint(-500, 0)
-                column['chars'] = ''.join(random.choices(string.ascii_letters + string.digits, k=30))
-                column['opacity'] = random.randint(100, 255)
+                column['y'] = self.random.randint(-500, 0)
+                column['chars'] = ''.join(self.random.choices(string.ascii_letters + string.digits, k=30))
+                column['opacity'] = self.random.randint(100, 255)
         
         # Atualizar raios
         for bolt in self.lightning_bolts:
@@ -93,66 +104,77 @@ class EnhancedMatrixAssistant(QWidget):
             if bolt['lifetime'] <= 0 or bolt['alpha'] <= 0:
                 self.lightning_bolts.remove(bolt)
                 new_bolt = {
-                    'start': QPointF(random.randint(0, self.width()), 0),
-                    'end': QPointF(random.randint(0, self.width()), self.height()),
+                    'start': QPointF(self.random.randint(0, self.width()), 0),
+                    'end': QPointF(self.random.randint(0, self.width()), self.height()),
                     'segments': [],
-                    'lifetime': random.randint(10, 30),
+                    'lifetime': self.random.randint(10, 30),
                     'alpha': 255
                 }
                 self.generate_bolt_segments(new_bolt)
                 self.lightning_bolts.append(new_bolt)
         
-        self.update()
+        self.roll_glitches()
+    
+    def roll_glitches(self):
+        # Glitches sorteados no passo: repintar o mesmo quadro não os muda
+        self.glitch_offsets = [self.cosmetic.uniform(-2, 2) for i in range(5)]
+        status = "SCANNING..." if self.is_listening else "PROCESSING..."
+        self.status_text = glitch_text(status, self.cosmetic, 0.1,  # 10% de chance de glitch
+                                       string.ascii_uppercase + string.digits)
+    
+    def paint_background(self, painter, width, height):
+        gradient = QRadialGradient(width / 2, height / 2, 500)
+        gradient.setColorAt(0, QColor(0, 20, 0, 30))
+        gradient.setColorAt(1, QColor(0, 0, 0, 0))
+        painter.fillRect(0, 0, width, height, gradient)
     
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.Antialiasing, self.quality['antialiasing'])
         
         # Fundo escuro com gradiente
-        gradient = QRadialGradient(self.width()/2, self.height()/2, 500)
-        gradient.setColorAt(0, QColor(0, 20, 0, 30))
-        gradient.setColorAt(1, QColor(0, 0, 0, 0))
-        painter.fillRect(0, 0, self.width(), self.height(), gradient)
+        self.draw_layer(painter, 'background', self.paint_background)
         
-        # Desenhar caracteres Matrix
-        self.draw_matrix_rain(painter)
-        
-        # Desenhar raios
+        # Caracteres Matrix, raios, hexágonos e textos
+        self.compositor.render(painter)
+    
+    def paint_energy(self, painter, width, height):
+        # Raios e hexágonos juntos: os pontos dos hexágonos usam o pincel do último raio
         self.draw_lightning(painter)
         
         # Círculo central
-        center_x = self.width() / 2
-        center_y = self.height() / 2
+        center_x = width / 2
+        center_y = height / 2
         
         # Hexágonos concêntricos
         for i in range(5):
             self.draw_hexagon(painter, center_x, center_y, 100 + i * 30,
                             self.time + i * pi/3)
+    
+    def paint_interface(self, painter, width, height):
+        center_x = width / 2
+        center_y = height / 2
         
         # Texto central com efeito digital
         self.draw_digital_text(painter, center_x, center_y)
         
         # Status com efeito digital
-        status = "SCANNING..." if self.is_listening else "PROCESSING..."
-        self.draw_status_text(painter, center_x, center_y + 80, status)
+        self.draw_status_text(painter, center_x, center_y + 80, self.status_text)
     
     def draw_matrix_rain(self, painter):
-        font = QFont("Courier New", 14)
-        painter.setFont(font)
+        # Cada coluna vira uma única cópia do atlas de glifos
+        atlas = glyph_atlas("Courier New", 14, string.ascii_letters + string.digits,
+                            self.devicePixelRatioF())
         
         for column in self.matrix_chars:
             x, y = column['x'], column['y']
             chars = column['chars']
-            for i, char in enumerate(chars):
-                opacity = max(0, column['opacity'] - i * 8)
-                color = QColor(0, 255, 0, opacity)
-                if i == 0:  # Primeiro caractere mais brilhante
-                    color = QColor(200, 255, 200, opacity)
-                painter.setPen(color)
-                painter.drawText(QPointF(x, y + i * 20), char)
+            colors = [(0, 255, 0, max(0, column['opacity'] - i * 8)) for i in range(len(chars))]
+            colors[0] = (200, 255, 200, colors[0][3])  # Primeiro caractere mais brilhante
+            atlas.draw_column(painter, x, y, chars, colors, 20)
     
     def draw_lightning(self, painter):
-        for bolt in self.lightning_bolts:
+        for bolt in self.lightning_bolts[:self.quality['lightning_bolts']]:
             pen = QPen(QColor(200, 255, 255, bolt['alpha']))
             pen.setWidth(2)
             painter.setPen(pen)
@@ -170,34 +192,33 @@ class EnhancedMatrixAssistant(QWidget):
             painter.drawEllipse(bolt['segments'][-1], 20, 20)
     
     def draw_hexagon(self, painter, cx, cy, size, rotation):
-        points = []
-        for i in range(6):
-            angle = rotation + i * pi / 3
-            x = cx + size * cos(angle)
-            y = cy + size * sin(angle)
-            points.append(QPointF(x, y))
+        # Contorno e pontos vêm prontos do cache; só a transformação muda
+        dpr = self.devicePixelRatioF()
+        outline = path_cache.path('polygon', size, 6, dpr)
+        dots = path_cache.path(('vertex_dots', 3), size, 6, dpr)
         
         # Desenhar linhas do hexágono
         pen = QPen(QColor(0, 255, 0, 100))
         pen.setWidth(2)
         painter.setPen(pen)
         
-        for i in range(6):
-            j = (i + 1) % 6
-            painter.drawLine(points[i], points[j])
+        painter.save()
+        painter.translate(cx, cy)
+        painter.rotate(degrees(rotation))
+        painter.strokePath(outline, pen)
         
         # Pontos nos vértices
-        for point in points:
-            painter.drawEllipse(point, 3, 3)
+        painter.drawPath(dots)
+        painter.restore()
     
     def draw_digital_text(self, painter, cx, cy):
         text = "Gysin-IA"
-        font = QFont("Courier New", 50, QFont.Bold)
+        font = text_cache.font("Courier New", 50, QFont.Bold)
         painter.setFont(font)
         
         # Efeito de glitch
-        for i in range(5):
-            offset = random.uniform(-2, 2) * sin(self.pulse)
+        for i, glitch in enumerate(self.glitch_offsets):
+            offset = glitch * sin(self.pulse)
             opacity = int(200 + 55 * sin(self.pulse + i))
             painter.setPen(QColor(0, 255, 0, opacity))
             painter.drawText(QRectF(cx-200, cy-35+offset, 400, 70),
@@ -209,16 +230,11 @@ class EnhancedMatrixAssistant(QWidget):
                         Qt.AlignCenter, text)
     
     def draw_status_text(self, painter, cx, cy, text):
-        font = QFont("Courier New", 16)
+        font = text_cache.font("Courier New", 16)
         painter.setFont(font)
         
         # Efeito de digitalização
-        for i in range(len(text)):
-            if random.random() < 0.1:  # 10% de chance de glitch
-                char = random.choice(string.ascii_uppercase + string.digits)
-            else:
-                char = text[i]
-            
+        for i, char in enumerate(text):
             x = cx - len(text)*7 + i*14
             y = cy
             
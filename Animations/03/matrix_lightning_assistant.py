@@ -1,12 +1,14 @@
+import os
 import sys
-from PySide6.QtWidgets import QApplication, QWidget
+from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QPainter, QPen, QColor, QFont, QRadialGradient, QPainterPath
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF
-from math import cos, sin, pi, exp, sqrt
-import random
+from PySide6.QtCore import Qt, QPointF, QRectF
+from math import cos, sin, pi, exp, sqrt, degrees
 import string
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from quantumui import AnimatedWidget, LayerCompositor, glitch_text, glyph_atlas, path_cache, text_cache
 
-class LightningMatrixAssistant(QWidget):
+class LightningMatrixAssistant(AnimatedWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Lightning Matrix Interface")
@@ -14,6 +16,9 @@ class LightningMatrixAssistant(QWidget):
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.setWindowFlags(Qt.FramelessWindowHint)
         
+        # Parâmetros de qualidade, do nível mais caro ao mais leve
+        self.quality.declare(lightning_bolts=(3, 2, 1), antialiasing=(True, True, False))
+        
         # Caracteres Matrix
         self.matrix_chars = []
         self.generate_matrix_chars()
@@ -27,29 +32,37 @@ class LightningMatrixAssistant(QWidget):
         self.time = 0
         self.pulse = 0
         self.energy_level = 0
+        self.roll_glitches()
+        
+        # Camadas independentes, pintadas em paralelo e compostas na ordem
+        self.compositor = LayerCompositor(self)
+        self.compositor.add('matrix', lambda painter, width, height: self.draw_matrix_effect(painter))
+        self.compositor.add('core', self.paint_core,
+                            bounds=lambda width, height: QRectF(width/2 - 225, height/2 - 225, 450, 450))
+        self.compositor.add('lightning', lambda painter, width, height: self.draw_lightning_bolts(painter))
+        self.compositor.add('interface', self.paint_interface,
+                            bounds=lambda width, height: QRectF(width/2 - 200, height/2 - 60, 400, 160))
         
         # Timer para animação
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(30)
+        self.start_animation(30)
     
     def generate_matrix_chars(self):
         num_columns = 40  # Aumentado para mais densidade
         for i in range(num_columns):
             column = {
-                'x': random.randint(0, self.width()),
-                'y': random.randint(-500, 0),
-                'speed': random.uniform(2, 6),
-                'chars': ''.join(random.choices(string.ascii_letters + string.digits, k=25)),
-                'opacity': random.randint(100, 255)
+                'x': self.random.randint(0, self.width()),
+                'y': self.random.randint(-500, 0),
+                'speed': self.random.uniform(2, 6),
+                'chars': ''.join(self.random.choices(string.ascii_letters + string.digits, k=25)),
+                'opacity': self.random.randint(100, 255)
             }
             self.matrix_chars.append(column)
     
     def generate_lightning(self):
-        if len(self.lightning_bolts) < 3 and random.random() < 0.1:
-            start = QPointF(random.randint(0, self.width()), 0)
-            end = QPointF(self.width()/2 + random.randint(-100, 100),
-                         self.height()/2 + random.randint(-100, 100))
+        if len(self.lightning_bolts) < self.quality['lightning_bolts'] and self.random.random() < 0.1:
+            start = QPointF(self.random.randint(0, self.width()), 0)
+            end = QPointF(self.width()/2 + self.random.randint(-100, 100),
+                         self.height()/2 + self.random.randint(-100, 100))
             segments = self.create_lightning_path(start, end)
             self.lightning_bolts.append({
                 'segments': segments,
@@ -64,8 +77,8 @@ class LightningMatrixAssistant(QWidget):
         
         while current.y() < target.y():
             next_point = QPointF(
-                current.x() + random.uniform(-30, 30),
-                current.y() + random.uniform(20, 40)
+                current.x() + self.random.uniform(-30, 30),
+                current.y() + self.random.uniform(20, 40)
             )
             segments.append((current, next_point))
             current = next_point
@@ -82,9 +95,9 @@ class LightningMatrixAssistant(QWidget):
         for column in self.matrix_chars:
             column['y'] += column['speed']
             if column['y'] > self.height():
-                column['y'] = random.randint(-500, 0)
-                column['chars'] = ''.join(random.choices(string.ascii_letters + string.digits, k=25))
-                column['opacity'] = random.randint(100, 255)
+                column['y'] = self.random.randint(-500, 0)
+                column['chars'] = ''.join(self.random.choices(string.ascii_letters + string.digits, k=25))
+                column['opacity'] = self.random.randint(100, 255)
         
         # Gerar e atualizar raios
         self.generate_lightning()
@@ -96,34 +109,48 @@ class LightningMatrixAssistant(QWidget):
             if bolt['life'] <= 0:
                 self.lightning_bolts.remove(bolt)
         
-        self.update()
+        self.roll_glitches()
     
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Fundo com gradiente mais elaborado
-        gradient = QRadialGradient(self.width()/2, self.height()/2, 400)
+    def roll_glitches(self):
+        # Glitches sorteados no passo: repintar o mesmo quadro não os muda
+        self.title_glitches = []
+        for i in range(5):
+            offset = self.cosmetic.uniform(-2, 2)
+            self.title_glitches.append((offset, self.cosmetic.random() < 0.1))  # Chance de cor diferente
+        status = "SCANNING..." if self.is_listening else "PROCESSING..."
+        self.status_text = glitch_text(status, self.cosmetic, 0.1, string.ascii_uppercase + string.digits)
+    
+    def paint_background(self, painter, width, height):
+        gradient = QRadialGradient(width / 2, height / 2, 400)
         gradient.setColorAt(0, QColor(0, 30, 30, 40))
         gradient.setColorAt(0.5, QColor(0, 20, 20, 30))
         gradient.setColorAt(1, QColor(0, 0, 0, 20))
-        painter.fillRect(0, 0, self.width(), self.height(), gradient)
+        painter.fillRect(0, 0, width, height, gradient)
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing, self.quality['antialiasing'])
         
-        # Desenhar caracteres Matrix
-        self.draw_matrix_effect(painter)
+        # Fundo com gradiente mais elaborado
+        self.draw_layer(painter, 'background', self.paint_background)
         
-        # Desenhar efeitos centrais
-        center_x = self.width() / 2
-        center_y = self.height() / 2
+        # Caracteres Matrix, efeitos centrais, raios e interface
+        self.compositor.render(painter)
+    
+    def paint_core(self, painter, width, height):
+        # Círculos e hexágonos juntos: os pontos dos hexágonos usam o pincel dos círculos
+        center_x = width / 2
+        center_y = height / 2
         
         # Círculos de energia
         self.draw_energy_circles(painter, center_x, center_y)
         
         # Hexágonos giratórios
         self.draw_rotating_hexagons(painter, center_x, center_y)
-        
-        # Raios
-        self.draw_lightning_bolts(painter)
+    
+    def paint_interface(self, painter, width, height):
+        center_x = width / 2
+        center_y = height / 2
         
         # Interface central
         self.draw_central_interface(painter, center_x, center_y)
@@ -132,19 +159,16 @@ class LightningMatrixAssistant(QWidget):
         self.draw_enhanced_status(painter, center_x, center_y)
     
     def draw_matrix_effect(self, painter):
-        font = QFont("Courier New", 14)
-        painter.setFont(font)
+        # Cada coluna vira uma única cópia do atlas de glifos
+        atlas = glyph_atlas("Courier New", 14, string.ascii_letters + string.digits,
+                            self.devicePixelRatioF())
         
         for column in self.matrix_chars:
             x, y = column['x'], column['y']
             chars = column['chars']
-            for i, char in enumerate(chars):
-                opacity = max(0, column['opacity'] - i * 10)
-                color = QColor(0, 255, 0, opacity)
-                if i == 0:
-                    color = QColor(200, 255, 200, opacity)
-                painter.setPen(color)
-                painter.drawText(QPointF(x, y + i * 20), char)
+            colors = [(0, 255, 0, max(0, column['opacity'] - i * 10)) for i in range(len(chars))]
+            colors[0] = (200, 255, 200, colors[0][3])  # Primeiro caractere mais brilhante
+            atlas.draw_column(painter, x, y, chars, colors, 20)
     
     def draw_energy_circles(self, painter, cx, cy):
         for i in range(3):
@@ -158,24 +182,22 @@ class LightningMatrixAssistant(QWidget):
             painter.drawEllipse(QPointF(cx, cy), radius, radius)
     
     def draw_rotating_hexagons(self, painter, cx, cy):
+        dpr = self.devicePixelRatioF()
         for i in range(3):
             size = 100 + i * 30
             rotation = self.time + i * pi/3
-            points = []
-            for j in range(6):
-                angle = rotation + j * pi / 3
-                x = cx + size * cos(angle)
-                y = cy + size * sin(angle)
-                points.append(QPointF(x, y))
             
             pen = QPen(QColor(0, 255, 0, 100))
             pen.setWidth(2)
             painter.setPen(pen)
             
-            for j in range(6):
-                next_j = (j + 1) % 6
-                painter.drawLine(points[j], points[next_j])
-                painter.drawEllipse(points[j], 3, 3)
+            # Hexágono pronto do cache, girado pela transformação
+            painter.save()
+            painter.translate(cx, cy)
+            painter.rotate(degrees(rotation))
+            painter.strokePath(path_cache.path('polygon', size, 6, dpr), pen)
+            painter.drawPath(path_cache.path(('vertex_dots', 3), size, 6, dpr))
+            painter.restore()
     
     def draw_lightning_bolts(self, painter):
         for bolt in self.lightning_bolts:
@@ -195,22 +217,22 @@ class LightningMatrixAssistant(QWidget):
     def draw_central_interface(self, painter, cx, cy):
         # Texto principal com efeito de glitch
         text = "Gysin-IA"
-        font = QFont("Courier New", 40, QFont.Bold)
+        font = text_cache.font("Courier New", 40, QFont.Bold)
         painter.setFont(font)
         
-        for i in range(5):
-            offset = random.uniform(-2, 2) * sin(self.pulse)
+        for i, (glitch, cyan) in enumerate(self.title_glitches):
+            offset = glitch * sin(self.pulse)
             opacity = int(200 + 55 * sin(self.pulse + i))
             color = QColor(0, 255, 0, opacity)
-            if random.random() < 0.1:  # Chance de cor diferente
+            if cyan:
                 color = QColor(0, 255, 255, opacity)
             painter.setPen(color)
             painter.drawText(QRectF(cx-150, cy-25+offset, 300, 50),
                            Qt.AlignCenter, text)
     
     def draw_enhanced_status(self, painter, cx, cy):
-        status = "SCANNING..." if self.is_listening else "PROCESSING..."
-        font = QFont("Courier New", 12)
+        status = self.status_text
+        font = text_cache.font("Courier New", 12)
         painter.setFont(font)
         
         # Barra de energia
@@ -226,12 +248,7 @@ class LightningMatrixAssistant(QWidget):
         painter.drawRect(cx - bar_width/2, cy + 70, energy_width, bar_height)
         
         # Status text com efeito digital
-        for i in range(len(status)):
-            if random.random() < 0.1:
-                char = random.choice(string.ascii_uppercase + string.digits)
-            else:
-                char = status[i]
-            
+        for i, char in enumerate(status):
             x = cx - len(status)*5 + i*10
             y = cy + 50
             
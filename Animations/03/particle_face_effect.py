@@ -1,12 +1,17 @@
+import os
 import sys
-from PySide6.QtWidgets import QApplication, QWidget
+from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QPainter, QPen, QColor, QFont, QRadialGradient, QPainterPath, QLinearGradient
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF
+from PySide6.QtCore import Qt, QPointF, QRectF
 from math import cos, sin, pi, sqrt, exp, pow
-import random
+import numpy as np
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from quantumui import AnimatedWidget, NeighborList, ParticleSystem, PrimitiveBatch
 
-class GridFaceWidget(QWidget):
-    def __init__(self):
+class GridFaceWidget(AnimatedWidget):
+    MAX_DIST = 30  # Distância máxima para conectar pontos
+    
+    def __init__(self, resolution=30):
         super().__init__()
         self.setWindowTitle("Grid Face")
         self.showFullScreen()
@@ -17,13 +22,13 @@ class GridFaceWidget(QWidget):
         self.color = QColor(0, 150, 255)  # Azul brilhante
         
         # Grade
-        self.grid_points = []
+        self.resolution = resolution  # Número de pontos em cada direção
+        self.grid_points = None
+        self.links = None
         self.initialize_grid()
         
         # Timer para animação suave dos pontos
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(50)
+        self.start_animation(50)
         
         self.time = 0
     
@@ -49,8 +54,9 @@ class GridFaceWidget(QWidget):
     
     def initialize_grid(self):
         # Criar grade uniforme
-        resolution = 30  # Número de pontos em cada direção
+        resolution = self.resolution
         
+        origins = []
         for i in range(resolution):
             for j in range(resolution):
                 u = i / (resolution - 1)
@@ -58,21 +64,27 @@ class GridFaceWidget(QWidget):
                 
                 x, y = self.create_oval_point(u, v)
                 if x is not None:
-                    self.grid_points.append({
-                        'x': x,
-                        'y': y,
-                        'orig_x': x,
-                        'orig_y': y,
-                        'phase': random.uniform(0, 2*pi)
-                    })
+                    origins.append((x, y))
+        
+        points = ParticleSystem(len(origins), extra=('orig_x', 'orig_y'), rng=self.streams.numpy())
+        points.orig_x, points.orig_y = np.array(origins).T.copy()
+        points.x = points.orig_x.copy()
+        points.y = points.orig_y.copy()
+        points.phase = points.uniform(0, 2*pi)
+        self.grid_points = points
+        
+        # Pares candidatos calculados uma vez sobre as posições originais: os
+        # pontos só oscilam 1px em torno delas, bem dentro da folga
+        self.links = NeighborList(self.MAX_DIST, skin=6)
+        self.links.update(points.orig_x, points.orig_y)
     
     def update_animation(self):
         self.time += 0.05
-        for point in self.grid_points:
-            # Movimento muito sutil dos pontos
-            point['x'] = point['orig_x'] + cos(self.time + point['phase']) * 1
-            point['y'] = point['orig_y'] + sin(self.time + point['phase']) * 1
-        self.update()
+        points = self.grid_points
+        # Movimento muito sutil dos pontos
+        points.x = points.orig_x + np.cos(self.time + points.phase) * 1
+        points.y = points.orig_y + np.sin(self.time + points.phase) * 1
+        self.links.update(points.x, points.y)
     
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -81,37 +93,29 @@ class GridFaceWidget(QWidget):
         # Centralizar na janela
         painter.translate(self.width() / 2, self.height() / 2)
         
-        # Desenhar linhas entre pontos próximos
-        max_dist = 30  # Distância máxima para conectar pontos
+        # Desenhar linhas entre pontos próximos (só os pares candidatos)
+        xs, ys = self.grid_points.x, self.grid_points.y
+        links = self.links
         
-        # Primeiro, desenhar todas as linhas
-        pen = QPen(self.color)
-        pen.setWidth(1)
-        painter.setPen(pen)
+        # Primeiro, desenhar todas as linhas (agrupadas por opacidade)
+        batch = PrimitiveBatch()
+        opacities = (255 * (1 - links.distance / self.MAX_DIST)).astype(int)
+        batch.add_lines(xs[links.first], ys[links.first], xs[links.second], ys[links.second],
+                        (0, 150, 255, opacities))
+        batch.flush(painter)
         
-        for i, p1 in enumerate(self.grid_points):
-            for p2 in self.grid_points[i+1:]:
-                dx = p1['x'] - p2['x']
-                dy = p1['y'] - p2['y']
-                dist = sqrt(dx*dx + dy*dy)
-                
-                if dist < max_dist:
-                    opacity = int(255 * (1 - dist/max_dist))
-                    pen.setColor(QColor(0, 150, 255, opacity))
-                    painter.setPen(pen)
-                    painter.drawLine(QPointF(p1['x'], p1['y']), 
-                                   QPointF(p2['x'], p2['y']))
+        points = zip(xs.tolist(), ys.tolist())
         
         # Depois, desenhar os pontos por cima
-        for point in self.grid_points:
+        for x, y in points:
             # Brilho do ponto
-            glow = QRadialGradient(point['x'], point['y'], 4)
+            glow = QRadialGradient(x, y, 4)
             glow.setColorAt(0, QColor(0, 150, 255, 200))
             glow.setColorAt(1, QColor(0, 150, 255, 0))
             
             painter.setBrush(glow)
             painter.setPen(Qt.NoPen)
-            painter.drawEllipse(QPointF(point['x'], point['y']), 2, 2)
+            painter.drawEllipse(QPointF(x, y), 2, 2)
     
     def mousePressEvent(self, event):
         if event.button() == Qt.RightButton:
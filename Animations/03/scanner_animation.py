@@ -1,10 +1,13 @@
+import os
 import sys
-from PySide6.QtWidgets import QApplication, QWidget
+from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QPainter, QPen, QColor, QFont, QRadialGradient
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF
+from PySide6.QtCore import Qt, QPointF, QRectF
 from math import cos, sin, pi, sqrt
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from quantumui import AnimatedWidget, text_cache
 
-class ScannerWidget(QWidget):
+class ScannerWidget(AnimatedWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Scanner Holográfico")
@@ -16,15 +19,12 @@ class ScannerWidget(QWidget):
         self.wave_offset = 0
         self.scan_line = 0
         
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(30)
+        self.start_animation(30)
     
     def update_animation(self):
         self.scan_angle = (self.scan_angle + 4) % 360
         self.wave_offset = (self.wave_offset + 0.2) % (2 * pi)
         self.scan_line = (self.scan_line + 2) % 200
-        self.update()
     
     def draw_scan_line(self, painter, start_x, start_y, end_x, end_y):
         gradient = QRadialGradient(start_x, start_y, 200)
@@ -116,7 +116,7 @@ class ScannerWidget(QWidget):
         painter.drawRect(-300, self.scan_line - 100, 600, 5)
         
         # Texto central com efeito de escaneamento
-        font = QFont("Arial", 30, QFont.Bold)
+        font = text_cache.font("Arial", 30, QFont.Bold)
         painter.setFont(font)
         
         scan_height = 40
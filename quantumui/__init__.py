@@ -0,0 +1,52 @@
+from .batch import PrimitiveBatch, glow_sprite
+from .clock import FrameClock
+from .compositor import LayerCompositor, layer_pool
+from .geometry import draw_lines, draw_points, draw_polyline, to_polygon
+from .glyphs import GlyphAtlas, glyph_atlas
+from .layers import LayerCache
+from .paint import PaintPool, paint_pool
+from .particles import ParticleSystem
+from .paths import PathCache, path_cache
+from .polar import angular_basis, polar_points, polar_polygon
+from .profiling import StageProfiler, profiler
+from .quality import QualityGovernor
+from .rng import RandomPool, RandomStreams, glitch_text
+from .scheduler import RenderScheduler
+from .spatial import NeighborList, grid_pairs
+from .text import TextCache, text_cache
+from .widget import AnimatedWidget
+
+__all__ = [
+    'AnimatedWidget',
+    'FrameClock',
+    'GlyphAtlas',
+    'LayerCache',
+    'LayerCompositor',
+    'NeighborList',
+    'PaintPool',
+    'ParticleSystem',
+    'PathCache',
+    'PrimitiveBatch',
+    'QualityGovernor',
+    'RandomPool',
+    'RandomStreams',
+    'RenderScheduler',
+    'StageProfiler',
+    'TextCache',
+    'angular_basis',
+    'draw_lines',
+    'draw_points',
+    'draw_polyline',
+    'glitch_text',
+    'glow_sprite',
+    'glyph_atlas',
+    'grid_pairs',
+    'layer_pool',
+    'paint_pool',
+    'path_cache',
+    'polar_points',
+    'polar_polygon',
+    'profiler',
+    'text_cache',
+    'to_polygon',
+]
@@ -0,0 +1,149 @@
+from functools import lru_cache
+
+import numpy as np
+from PySide6.QtCore import Qt, QLineF, QPointF, QRectF
+from PySide6.QtGui import QColor, QPainter, QPainterPath, QPen, QPixmap, QRadialGradient
+
+from .geometry import array_polygon
+
+
+def quantize_alpha(alpha, step):
+    return min(255, max(0, int(round(alpha / step)) * step))
+
+
+@lru_cache(maxsize=64)
+def glow_sprite(red, green, blue, alpha, radius, dpr=1.0):
+    """Brilho radial (cor -> transparente) pré-renderizado, para copiar em lote."""
+    size = 2 * radius
+    pixmap = QPixmap(max(1, round(size * dpr)), max(1, round(size * dpr)))
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(Qt.transparent)
+
+    gradient = QRadialGradient(radius, radius, radius)
+    gradient.setColorAt(0, QColor(red, green, blue, alpha))
+    gradient.setColorAt(1, QColor(0, 0, 0, 0))
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(gradient)
+    painter.drawEllipse(QRectF(0, 0, size, size))
+    painter.end()
+    return pixmap
+
+
+class PrimitiveBatch:
+    """Coleta as primitivas de um quadro e as envia agrupadas por estado.
+
+    Cores são tuplas ``(r, g, b, a)``; o alfa é quantizado em passos de
+    ``alpha_step`` para que elementos quase iguais caiam no mesmo balde.
+    Cada balde vira uma única chamada ao Qt (um caminho preenchido,
+    ``drawLines``, ``drawPoints`` ou ``drawRects``). Os baldes são desenhados
+    na ordem em que apareceram; chame ``flush`` entre camadas que precisam
+    ficar uma sobre a outra.
+
+    Elipses do mesmo balde viram um único caminho: onde duas se sobrepõem a
+    cor não é misturada duas vezes.
+
+    ``add_lines`` e ``add_points`` recebem arrays NumPy inteiros; o alfa da
+    cor pode ser um array com um valor por elemento. A geometria vai para o
+    Qt sem passar por um objeto Python por vértice.
+    """
+
+    def __init__(self, alpha_step=4):
+        self.alpha_step = alpha_step
+        self.buckets = {}
+
+    def bucket(self, kind, key, factory):
+        bucket = self.buckets.get((kind, key))
+        if bucket is None:
+            bucket = self.buckets[(kind, key)] = factory()
+        return bucket
+
+    def color_key(self, color):
+        red, green, blue, alpha = color
+        return red, green, blue, quantize_alpha(alpha, self.alpha_step)
+
+    def add_ellipse(self, x, y, rx, ry, color):
+        path = self.bucket('fill', self.color_key(color), self.new_path)
+        path.addEllipse(QPointF(x, y), rx, ry)
+
+    def add_rect(self, x, y, width, height, color):
+        self.bucket('rect', self.color_key(color), list).append(QRectF(x, y, width, height))
+
+    def add_line(self, x1, y1, x2, y2, color, width=1):
+        key = self.color_key(color) + (width,)
+        self.bucket('line', key, list).append(QLineF(x1, y1, x2, y2))
+
+    def add_point(self, x, y, color, width=1):
+        key = self.color_key(color) + (width,)
+        self.bucket('point', key, list).append(QPointF(x, y))
+
+    def add_lines(self, x1, y1, x2, y2, color, width=1):
+        segments = np.column_stack((x1, y1, x2, y2))
+        for key, index in self.split_alpha(color):
+            self.bucket('lines', key + (width,), list).append(segments[index])
+
+    def add_points(self, x, y, color, width=1):
+        points = np.column_stack((x, y))
+        for key, index in self.split_alpha(color):
+            self.bucket('points', key + (width,), list).append(points[index])
+
+    def split_alpha(self, color):
+        # Agrupa os elementos pelo alfa quantizado, na ordem em que aparecem
+        red, green, blue, alpha = color
+        if np.ndim(alpha) == 0:
+            yield self.color_key(color), slice(None)
+            return
+        alpha = np.clip(np.rint(np.asarray(alpha) / self.alpha_step) * self.alpha_step, 0, 255)
+        alpha = alpha.astype(int)
+        values, first = np.unique(alpha, return_index=True)
+        for value in values[np.argsort(first)].tolist():
+            yield (red, green, blue, value), np.flatnonzero(alpha == value)
+
+    def add_sprite(self, pixmap, x, y, scale=1.0, opacity=1.0):
+        # Sprites centralizados em (x, y); a opacidade também é quantizada
+        alpha = quantize_alpha(opacity * 255, self.alpha_step)
+        if not alpha:
+            return
+        bucket = self.bucket('sprite', (pixmap.cacheKey(), alpha), lambda: (pixmap, []))
+        width = pixmap.width() / pixmap.devicePixelRatio() * scale
+        height = pixmap.height() / pixmap.devicePixelRatio() * scale
+        bucket[1].append(QRectF(x - width / 2, y - height / 2, width, height))
+
+    @staticmethod
+    def new_path():
+        path = QPainterPath()
+        path.setFillRule(Qt.WindingFill)
+        return path
+
+    def flush(self, painter):
+        if not self.buckets:
+            return
+        painter.save()
+        opacity = painter.opacity()
+        for (kind, key), items in self.buckets.items():
+            if kind == 'fill':
+                painter.fillPath(items, QColor(*key))
+            elif kind == 'rect':
+                painter.setPen(Qt.NoPen)
+                painter.setBrush(QColor(*key))
+                painter.drawRects(items)
+            elif kind in ('line', 'point', 'lines', 'points'):
+                pen = QPen(QColor(*key[:4]))
+                pen.setWidthF(key[4])
+                painter.setPen(pen)
+                if kind in ('lines', 'points'):
+                    items = array_polygon(np.concatenate(items))
+                if kind.startswith('line'):
+                    painter.drawLines(items)
+                else:
+                    painter.drawPoints(items)
+            else:
+                pixmap, targets = items
+                painter.setOpacity(opacity * key[1] / 255)
+                painter.setRenderHint(QPainter.SmoothPixmapTransform)
+                source = QRectF(pixmap.rect())
+                for target in targets:
+                    painter.drawPixmap(target, pixmap, source)
+        painter.restore()
+        self.buckets.clear()
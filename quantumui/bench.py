@@ -0,0 +1,183 @@
+"""Benchmark de tempo de quadro de todas as animações.
+
+Cada resolução roda em um processo separado (a tela virtual do offscreen
+tem o tamanho da resolução). O resultado é um JSON que pode ser comparado
+entre commits::
+
+    python -m quantumui.bench --out bench.json
+    python -m quantumui.bench --out novo.json --compare bench.json
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+
+from .catalog import ROOT
+from .harness import parse_size
+
+DEFAULT_SIZES = ['800x600', '1920x1080', '3840x2160']
+
+
+def percentile(values, p):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * p / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(values):
+    return {
+        'mean': sum(values) / len(values) if values else 0.0,
+        'p50': percentile(values, 50),
+        'p95': percentile(values, 95),
+        'p99': percentile(values, 99),
+        'max': max(values) if values else 0.0,
+    }
+
+
+def measure(entry, size, frames, warmup, fps):
+    from .catalog import load_widget_class
+    from .harness import render_frames
+
+    widget_cls = load_widget_class(entry['name'])
+    result = render_frames(widget_cls, size, fps, warmup + frames, keep_images=False)
+    result['widget'].deleteLater()
+
+    timings = result['timings'][warmup:]
+    update = [t['update_ms'] for t in timings]
+    paint = [t['paint_ms'] for t in timings]
+    frame = [u + p for u, p in zip(update, paint)]
+    steps = sum(t['steps'] for t in timings)
+    mean_frame = sum(frame) / len(frame)
+
+    return {
+        'paint_ms': summarize(paint),
+        'update_ms': summarize(update),
+        'step_ms': sum(update) / steps if steps else 0.0,
+        'frame_ms': summarize(frame),
+        'fps': 1000 / mean_frame if mean_frame else 0.0,
+    }
+
+
+def run_worker(args):
+    from .harness import ensure_offscreen_app
+    from .catalog import discover
+
+    size = parse_size(args.size)
+    ensure_offscreen_app(size)
+
+    results = {}
+    for entry in discover():
+        if args.only and not any(name in entry['name'] for name in args.only):
+            continue
+        try:
+            results[entry['name']] = measure(entry, size, args.frames, args.warmup, args.fps)
+        except Exception as error:
+            results[entry['name']] = {'error': f'{type(error).__name__}: {error}'}
+        print(f"  {args.size} {entry['name']}", file=sys.stderr)
+
+    json.dump(results, sys.stdout)
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True, cwd=ROOT).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(args):
+    from PySide6 import __version__ as pyside_version
+
+    report = {
+        'meta': {
+            'revision': git_revision(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'pyside6': pyside_version,
+            'machine': platform.machine(),
+            'frames': args.frames,
+            'warmup': args.warmup,
+            'fps': args.fps,
+            'sizes': args.sizes,
+        },
+        'results': {},
+    }
+
+    for size in args.sizes:
+        command = [sys.executable, '-m', 'quantumui.bench', '--worker', '--size', size,
+                   '--frames', str(args.frames), '--warmup', str(args.warmup),
+                   '--fps', str(args.fps)]
+        for name in args.only or []:
+            command += ['--only', name]
+        output = subprocess.run(command, stdout=subprocess.PIPE, check=True, text=True,
+                                cwd=ROOT).stdout
+        for name, stats in json.loads(output).items():
+            report['results'].setdefault(name, {})[size] = stats
+
+    return report
+
+
+def print_report(report):
+    print(f"{'animação':60s} {'tamanho':>10s} {'paint p50':>10s} {'p95':>8s} {'p99':>8s} {'fps':>7s}")
+    for name, sizes in report['results'].items():
+        for size, stats in sizes.items():
+            if 'error' in stats:
+                print(f"{name:60s} {size:>10s} {stats['error']}")
+                continue
+            paint = stats['paint_ms']
+            print(f"{name:60s} {size:>10s} {paint['p50']:10.2f} {paint['p95']:8.2f} "
+                  f"{paint['p99']:8.2f} {stats['fps']:7.1f}")
+
+
+def print_comparison(report, baseline):
+    print(f"{'animação':60s} {'tamanho':>10s} {'p50 antes':>10s} {'p50 agora':>10s} {'Δ%':>7s}")
+    for name, sizes in report['results'].items():
+        for size, stats in sizes.items():
+            old = baseline['results'].get(name, {}).get(size)
+            if not old or 'error' in old or 'error' in stats:
+                continue
+            before = old['frame_ms']['p50']
+            after = stats['frame_ms']['p50']
+            change = (after - before) / before * 100 if before else 0.0
+            print(f"{name:60s} {size:>10s} {before:10.2f} {after:10.2f} {change:+7.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de tempo de quadro das animações.")
+    parser.add_argument('--sizes', type=lambda text: text.split(','), default=DEFAULT_SIZES)
+    parser.add_argument('--frames', type=int, default=60)
+    parser.add_argument('--warmup', type=int, default=5)
+    parser.add_argument('--fps', type=float, default=60)
+    parser.add_argument('--only', action='append', help="filtra animações pelo nome (repetível)")
+    parser.add_argument('--out', help="arquivo JSON de saída")
+    parser.add_argument('--compare', help="JSON de uma execução anterior para comparar")
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--size', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        run_worker(args)
+        return
+
+    report = run_suite(args)
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as output:
+            json.dump(report, output, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as baseline:
+            print_comparison(report, json.load(baseline))
+    else:
+        print_report(report)
+
+
+if __name__ == '__main__':
+    main()
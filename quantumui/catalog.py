@@ -0,0 +1,106 @@
+import importlib.util
+import os
+import re
+import sys
+
+from .widget import AnimatedWidget
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Classes de primeiro nível: a linha "class Nome(Bases):" basta, sem AST
+CLASS_LINE = re.compile(r'^class\s+(\w+)\s*\(([^)]*)\)\s*:', re.MULTILINE)
+
+
+def module_name_for(path):
+    # Nome único por arquivo: há scripts repetidos em pastas diferentes
+    rel = os.path.relpath(os.path.abspath(path), ROOT)
+    stem = os.path.splitext(rel)[0]
+    return 'quantumui_scripts.' + ''.join(c if c.isalnum() else '_' for c in stem)
+
+
+def load_module(path):
+    name = module_name_for(path)
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
+
+def find_widget_classes(module):
+    return [
+        value for value in vars(module).values()
+        if isinstance(value, type)
+        and issubclass(value, AnimatedWidget)
+        and value is not AnimatedWidget
+        and value.__module__ == module.__name__
+    ]
+
+
+def load_widget_class(spec):
+    # Aceita "caminho/script.py" ou "caminho/script.py:NomeDaClasse"; o
+    # separador é o último ':' (caminhos do Windows começam com "C:")
+    path, _, class_name = spec.rpartition(':')
+    if not class_name.isidentifier():
+        path, class_name = spec, ''
+    if not os.path.exists(path):
+        path = os.path.join(ROOT, path)
+    module = load_module(path)
+    classes = find_widget_classes(module)
+    if class_name:
+        for cls in classes:
+            if cls.__name__ == class_name:
+                return cls
+        raise LookupError(f"{class_name} não encontrado em {path}")
+    if len(classes) != 1:
+        raise LookupError(f"{path} define {len(classes)} widgets; indique a classe com :Nome")
+    return classes[0]
+
+
+def script_paths():
+    paths = [os.path.join(ROOT, 'voxy_animation.py')]
+    animations = os.path.join(ROOT, 'Animations')
+    for group in sorted(os.listdir(animations)):
+        folder = os.path.join(animations, group)
+        if not os.path.isdir(folder):
+            continue
+        for filename in sorted(os.listdir(folder)):
+            if filename.endswith('.py'):
+                paths.append(os.path.join(folder, filename))
+    return paths
+
+
+def discover():
+    # Lê só o texto dos scripts para não importar (e executar) nenhum deles
+    entries = []
+    for path in script_paths():
+        with open(path, encoding='utf-8') as source:
+            text = source.read()
+        for match in CLASS_LINE.finditer(text):
+            bases = {base.strip().rpartition('.')[2] for base in match.group(2).split(',')}
+            if 'AnimatedWidget' in bases:
+                rel = os.path.relpath(path, ROOT).replace(os.sep, '/')
+                entries.append({
+                    'name': f'{rel}:{match.group(1)}',
+                    'path': path,
+                    'class_name': match.group(1),
+                })
+    return entries
+
+
+def find_entry(name, entries=None):
+    """Entrada do registro por nome completo, script ou só o nome da classe."""
+    entries = discover() if entries is None else entries
+    name = name.replace(os.sep, '/')
+    matches = [entry for entry in entries
+               if name in (entry['name'], entry['class_name'], entry['name'].partition(':')[0])]
+    if len(matches) != 1:
+        found = ', '.join(entry['name'] for entry in matches) or 'nenhuma'
+        raise LookupError(f"{name!r} deve indicar uma animação (encontradas: {found})")
+    return matches[0]
@@ -0,0 +1,59 @@
+import time
+
+
+class FrameClock:
+    """Relógio monotônico que converte tempo real em passos de simulação.
+
+    No modo de passo fixo cada passo corresponde a um tick original do
+    timer (16, 30, 50 ms...), então os incrementos escritos por tick nas
+    animações continuam valendo. Se frames forem perdidos, o tempo acumulado
+    é recuperado executando mais passos em vez de deixar a animação lenta.
+    """
+
+    def __init__(self, step, max_steps=8, variable_dt=False, time_source=time.perf_counter):
+        self.step = step
+        self.max_steps = max_steps
+        self.variable_dt = variable_dt
+        self.time_source = time_source
+
+        self.last_time = None
+        self.accumulator = 0.0
+        self.sim_time = 0.0
+        self.frame = 0
+
+    def start(self):
+        self.last_time = self.time_source()
+        self.accumulator = 0.0
+
+    def reset(self):
+        # Descarta o tempo pendente (ex.: ao retomar depois de uma pausa)
+        self.last_time = None
+        self.accumulator = 0.0
+
+    def tick(self):
+        now = self.time_source()
+        if self.last_time is None:
+            self.last_time = now
+            return []
+        elapsed = now - self.last_time
+        self.last_time = now
+        return self.advance(elapsed)
+
+    def advance(self, elapsed):
+        # Limita o tempo recuperado para evitar a "espiral da morte"
+        elapsed = min(max(elapsed, 0.0), self.step * self.max_steps)
+
+        if self.variable_dt:
+            if elapsed <= 0:
+                return []
+            self.sim_time += elapsed
+            self.frame += 1
+            return [elapsed]
+
+        self.accumulator += elapsed
+        # Tolerância para o jitter do timer não descartar um passo inteiro
+        steps = int((self.accumulator + 1e-9) / self.step)
+        self.accumulator = max(0.0, self.accumulator - steps * self.step)
+        self.sim_time += steps * self.step
+        self.frame += steps
+        return [self.step] * steps
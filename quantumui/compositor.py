@@ -0,0 +1,98 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from PySide6.QtCore import QPointF, QRect, Qt
+from PySide6.QtGui import QImage, QPainter
+
+_pool = None
+
+
+def worker_count():
+    # QUANTUMUI_THREADS=N fixa o número de threads; 0 ou 1 pinta tudo na thread da GUI
+    value = os.environ.get('QUANTUMUI_THREADS', '').strip()
+    if value:
+        return max(0, int(value))
+    return min(4, os.cpu_count() or 1)
+
+
+def layer_pool():
+    """Pool de threads compartilhado por todos os compositores (None = sem threads)."""
+    global _pool
+    if _pool is None:
+        workers = worker_count()
+        if workers < 2:
+            return None
+        _pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='quantumui-layer')
+    return _pool
+
+
+class LayerCompositor:
+    """Camadas independentes pintadas em QImage e compostas no ``paintEvent``.
+
+    Cada camada é ``paint(painter, width, height)`` em coordenadas lógicas
+    do widget. Com o pool de threads ativo, cada uma desenha num ``QImage``
+    ARGB32 premultiplicado limpo a cada quadro: as ``threaded`` nas threads
+    do pool (QPainter em QImage funciona fora da thread da GUI), as demais
+    na thread da GUI enquanto as outras trabalham. A composição segue a
+    ordem de ``add``. ``bounds(width, height)``, se dado, limita a imagem
+    da camada a um retângulo lógico. Sem pool (uma CPU ou
+    ``QUANTUMUI_THREADS=1``) as camadas são pintadas direto no painter, na
+    mesma ordem, sem imagens intermediárias.
+
+    Cada camada começa com o estado inicial do painter, nunca com o que a
+    anterior deixou. As camadas só leem o estado do widget: os sorteios
+    ficam em ``update_animation`` (ver ``AnimatedWidget``).
+    """
+
+    def __init__(self, widget):
+        self.widget = widget
+        self.layers = []
+        self.images = {}
+
+    def add(self, name, paint, threaded=True, bounds=None):
+        self.layers.append((name, paint, threaded, bounds))
+
+    def image(self, name, rect, dpr):
+        size = (max(1, round(rect.width() * dpr)), max(1, round(rect.height() * dpr)))
+        image = self.images.get(name)
+        if image is None or (image.width(), image.height()) != size or image.devicePixelRatio() != dpr:
+            image = QImage(*size, QImage.Format_ARGB32_Premultiplied)
+            image.setDevicePixelRatio(dpr)
+            self.images[name] = image
+        return image
+
+    def paint_layer(self, image, rect, paint, width, height, hints):
+        image.fill(Qt.transparent)
+        painter = QPainter(image)
+        painter.setRenderHints(hints)
+        painter.translate(-rect.x(), -rect.y())
+        paint(painter, width, height)
+        painter.end()
+        return image
+
+    def render(self, painter):
+        width, height = self.widget.width(), self.widget.height()
+        pool = layer_pool()
+        if pool is None:
+            for name, paint, threaded, bounds in self.layers:
+                painter.save()
+                paint(painter, width, height)
+                painter.restore()
+            return
+
+        dpr = self.widget.devicePixelRatioF()
+        hints = painter.renderHints()
+
+        # Primeiro despacha as camadas em threads, depois pinta as da GUI
+        jobs = []
+        for name, paint, threaded, bounds in self.layers:
+            rect = bounds(width, height).toAlignedRect() if bounds else QRect(0, 0, width, height)
+            args = (self.image(name, rect, dpr), rect, paint, width, height, hints)
+            jobs.append((rect, pool.submit(self.paint_layer, *args) if threaded else args))
+        for i, (rect, job) in enumerate(jobs):
+            if isinstance(job, tuple):
+                jobs[i] = (rect, self.paint_layer(*job))
+
+        for rect, job in jobs:
+            image = job if isinstance(job, QImage) else job.result()
+            painter.drawImage(QPointF(rect.topLeft()), image)
@@ -0,0 +1,216 @@
+"""Daemon de espera: animações prontas para aparecer sem partida a frio.
+
+O daemon mantém o ``QApplication``, a base de fontes e os widgets já
+criados (e pintados uma vez, com caches de camadas, glifos e caminhos
+prontos), escondidos e com a simulação suspensa. Um socket Unix local
+recebe um comando por conexão, em uma linha de texto, e responde outra::
+
+    python -m quantumui.daemon serve --preload GhostlyAssistantWidget &
+    python -m quantumui.daemon show GhostlyAssistantWidget   # ok 12.4 ms
+    python -m quantumui.daemon hide GhostlyAssistantWidget
+
+Comandos: ``show NOME``, ``hide [NOME]`` (sem nome, esconde todos),
+``list`` e ``quit``. ``NOME`` é o que o registro aceita (classe, script ou
+``script.py:Classe``); um widget pedido sem preload é criado no primeiro
+``show``, e ``hide`` de um que ainda não existe não faz nada. Se a janela
+não pintar (coberta, minimizada), ``show`` responde mesmo assim depois de
+``SHOW_TIMEOUT_MS``. Como o protocolo é texto puro, um cliente sem Python também
+serve: ``echo "show GhostlyAssistantWidget" | nc -U /tmp/quantumui-1000.sock``.
+"""
+
+import argparse
+import os
+import socket
+import sys
+import tempfile
+import time
+
+from PySide6.QtCore import QEvent, QObject, QTimer
+from PySide6.QtGui import QFontDatabase, QImage
+from PySide6.QtNetwork import QLocalServer
+from PySide6.QtWidgets import QApplication
+
+from .catalog import discover, find_entry, load_widget_class
+
+# Espera máxima pelo primeiro quadro depois de um show
+SHOW_TIMEOUT_MS = 2000
+
+
+def socket_path():
+    # QUANTUMUI_SOCKET escolhe o caminho; o padrão é um por usuário
+    return os.environ.get('QUANTUMUI_SOCKET') or os.path.join(
+        tempfile.gettempdir(), f'quantumui-{os.getuid()}.sock')
+
+
+def send(command, path=None, timeout=10.0):
+    """Envia um comando ao daemon e devolve a linha de resposta."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(path or socket_path())
+        client.sendall(command.encode('utf-8') + b'\n')
+        with client.makefile(encoding='utf-8') as reply:
+            return reply.readline().strip()
+
+
+class NextPaint(QObject):
+    # Chama callback(True) logo depois do próximo paintEvent do widget, ou
+    # callback(False) se nenhum vier em timeout ms
+    def __init__(self, widget, callback, timeout=SHOW_TIMEOUT_MS):
+        super().__init__(widget)
+        self.callback = callback
+        widget.installEventFilter(self)
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(lambda: self.finish(False))
+        self.timer.start(timeout)
+
+    def eventFilter(self, watched, event):
+        if watched is self.parent() and event.type() == QEvent.Paint:
+            watched.removeEventFilter(self)
+            # O filtro roda antes da pintura: o callback vem depois dela
+            QTimer.singleShot(0, self, lambda: self.finish(True))
+        return False
+
+    def finish(self, painted):
+        if self.callback is None:
+            return
+        callback, self.callback = self.callback, None
+        self.timer.stop()
+        self.parent().removeEventFilter(self)
+        self.deleteLater()
+        callback(painted)
+
+
+class StandbyDaemon:
+    def __init__(self, path):
+        self.entries = discover()
+        self.widgets = {}
+        self.owner = QObject()
+        self.server = QLocalServer(self.owner)
+        self.server.setSocketOptions(QLocalServer.UserAccessOption)
+        # Socket de uma execução anterior que não saiu direito
+        QLocalServer.removeServer(path)
+        if not self.server.listen(path):
+            raise OSError(f"não foi possível escutar em {path}: {self.server.errorString()}")
+        self.server.newConnection.connect(self.accept)
+
+    def widget(self, name):
+        entry = find_entry(name, self.entries)
+        widget = self.widgets.get(entry['name'])
+        if widget is None:
+            widget = load_widget_class(entry['name'])()
+            # Scripts em tela cheia se mostram no __init__: esconder suspende a simulação
+            widget.hide()
+            self.warm(widget)
+            self.widgets[entry['name']] = widget
+        return widget
+
+    @staticmethod
+    def warm(widget):
+        # Uma pintura fora da tela monta camadas, atlas de glifos e caminhos
+        dpr = widget.devicePixelRatioF()
+        image = QImage(int(widget.width() * dpr), int(widget.height() * dpr),
+                       QImage.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(dpr)
+        image.fill(0)
+        widget.render(image)
+
+    def accept(self):
+        while self.server.hasPendingConnections():
+            connection = self.server.nextPendingConnection()
+            connection.readyRead.connect(lambda connection=connection: self.read(connection))
+
+    def read(self, connection):
+        if not connection.canReadLine():
+            return
+        command = bytes(connection.readLine()).decode('utf-8').strip()
+
+        def respond(reply):
+            connection.write((reply + '\n').encode('utf-8'))
+            connection.disconnectFromServer()
+
+        try:
+            reply = self.handle(command, respond)
+        except LookupError as error:
+            reply = f"erro {error}"
+        if reply is not None:
+            respond(reply)
+
+    def handle(self, command, respond):
+        action, _, name = command.partition(' ')
+        name = name.strip()
+        if action == 'show' and name:
+            start = time.perf_counter()
+            widget = self.widget(name)
+            # Responde só depois do primeiro quadro pintado na tela (ou do prazo)
+            def shown(painted):
+                elapsed = (time.perf_counter() - start) * 1000
+                respond(f"ok {elapsed:.1f} ms" if painted else f"ok {elapsed:.1f} ms (sem quadro pintado)")
+
+            NextPaint(widget, shown)
+            widget.show()
+            widget.raise_()
+            widget.activateWindow()
+            widget.update()
+            return None
+        if action == 'hide':
+            # Só esconde o que já existe: hide não cria nem aquece widgets
+            if name:
+                widget = self.widgets.get(find_entry(name, self.entries)['name'])
+                widgets = [widget] if widget is not None else []
+            else:
+                widgets = self.widgets.values()
+            for widget in widgets:
+                widget.hide()
+            return "ok"
+        if action == 'list':
+            return "ok " + ' '.join(self.widgets)
+        if action == 'quit':
+            QApplication.instance().quit()
+            return "ok"
+        return f"erro comando desconhecido: {command!r}"
+
+
+def serve(path, preload=()):
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    # Widgets escondidos não podem encerrar o daemon
+    app.setQuitOnLastWindowClosed(False)
+    # Carrega a base de fontes agora, não no primeiro texto pintado
+    QFontDatabase.families()
+
+    daemon = StandbyDaemon(path)
+    for name in preload:
+        daemon.widget(name)
+    print(f"escutando em {path} ({len(daemon.widgets)} animações prontas)", file=sys.stderr)
+    try:
+        return app.exec()
+    finally:
+        daemon.server.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mantém animações prontas e as mostra por um socket local.")
+    parser.add_argument('command', help="serve, show, hide, list ou quit")
+    parser.add_argument('name', nargs='?', help="animação (classe, script ou script.py:Classe)")
+    parser.add_argument('--socket', default=None, help="caminho do socket (padrão: QUANTUMUI_SOCKET)")
+    parser.add_argument('--preload', default='',
+                        help="animações criadas e pintadas na partida, separadas por vírgula")
+    args = parser.parse_args(argv)
+    path = args.socket or socket_path()
+
+    if args.command == 'serve':
+        preload = [name.strip() for name in args.preload.split(',') if name.strip()]
+        sys.exit(serve(path, preload))
+
+    command = ' '.join(filter(None, (args.command, args.name)))
+    try:
+        reply = send(command, path)
+    except OSError as error:
+        parser.exit(1, f"daemon indisponível em {path}: {error}\n")
+    print(reply)
+    if reply.startswith('erro'):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+"""Exportação determinística de quadros em paralelo.
+
+Renderiza os quadros ``start..end`` (inclusive) de uma animação numa
+resolução qualquer, dividindo o intervalo entre processos. Cada processo
+reconstrói o estado do seu primeiro quadro a partir da semente, então o
+resultado é o mesmo de uma renderização sequencial::
+
+    python -m quantumui.export voxy_animation.py --size 3840x2160 \\
+        --start 0 --end 239 --workers 4 --out render/
+
+Com ``--format rgba`` cada quadro vira um arquivo de bytes RGBA crus, que
+um codificador local consome direto, por exemplo::
+
+    cat render/*.rgba | ffmpeg -f rawvideo -pix_fmt rgba -s 3840x2160 \\
+        -r 60 -i - preview.mp4
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .harness import parse_size
+
+FORMATS = ('png', 'rgba')
+
+
+def frame_path(out, index, fmt):
+    return os.path.join(out, f'frame_{index:05d}.{fmt}')
+
+
+def split_range(start, end, parts):
+    # Blocos contíguos: cada processo avança a simulação uma vez só
+    total = end - start + 1
+    parts = max(1, min(parts, total))
+    chunks = []
+    first = start
+    for part in range(parts):
+        size = total // parts + (part < total % parts)
+        chunks.append((first, first + size - 1))
+        first += size
+    return chunks
+
+
+def save_frame(image, path, fmt):
+    if fmt == 'png':
+        image.save(path)
+        return
+    from PySide6.QtGui import QImage
+
+    rgba = image.convertToFormat(QImage.Format_RGBA8888)
+    with open(path, 'wb') as output:
+        output.write(bytes(rgba.constBits()))
+
+
+def export_range(script, size, fps, seed, quality, dpr, start, end, out, fmt):
+    """Renderiza os quadros ``start..end`` num processo; devolve quantos gravou."""
+    from .harness import create_widget, ensure_offscreen_app, render_frame
+
+    ensure_offscreen_app(size)
+    from PySide6.QtGui import QImage
+
+    from .catalog import load_widget_class
+
+    widget = create_widget(load_widget_class(script), size, seed, quality)
+    image = QImage(int(size[0] * dpr), int(size[1] * dpr), QImage.Format_ARGB32_Premultiplied)
+    image.setDevicePixelRatio(dpr)
+    # Os sorteios acontecem só nos passos: os quadros anteriores não são
+    # pintados, exceto o último, num alvo de 1 px, só para aquecer os caches
+    # de glifos do Qt (a primeira pintura de um texto difere em alguns níveis)
+    scratch = QImage(1, 1, QImage.Format_ARGB32_Premultiplied)
+
+    frame_time = 1.0 / fps
+    for index in range(end + 1):
+        widget.advance(frame_time)
+        if index < start:
+            if index == start - 1:
+                render_frame(widget, scratch)
+            continue
+        render_frame(widget, image)
+        save_frame(image, frame_path(out, index, fmt), fmt)
+    widget.deleteLater()
+    return end - start + 1
+
+
+def export(script, size, start, end, out, fps=60, seed=0, quality=0, dpr=1.0,
+           fmt='png', workers=None):
+    os.makedirs(out, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    chunks = split_range(start, end, workers)
+    if len(chunks) == 1:
+        return export_range(script, size, fps, seed, quality, dpr, start, end, out, fmt)
+
+    # spawn: o Qt não sobrevive a fork de um processo que já o carregou
+    context = multiprocessing.get_context('spawn')
+    done = 0
+    with ProcessPoolExecutor(max_workers=len(chunks), mp_context=context) as pool:
+        jobs = [pool.submit(export_range, script, size, fps, seed, quality, dpr,
+                            first, last, out, fmt) for first, last in chunks]
+        for job in as_completed(jobs):
+            done += job.result()
+    return done
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Exporta quadros de uma animação em paralelo.")
+    parser.add_argument('script', help="script.py ou script.py:Classe")
+    parser.add_argument('--size', type=parse_size, default=(1920, 1080))
+    parser.add_argument('--dpr', type=float, default=1.0,
+                        help="pixels por unidade lógica (2 = o dobro de --size)")
+    parser.add_argument('--fps', type=float, default=60)
+    parser.add_argument('--start', type=int, default=0)
+    parser.add_argument('--end', type=int, required=True, help="último quadro (inclusive)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--quality', type=int, default=0,
+                        help="nível de qualidade fixo (0 = máxima)")
+    parser.add_argument('--format', choices=FORMATS, default='png')
+    parser.add_argument('--workers', type=int, default=None,
+                        help="processos (padrão: número de CPUs)")
+    parser.add_argument('--out', required=True, help="pasta dos quadros")
+    args = parser.parse_args(argv)
+
+    if args.end < args.start:
+        parser.error("--end precisa ser maior ou igual a --start")
+
+    begin = time.perf_counter()
+    count = export(args.script, args.size, args.start, args.end, args.out, args.fps,
+                   args.seed, args.quality, args.dpr, args.format, args.workers)
+    elapsed = time.perf_counter() - begin
+    print(f"{count} quadros em {elapsed:.1f} s -> {args.out}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
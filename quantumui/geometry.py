@@ -0,0 +1,61 @@
+import numpy as np
+from PySide6.QtGui import QPolygonF
+from shiboken6 import VoidPtr
+
+
+def point_buffer(polygon):
+    # Vista NumPy (n, 2) sobre a memória do próprio QPolygonF
+    count = polygon.size()
+    if not count:
+        return np.zeros((0, 2))
+    memory = VoidPtr(polygon.data(), count * 2 * 8, True)
+    return np.frombuffer(memory, dtype=np.float64).reshape(count, 2)
+
+
+def new_polygon(count):
+    polygon = QPolygonF()
+    polygon.resize(count)
+    return polygon, point_buffer(polygon)
+
+
+def to_polygon(x, y):
+    """QPolygonF com os pontos ``(x[i], y[i])``, copiados de uma vez.
+
+    Os arrays são escritos direto na memória do polígono, sem criar um
+    ``QPointF`` por ponto em Python.
+    """
+    polygon, buffer = new_polygon(len(x))
+    buffer[:, 0] = x
+    buffer[:, 1] = y
+    return polygon
+
+
+def array_polygon(points):
+    # points: array (n, 2) de pontos ou (n, 4) de segmentos (x1, y1, x2, y2)
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    polygon, buffer = new_polygon(len(points))
+    buffer[:] = points
+    return polygon
+
+
+def line_polygon(x1, y1, x2, y2):
+    """Pontos intercalados (início, fim) no formato de ``QPainter.drawLines``."""
+    polygon, buffer = new_polygon(2 * len(x1))
+    segments = buffer.reshape(-1, 4)
+    segments[:, 0] = x1
+    segments[:, 1] = y1
+    segments[:, 2] = x2
+    segments[:, 3] = y2
+    return polygon
+
+
+def draw_points(painter, x, y):
+    painter.drawPoints(to_polygon(x, y))
+
+
+def draw_lines(painter, x1, y1, x2, y2):
+    painter.drawLines(line_polygon(x1, y1, x2, y2))
+
+
+def draw_polyline(painter, x, y):
+    painter.drawPolyline(to_polygon(x, y))
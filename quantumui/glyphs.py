@@ -0,0 +1,126 @@
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from math import ceil
+
+from PySide6.QtCore import Qt, QPointF, QRectF
+from PySide6.QtGui import QColor, QFont, QFontMetricsF, QImage, QPainter
+
+from .batch import quantize_alpha
+
+
+class GlyphAtlas:
+    """Caracteres de uma fonte pré-renderizados por cor, sem moldar texto.
+
+    Cada cor (com os canais quantizados em passos de ``color_step``) ganha
+    uma faixa com todos os caracteres; desenhar um glifo é copiar um
+    retângulo dela. Colunas inteiras de chuva Matrix também ficam em cache
+    (``draw_column``) enquanto os caracteres e as cores não mudam. As
+    faixas são ``QImage``, então o atlas também serve camadas pintadas fora
+    da thread da GUI.
+    """
+
+    PADDING = 2
+
+    def __init__(self, font, chars, dpr=1.0, color_step=8, max_tints=64, max_columns=256):
+        self.font = QFont(font)
+        self.chars = chars
+        self.dpr = dpr
+        self.color_step = color_step
+        self.max_tints = max_tints
+        self.max_columns = max_columns
+
+        metrics = QFontMetricsF(self.font)
+        self.ascent = metrics.ascent()
+        advance = max(metrics.horizontalAdvance(char) for char in chars)
+        self.cell_width = ceil(max(advance, metrics.maxWidth())) + 2 * self.PADDING
+        self.cell_height = ceil(metrics.height()) + 2 * self.PADDING
+        self.index = {char: i for i, char in enumerate(chars)}
+
+        self.tints = OrderedDict()
+        self.columns = OrderedDict()
+        self.lock = threading.RLock()
+
+    def color_key(self, color):
+        return tuple(quantize_alpha(channel, self.color_step) for channel in color)
+
+    def new_image(self, width, height):
+        image = QImage(ceil(width * self.dpr), ceil(height * self.dpr), QImage.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(self.dpr)
+        image.fill(Qt.transparent)
+        return image
+
+    def tint(self, key):
+        with self.lock:
+            image = self.tints.get(key)
+            if image is not None:
+                self.tints.move_to_end(key)
+                return image
+            image = self.new_tint(key)
+            self.tints[key] = image
+            if len(self.tints) > self.max_tints:
+                self.tints.popitem(last=False)
+            return image
+
+    def new_tint(self, key):
+        image = self.new_image(self.cell_width * len(self.chars), self.cell_height)
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setFont(self.font)
+        painter.setPen(QColor(*key))
+        baseline = self.PADDING + self.ascent
+        for i, char in enumerate(self.chars):
+            painter.drawText(QPointF(i * self.cell_width + self.PADDING, baseline), char)
+        painter.end()
+        return image
+
+    def source(self, char):
+        size = self.cell_width * self.dpr
+        return QRectF(self.index[char] * size, 0, size, self.cell_height * self.dpr)
+
+    def draw(self, painter, x, y, char, color):
+        # Mesmo posicionamento de painter.drawText(QPointF(x, y), char)
+        if char not in self.index:
+            painter.setFont(self.font)
+            painter.setPen(QColor(*color))
+            painter.drawText(QPointF(x, y), char)
+            return
+        target = QPointF(x - self.PADDING, y - self.ascent - self.PADDING)
+        painter.drawImage(target, self.tint(self.color_key(color)), self.source(char))
+
+    def column(self, chars, colors, step):
+        # Coluna vertical de glifos, um a cada ``step`` pixels (negativo = para cima)
+        key = (chars if isinstance(chars, str) else tuple(chars),
+               tuple(self.color_key(color) for color in colors), step)
+        with self.lock:
+            image = self.columns.get(key)
+            if image is not None:
+                self.columns.move_to_end(key)
+                return image
+
+            count = len(chars)
+            image = self.new_image(self.cell_width, self.cell_height + abs(step) * (count - 1))
+            painter = QPainter(image)
+            top = 0 if step > 0 else -step * (count - 1)
+            for i, (char, color) in enumerate(zip(chars, key[1])):
+                if not color[3]:
+                    continue
+                painter.drawImage(QPointF(0, top + i * step), self.tint(color), self.source(char))
+            painter.end()
+
+            self.columns[key] = image
+            if len(self.columns) > self.max_columns:
+                self.columns.popitem(last=False)
+            return image
+
+    def draw_column(self, painter, x, y, chars, colors, step):
+        """Equivale a desenhar ``chars[i]`` com ``colors[i]`` em ``(x, y + i * step)``."""
+        image = self.column(chars, colors, step)
+        top = y if step > 0 else y + step * (len(chars) - 1)
+        painter.drawImage(QPointF(x - self.PADDING, top - self.ascent - self.PADDING), image)
+
+
+@lru_cache(maxsize=16)
+def glyph_atlas(family, point_size, chars, dpr=1.0, weight=QFont.Normal):
+    """Atlas compartilhado por fonte, conjunto de caracteres e DPR."""
+    return GlyphAtlas(QFont(family, point_size, weight), chars, dpr)
@@ -0,0 +1,169 @@
+"""Renderização headless das animações na plataforma offscreen do Qt.
+
+Exemplo::
+
+    python -m quantumui.harness Animations/03/biometric_scanner.py \\
+        --size 800x600 --fps 60 --frames 120 --out /tmp/frames
+
+Com ``--replay execucao.json`` reproduz quadro a quadro uma execução
+gravada com ``QUANTUMUI_RECORD`` (ver ``quantumui.replay``).
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+from PySide6.QtGui import QImage
+
+
+def ensure_offscreen_app(size=(800, 600)):
+    # O QApplication precisa existir antes de qualquer widget; a tela
+    # virtual recebe o tamanho pedido para as animações em tela cheia
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication.instance()
+    if app is not None:
+        return app
+
+    if 'QT_QPA_PLATFORM' not in os.environ:
+        config = {'screens': [{
+            'name': 'offscreen', 'x': 0, 'y': 0,
+            'width': size[0], 'height': size[1],
+            'logicalDpi': 96, 'logicalBaseDpi': 96, 'dpr': 1,
+        }]}
+        fd, config_path = tempfile.mkstemp(prefix='quantumui-screen-', suffix='.json')
+        with os.fdopen(fd, 'w') as config_file:
+            json.dump(config, config_file)
+        os.environ['QT_QPA_PLATFORM'] = f'offscreen:configfile={config_path}'
+
+    return QApplication(sys.argv[:1])
+
+
+def create_widget(widget_cls, size, seed=0, quality=0):
+    random.seed(seed)
+    widget = widget_cls()
+    # Sem timer nem janela: o harness controla o tempo e a pintura
+    widget.stop_animation()
+    # Nível fixo: quadros reprodutíveis, sem o governador reagindo à máquina
+    widget.quality.pin(quality)
+    widget.hide()
+    widget.resize(*size)
+    return widget
+
+
+def render_frame(widget, image):
+    image.fill(0)
+    widget.render(image)
+
+
+def render_frames(widget_cls, size=(800, 600), fps=60, frames=60, seed=0,
+                  keep_images=True, dpr=1.0, widget=None):
+    """Executa ``frames`` quadros com tempo simulado de ``1 / fps``.
+
+    Retorna um dicionário com as imagens (se ``keep_images``) e, para cada
+    quadro, os passos de simulação e os tempos de atualização e pintura.
+    """
+    ensure_offscreen_app(size)
+    if widget is None:
+        widget = create_widget(widget_cls, size, seed)
+
+    image = QImage(int(size[0] * dpr), int(size[1] * dpr), QImage.Format_ARGB32_Premultiplied)
+    image.setDevicePixelRatio(dpr)
+
+    images = []
+    timings = []
+    frame_time = 1.0 / fps
+    for index in range(frames):
+        start = time.perf_counter()
+        steps = widget.advance(frame_time)
+        updated = time.perf_counter()
+        render_frame(widget, image)
+        painted = time.perf_counter()
+
+        timings.append({
+            'frame': index,
+            'steps': steps,
+            'update_ms': (updated - start) * 1000,
+            'paint_ms': (painted - updated) * 1000,
+        })
+        if keep_images:
+            images.append(image.copy())
+
+    return {'widget': widget, 'images': images, 'timings': timings}
+
+
+def parse_size(text):
+    width, _, height = text.lower().partition('x')
+    return int(width), int(height)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Renderiza uma animação sem display.")
+    parser.add_argument('script', nargs='?', help="script.py ou script.py:Classe")
+    parser.add_argument('--size', type=parse_size, default=(800, 600))
+    parser.add_argument('--fps', type=float, default=60)
+    parser.add_argument('--frames', type=int, default=60)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', help="pasta para salvar os quadros em PNG")
+    parser.add_argument('--quality', type=int, default=0,
+                        help="nível de qualidade fixo (0 = máxima)")
+    parser.add_argument('--profile', action='store_true',
+                        help="mede cada draw_* e imprime o custo por etapa")
+    parser.add_argument('--replay', metavar='EXECUCAO',
+                        help="reproduz uma execução gravada com QUANTUMUI_RECORD")
+    args = parser.parse_args(argv)
+
+    if args.replay:
+        return replay_main(args)
+    if not args.script:
+        parser.error("informe o script ou --replay")
+
+    ensure_offscreen_app(args.size)
+    from .catalog import load_widget_class
+
+    widget_cls = load_widget_class(args.script)
+    widget = create_widget(widget_cls, args.size, args.seed, args.quality)
+    if args.profile:
+        from .profiling import profiler
+        profiler.attach(widget)
+    result = render_frames(widget_cls, args.size, args.fps, args.frames, args.seed,
+                           keep_images=bool(args.out), widget=widget)
+
+    if args.out:
+        os.makedirs(args.out, exist_ok=True)
+        for index, image in enumerate(result['images']):
+            image.save(os.path.join(args.out, f'frame_{index:05d}.png'))
+
+    if args.profile:
+        print(profiler.format(), file=sys.stderr)
+
+    json.dump(result['timings'], sys.stdout, indent=2)
+    print()
+
+
+def replay_main(args):
+    from .replay import load_run, replay_frames
+
+    run = load_run(args.replay)
+    size = tuple(run['size'])
+    # A semente gravada vale para as fontes aleatórias criadas no __init__
+    os.environ['QUANTUMUI_SEED'] = str(run['seed'])
+    ensure_offscreen_app(size)
+    from .catalog import load_widget_class
+
+    widget = create_widget(load_widget_class(run['script']), size)
+    image = QImage(*size, QImage.Format_ARGB32_Premultiplied)
+    if args.out:
+        os.makedirs(args.out, exist_ok=True)
+    for index, frame in enumerate(replay_frames(widget, run, image, render_frame)):
+        if args.out:
+            frame.save(os.path.join(args.out, f'frame_{index:05d}.png'))
+    print(f"{len(run['frames'])} quadros reproduzidos", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
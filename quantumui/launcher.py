@@ -0,0 +1,144 @@
+"""Todas as animações num só processo.
+
+Um único ``QApplication`` hospeda qualquer animação do registro
+(``catalog.discover``): trocar de animação não paga de novo o
+interpretador, o import do PySide6 e a criação da aplicação. Os scripts
+só são importados quando escolhidos::
+
+    python -m quantumui.launcher                      # lista para escolher
+    python -m quantumui.launcher voxy_animation.py    # abre uma direto
+    python -m quantumui.launcher --list
+
+Page Down / Page Up trocam para a próxima / anterior de qualquer janela.
+``--startup-budget MS`` mede, num interpretador novo, o import do lançador
+e a leitura do registro, e sai com erro se passar do orçamento.
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+
+from PySide6.QtCore import QEvent, Qt
+from PySide6.QtWidgets import QApplication, QListWidget
+
+from .batch import glow_sprite
+from .catalog import ROOT, discover, find_entry, load_widget_class
+from .glyphs import glyph_atlas
+from .paint import paint_pool
+from .paths import path_cache
+from .polar import angular_basis
+from .text import text_cache
+
+STARTUP_CODE = (
+    "import time; start = time.perf_counter(); "
+    "import quantumui.launcher as launcher; launcher.discover(); "
+    "print((time.perf_counter() - start) * 1000)"
+)
+
+
+def clear_shared_caches():
+    # Atlas, sprites, caminhos, canetas e textos da animação anterior não servem à próxima
+    glyph_atlas.cache_clear()
+    glow_sprite.cache_clear()
+    angular_basis.cache_clear()
+    path_cache.clear()
+    paint_pool.clear()
+    text_cache.clear()
+
+
+class Launcher(QListWidget):
+    def __init__(self, entries):
+        super().__init__()
+        self.setWindowTitle("QuantumUI")
+        self.resize(420, 600)
+        self.entries = entries
+        self.current = None
+        self.addItems([entry['name'] for entry in entries])
+        self.itemActivated.connect(lambda item: self.switch(self.row(item)))
+        QApplication.instance().installEventFilter(self)
+
+    def switch(self, index):
+        start = time.perf_counter()
+        self.close_current()
+        index %= len(self.entries)
+        entry = self.entries[index]
+        widget = load_widget_class(entry['name'])()
+        # Scripts em tela cheia já se mostram no __init__
+        if not widget.isVisible():
+            widget.show()
+        self.current = widget
+        self.setCurrentRow(index)
+        print(f"{entry['name']}: {(time.perf_counter() - start) * 1000:.0f} ms", file=sys.stderr)
+        return widget
+
+    def close_current(self):
+        widget, self.current = self.current, None
+        if widget is None:
+            return
+        # Timer parado antes de fechar: nenhum passo roda num widget sendo destruído
+        widget.stop_animation()
+        widget.close()
+        widget.deleteLater()
+        clear_shared_caches()
+
+    def closeEvent(self, event):
+        self.close_current()
+        super().closeEvent(event)
+
+    def eventFilter(self, watched, event):
+        # O filtro da aplicação vê a tecla também na QWindow; só conta a do widget
+        if event.type() == QEvent.KeyPress and watched.isWidgetType():
+            if event.key() in (Qt.Key_PageDown, Qt.Key_PageUp):
+                self.switch(self.currentRow() + (1 if event.key() == Qt.Key_PageDown else -1))
+                return True
+        return False
+
+
+def startup_ms(runs=3):
+    # Melhor de algumas execuções: a primeira ainda paga o cache de disco
+    times = []
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, '-c', STARTUP_CODE], cwd=ROOT,
+                                capture_output=True, text=True, check=True)
+        times.append(float(result.stdout.split()[-1]))
+    return min(times)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hospeda todas as animações num só processo.")
+    parser.add_argument('animation', nargs='?',
+                        help="script.py, script.py:Classe ou só o nome da classe")
+    parser.add_argument('--list', action='store_true', help="lista as animações e sai")
+    parser.add_argument('--startup-budget', type=float, metavar='MS',
+                        help="mede o início do lançador e falha acima de MS")
+    args = parser.parse_args(argv)
+
+    if args.startup_budget is not None:
+        elapsed = startup_ms()
+        print(f"início: {elapsed:.0f} ms (orçamento {args.startup_budget:.0f} ms)", file=sys.stderr)
+        if elapsed > args.startup_budget:
+            parser.exit(1, "início acima do orçamento\n")
+        return
+
+    entries = discover()
+    if args.list:
+        for entry in entries:
+            print(entry['name'])
+        return
+
+    try:
+        first = entries.index(find_entry(args.animation, entries)) if args.animation else None
+    except LookupError as error:
+        parser.error(str(error))
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    launcher = Launcher(entries)
+    launcher.show()
+    if first is not None:
+        launcher.switch(first)
+    sys.exit(app.exec())
+
+
+if __name__ == '__main__':
+    main()
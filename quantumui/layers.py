@@ -0,0 +1,42 @@
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QPainter, QPixmap
+
+
+class LayerCache:
+    """Camadas estáticas (fundos em gradiente) pintadas uma vez em QPixmap.
+
+    Cada camada é identificada por um nome e guarda a assinatura com que foi
+    gerada (tamanho, DPR e uma chave extra opcional). Se a assinatura mudar,
+    a camada é repintada; ``invalidate`` descarta tudo (chamado no resize).
+    """
+
+    def __init__(self, widget):
+        self.widget = widget
+        self.layers = {}
+
+    def layer(self, name, paint, size=None, key=None):
+        # paint(painter, width, height) desenha em coordenadas lógicas
+        width, height = size if size is not None else (self.widget.width(), self.widget.height())
+        dpr = self.widget.devicePixelRatioF()
+        signature = (width, height, dpr, key)
+
+        cached = self.layers.get(name)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        pixmap = QPixmap(max(1, round(width * dpr)), max(1, round(height * dpr)))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        paint(painter, width, height)
+        painter.end()
+
+        self.layers[name] = (signature, pixmap)
+        return pixmap
+
+    def invalidate(self, name=None):
+        if name is None:
+            self.layers.clear()
+        else:
+            self.layers.pop(name, None)
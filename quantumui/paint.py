@@ -0,0 +1,80 @@
+from collections import OrderedDict
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QBrush, QColor, QLinearGradient, QPen
+
+from .batch import quantize_alpha
+
+
+class PaintPool:
+    """Pool de canetas, pincéis e gradientes reaproveitados entre quadros.
+
+    Cada recurso é identificado por uma chave com o alfa já quantizado
+    (``alpha_step``), então segmentos com opacidades vizinhas compartilham o
+    mesmo objeto. Os menos usados saem quando o pool passa de ``capacity``.
+    """
+
+    def __init__(self, capacity=512, alpha_step=4):
+        self.capacity = capacity
+        self.alpha_step = alpha_step
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, factory):
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry
+        self.misses += 1
+        entry = self.entries[key] = factory()
+        if len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+        return entry
+
+    def clear(self):
+        self.entries.clear()
+
+    def alpha(self, alpha):
+        return quantize_alpha(alpha, self.alpha_step)
+
+    def color(self, red, green, blue, alpha=255):
+        alpha = self.alpha(alpha)
+        return self.get(('color', red, green, blue, alpha), lambda: QColor(red, green, blue, alpha))
+
+    def brush(self, red, green, blue, alpha=255):
+        alpha = self.alpha(alpha)
+        return self.get(('brush', red, green, blue, alpha),
+                        lambda: QBrush(QColor(red, green, blue, alpha)))
+
+    def gradient_pen(self, stops, alpha, width, x1, y1, x2, y2, cap=Qt.RoundCap, join=Qt.RoundJoin):
+        """Caneta com gradiente linear de ``(x1, y1)`` a ``(x2, y2)``.
+
+        ``stops`` é uma tupla de ``(posição, (r, g, b))``. O gradiente fica no
+        pool e só é reposicionado a cada segmento, em coordenadas lógicas,
+        como um ``QLinearGradient(x1, y1, x2, y2)`` novo: outra linha pintada
+        com a mesma caneta (a onda de baixo) recebe as mesmas cores de antes,
+        inclusive as das pontas estendidas. A caneta devolvida muda na próxima
+        chamada; passe-a logo ao ``setPen``.
+        """
+        alpha = self.alpha(alpha)
+
+        def create():
+            gradient = QLinearGradient()
+            for position, (red, green, blue) in stops:
+                gradient.setColorAt(position, QColor(red, green, blue, alpha))
+            pen = QPen(QBrush(gradient), width)
+            pen.setCapStyle(cap)
+            pen.setJoinStyle(join)
+            return gradient, pen
+
+        gradient, pen = self.get(('gradient_pen', stops, alpha, width, cap, join), create)
+        gradient.setStart(x1, y1)
+        gradient.setFinalStop(x2, y2)
+        pen.setBrush(gradient)
+        return pen
+
+
+# Pool compartilhado pelas animações
+paint_pool = PaintPool()
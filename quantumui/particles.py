@@ -0,0 +1,61 @@
+import random
+
+import numpy as np
+
+
+def make_rng():
+    # Deriva do módulo random: random.seed() continua tornando tudo reprodutível
+    return np.random.default_rng(random.getrandbits(64))
+
+
+class ParticleSystem:
+    """Partículas em estrutura de arrays: um array NumPy contíguo por campo.
+
+    Campos padrão: posição (``x``, ``y``), velocidade (``vx``, ``vy``),
+    ``size``, ``phase`` e ``color`` (índice numa paleta). Campos extras são
+    pedidos em ``extra``. Todas as operações são vetorizadas.
+    """
+
+    FIELDS = ('x', 'y', 'vx', 'vy', 'size', 'phase')
+
+    def __init__(self, count, extra=(), rng=None):
+        self.count = count
+        self.rng = rng if rng is not None else make_rng()
+        self.fields = self.FIELDS + tuple(extra)
+        for name in self.fields:
+            setattr(self, name, np.zeros(count))
+        self.color = np.zeros(count, dtype=np.intp)
+
+    def __len__(self):
+        return self.count
+
+    def uniform(self, low, high, size=None):
+        return self.rng.uniform(low, high, self.count if size is None else size)
+
+    def integers(self, low, high, size=None):
+        # Intervalo fechado, como random.randint
+        return self.rng.integers(low, high, self.count if size is None else size, endpoint=True)
+
+    def set_polar_velocity(self, angle, speed):
+        self.vx = np.cos(angle) * speed
+        self.vy = np.sin(angle) * speed
+
+    def step(self, dt=1.0):
+        self.x += self.vx * dt
+        self.y += self.vy * dt
+
+    def bounce(self, left, top, right, bottom):
+        # Inverte a componente da velocidade de quem está fora da caixa
+        self.vx[(self.x < left) | (self.x > right)] *= -1
+        self.vy[(self.y < top) | (self.y > bottom)] *= -1
+
+    def respawn(self, mask, **values):
+        # values: campo -> escalar, array do tamanho da máscara ou callable(n)
+        count = int(np.count_nonzero(mask))
+        if not count:
+            return 0
+        for name, value in values.items():
+            if callable(value):
+                value = value(count)
+            getattr(self, name)[mask] = value
+        return count
@@ -0,0 +1,88 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from PySide6.QtGui import QPainterPath
+
+from .geometry import to_polygon
+from .polar import angular_basis, polar_points
+
+# Construtores de formas registradas: nome -> build(size, resolution, *params)
+SHAPES = {}
+
+
+def shape(name):
+    def register(build):
+        SHAPES[name] = build
+        return build
+    return register
+
+
+@shape('polygon')
+def polygon_path(size, sides):
+    # Polígono regular fechado com o primeiro vértice no ângulo 0
+    path = QPainterPath()
+    path.addPolygon(to_polygon(*polar_points(0, 0, size, sides)))
+    return path
+
+
+@shape('vertex_dots')
+def vertex_dots_path(size, sides, dot_radius):
+    # Um círculo em cada vértice do polígono regular
+    path = QPainterPath()
+    xs, ys = polar_points(0, 0, size, sides, endpoint=False)
+    for x, y in zip(xs.tolist(), ys.tolist()):
+        path.addEllipse(x - dot_radius, y - dot_radius, 2 * dot_radius, 2 * dot_radius)
+    return path
+
+
+@shape('heart')
+def heart_path(size, resolution):
+    t, cos_t, sin_t = angular_basis(resolution, endpoint=False)
+    x = size * sin_t ** 3
+    y = -size * (13 * cos_t - 5 * np.cos(2 * t) - 2 * np.cos(3 * t) - np.cos(4 * t)) / 16
+    path = QPainterPath()
+    path.addPolygon(to_polygon(x, y))
+    return path
+
+
+class PathCache:
+    """Caminhos de formas estáticas em coordenadas locais, construídos uma vez.
+
+    A chave é ``(forma, tamanho, resolução, DPR)``; a forma é um nome
+    registrado com ``shape`` ou uma tupla ``(nome, *parâmetros)``. Rotação,
+    escala e posição ficam para a transformação do painter (ou
+    ``QTransform.map``), então o custo por quadro não cresce com o número
+    de vértices. Pode ser usado por camadas pintadas em outras threads.
+    """
+
+    def __init__(self, capacity=256):
+        self.capacity = capacity
+        self.paths = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, shape, size, resolution, dpr, build):
+        key = (shape, size, resolution, dpr)
+        with self.lock:
+            path = self.paths.get(key)
+            if path is not None:
+                self.paths.move_to_end(key)
+                return path
+            path = self.paths[key] = build(size, resolution)
+            if len(self.paths) > self.capacity:
+                self.paths.popitem(last=False)
+            return path
+
+    def path(self, shape, size=1.0, resolution=None, dpr=1.0):
+        name, *params = shape if isinstance(shape, tuple) else (shape,)
+        build = SHAPES[name]
+        return self.get(shape, size, resolution, dpr,
+                        lambda size, resolution: build(size, resolution, *params))
+
+    def clear(self):
+        with self.lock:
+            self.paths.clear()
+
+
+# Cache compartilhado pelas animações
+path_cache = PathCache()
@@ -0,0 +1,36 @@
+from functools import lru_cache
+from math import cos, sin, pi
+
+import numpy as np
+
+from .geometry import to_polygon
+
+
+@lru_cache(maxsize=64)
+def angular_basis(count, endpoint=True):
+    """Ângulos, cossenos e senos de ``count`` passos iguais numa volta.
+
+    Com ``endpoint`` a volta fecha repetindo o ângulo 2π no fim. As tabelas
+    ficam em cache por resolução e são somente leitura.
+    """
+    angles = np.arange(count + 1 if endpoint else count) * (2 * pi / count)
+    tables = angles, np.cos(angles), np.sin(angles)
+    for table in tables:
+        table.flags.writeable = False
+    return tables
+
+
+def polar_points(center_x, center_y, radius, count, endpoint=True, rotation=0.0):
+    """Coordenadas ``x, y`` de uma curva polar com raio (escalar ou array) por ângulo.
+
+    ``rotation`` gira a curva sem recalcular as tabelas.
+    """
+    _, cos_t, sin_t = angular_basis(count, endpoint)
+    if rotation:
+        cos_r, sin_r = cos(rotation), sin(rotation)
+        cos_t, sin_t = cos_t * cos_r - sin_t * sin_r, sin_t * cos_r + cos_t * sin_r
+    return center_x + radius * cos_t, center_y + radius * sin_t
+
+
+def polar_polygon(center_x, center_y, radius, count, endpoint=True, rotation=0.0):
+    return to_polygon(*polar_points(center_x, center_y, radius, count, endpoint, rotation))
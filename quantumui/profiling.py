@@ -0,0 +1,172 @@
+"""Perfil opcional por etapa de desenho.
+
+Envolve ``paintEvent``, ``update_animation`` e todo método ``draw_*`` que o
+script define (os auxiliares da base, como ``draw_layer``, ficam dentro da
+etapa que os chama), sem editar o script. Ative por variável de ambiente::
+
+    QUANTUMUI_PROFILE=1 python voxy_animation.py          # resumo ao sair
+    QUANTUMUI_PROFILE=1 QUANTUMUI_PROFILE_EVERY=120 ...   # resumo a cada 120 quadros
+    QUANTUMUI_PROFILE=1 QUANTUMUI_PROFILE_OUT=perfil.json ...
+
+ou diretamente com ``profiler.attach(widget)``.
+"""
+
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+
+FRAME_STAGE = 'paintEvent'
+
+
+class StageStats:
+    __slots__ = ('calls', 'total', 'self_time', 'max')
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.self_time = 0.0
+        self.max = 0.0
+
+
+class StageProfiler:
+    def __init__(self, time_source=time.perf_counter):
+        self.time_source = time_source
+        self.stats = {}
+        # Uma pilha por thread: camadas podem ser pintadas fora da thread da GUI
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.frames = 0
+        self.listeners = []
+        self.stream_every = 0
+
+    @property
+    def stack(self):
+        stack = getattr(self.local, 'stack', None)
+        if stack is None:
+            stack = self.local.stack = []
+        return stack
+
+    def stage_names(self, widget):
+        names = [FRAME_STAGE, 'update_animation']
+        names += sorted(name for name in dir(type(widget))
+                        if name.startswith('draw_') and not self.is_helper(type(widget), name))
+        return [name for name in names if callable(getattr(type(widget), name, None))]
+
+    @staticmethod
+    def is_helper(cls, name):
+        # draw_* herdados da base (AnimatedWidget.draw_layer) rodam dentro das
+        # etapas do script: medidos à parte, contariam o mesmo tempo duas vezes
+        owner = next(klass for klass in cls.__mro__ if name in vars(klass))
+        return owner.__module__.startswith(__package__ + '.')
+
+    def attach(self, widget, names=None):
+        prefix = type(widget).__name__
+        for name in names or self.stage_names(widget):
+            method = getattr(widget, name)
+            if getattr(method, 'profiled', False):
+                continue
+            # Atributo de instância: o Qt também despacha paintEvent por ele
+            setattr(widget, name, self.wrap(f'{prefix}.{name}', method, name == FRAME_STAGE))
+
+    def wrap(self, stage, method, ends_frame=False):
+        stats = self.stats.setdefault(stage, StageStats())
+
+        @functools.wraps(method)
+        def profiled(*args, **kwargs):
+            # Cada entrada da pilha acumula o tempo gasto nas etapas filhas
+            stack = self.stack
+            stack.append(0.0)
+            start = self.time_source()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = self.time_source() - start
+                children = stack.pop()
+                if stack:
+                    stack[-1] += elapsed
+                with self.lock:
+                    stats.calls += 1
+                    stats.total += elapsed
+                    stats.self_time += elapsed - children
+                    stats.max = max(stats.max, elapsed)
+                if ends_frame:
+                    self.end_frame()
+
+        profiled.profiled = True
+        return profiled
+
+    def end_frame(self):
+        self.frames += 1
+        if self.stream_every and self.frames % self.stream_every == 0:
+            report = self.report()
+            for listener in self.listeners:
+                listener(report)
+
+    def add_listener(self, listener, every=60):
+        self.listeners.append(listener)
+        self.stream_every = every
+
+    def reset(self):
+        for stage in self.stats:
+            self.stats[stage] = StageStats()
+        self.frames = 0
+
+    def report(self):
+        frames = max(self.frames, 1)
+        stages = []
+        for stage, stats in self.stats.items():
+            if not stats.calls:
+                continue
+            stages.append({
+                'stage': stage,
+                'calls': stats.calls,
+                'total_ms': stats.total * 1000,
+                'self_ms': stats.self_time * 1000,
+                'mean_ms': stats.total / stats.calls * 1000,
+                'max_ms': stats.max * 1000,
+                'per_frame_ms': stats.total / frames * 1000,
+            })
+        stages.sort(key=lambda entry: entry['self_ms'], reverse=True)
+        return {'frames': self.frames, 'stages': stages}
+
+    def dump(self, path):
+        with open(path, 'w', encoding='utf-8') as output:
+            json.dump(self.report(), output, indent=2)
+
+    def format(self, report=None):
+        report = report or self.report()
+        lines = [f"{report['frames']} quadros",
+                 f"{'etapa':55s} {'chamadas':>9s} {'ms/quadro':>10s} {'próprio ms':>11s} {'máx ms':>8s}"]
+        for entry in report['stages']:
+            lines.append(f"{entry['stage']:55s} {entry['calls']:9d} {entry['per_frame_ms']:10.3f} "
+                         f"{entry['self_ms']:11.1f} {entry['max_ms']:8.2f}")
+        return '\n'.join(lines)
+
+
+profiler = StageProfiler()
+_configured = False
+
+
+def enabled():
+    return os.environ.get('QUANTUMUI_PROFILE', '') not in ('', '0')
+
+
+def attach_from_environment(widget):
+    global _configured
+    if not enabled():
+        return
+    if not _configured:
+        _configured = True
+        every = int(os.environ.get('QUANTUMUI_PROFILE_EVERY', '0'))
+        if every:
+            profiler.add_listener(lambda report: print(profiler.format(report), file=sys.stderr), every)
+        output = os.environ.get('QUANTUMUI_PROFILE_OUT')
+        if output:
+            atexit.register(profiler.dump, output)
+        else:
+            atexit.register(lambda: print(profiler.format(), file=sys.stderr))
+    profiler.attach(widget)
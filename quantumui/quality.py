@@ -0,0 +1,71 @@
+import os
+from collections import deque
+
+
+def level_from_environment():
+    # QUANTUMUI_QUALITY=N fixa o nível; vazio ou "auto" deixa o governador decidir
+    value = os.environ.get('QUANTUMUI_QUALITY', 'auto').strip().lower()
+    if value in ('', 'auto'):
+        return None
+    return int(value)
+
+
+class QualityGovernor:
+    """Ajusta o nível de qualidade para manter o tempo de quadro no orçamento.
+
+    Cada animação declara seus parâmetros (``declare``) como uma sequência
+    de valores, do nível 0 (qualidade máxima) ao mais leve, e os lê com
+    ``governor['nome']``. A cada quadro o widget informa quanto gastou
+    (simulação + pintura). Se o percentil 90 de uma janela de quadros passa
+    do orçamento o nível desce um degrau; se fica abaixo de ``headroom`` do
+    orçamento, e já passaram ``cooldown`` quadros desde a última troca, sobe
+    um degrau.
+    """
+
+    def __init__(self, budget_ms, window=30, headroom=0.6, cooldown=120):
+        self.budget_ms = budget_ms
+        self.headroom = headroom
+        self.cooldown = cooldown
+        self.knobs = {}
+        self.levels = 1
+        self.level = 0
+        self.pinned = None
+        self.samples = deque(maxlen=window)
+        self.frames_since_change = 0
+
+    def declare(self, **knobs):
+        for name, values in knobs.items():
+            self.knobs[name] = tuple(values)
+            self.levels = max(self.levels, len(values))
+        self.set_level(self.level if self.pinned is None else self.pinned)
+
+    def __getitem__(self, name):
+        values = self.knobs[name]
+        return values[min(self.level, len(values) - 1)]
+
+    def pin(self, level):
+        # None volta ao modo automático
+        self.pinned = level
+        if level is not None:
+            self.set_level(level)
+
+    def set_level(self, level):
+        level = min(max(level, 0), self.levels - 1)
+        if level != self.level:
+            self.level = level
+            self.samples.clear()
+            self.frames_since_change = 0
+
+    def record(self, frame_ms):
+        self.frames_since_change += 1
+        if self.pinned is not None or self.levels < 2:
+            return
+        self.samples.append(frame_ms)
+        if len(self.samples) < self.samples.maxlen:
+            return
+
+        slow = sorted(self.samples)[int(len(self.samples) * 0.9)]
+        if slow > self.budget_ms:
+            self.set_level(self.level + 1)
+        elif slow < self.budget_ms * self.headroom and self.frames_since_change >= self.cooldown:
+            self.set_level(self.level - 1)
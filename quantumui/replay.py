@@ -0,0 +1,70 @@
+"""Gravação e reprodução exata de uma execução.
+
+Com ``QUANTUMUI_RECORD=execucao.json`` o widget grava, ao sair, a semente
+das suas fontes aleatórias, o tamanho e, para cada quadro pintado, os
+passos de simulação (``dt``) feitos antes dele e o nível de qualidade. O harness reproduz a execução quadro
+a quadro::
+
+    QUANTUMUI_RECORD=execucao.json python voxy_animation.py
+    python -m quantumui.harness --replay execucao.json --out quadros/
+
+Eventos de mouse e chamadas como ``set_listening`` não são gravados.
+"""
+
+import atexit
+import json
+import os
+import sys
+
+
+class Recorder:
+    def __init__(self, widget):
+        self.widget = widget
+        self.pending = []
+        self.frames = []
+
+    def steps(self, steps):
+        self.pending.extend(steps)
+
+    def frame(self, quality):
+        self.frames.append({'steps': self.pending, 'quality': quality})
+        self.pending = []
+
+    def run(self):
+        from .catalog import ROOT
+
+        widget = self.widget
+        path = os.path.abspath(sys.modules[type(widget).__module__].__file__)
+        return {
+            'script': f'{os.path.relpath(path, ROOT)}:{type(widget).__name__}'.replace(os.sep, '/'),
+            'seed': widget.streams.seed,
+            'size': [widget.width(), widget.height()],
+            'frames': self.frames,
+        }
+
+    def dump(self, path):
+        with open(path, 'w', encoding='utf-8') as output:
+            json.dump(self.run(), output)
+
+
+def attach_from_environment(widget):
+    path = os.environ.get('QUANTUMUI_RECORD')
+    if not path:
+        return None
+    recorder = Recorder(widget)
+    atexit.register(recorder.dump, path)
+    return recorder
+
+
+def load_run(path):
+    with open(path, encoding='utf-8') as source:
+        return json.load(source)
+
+
+def replay_frames(widget, run, image, render):
+    # Refaz os passos gravados de cada quadro e pinta com render(widget, image)
+    for frame in run['frames']:
+        widget.quality.pin(frame['quality'])
+        widget.run_steps(frame['steps'])
+        render(widget, image)
+        yield image
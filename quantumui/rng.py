@@ -0,0 +1,118 @@
+import os
+import random
+
+import numpy as np
+
+from .compositor import layer_pool
+
+
+def seed_from_environment():
+    # QUANTUMUI_SEED=N fixa a semente; sem ela, cada widget sorteia a sua
+    value = os.environ.get('QUANTUMUI_SEED', '').strip()
+    if value:
+        return int(value)
+    return random.getrandbits(64)
+
+
+class RandomStreams:
+    """Fontes aleatórias de um widget, todas derivadas de uma semente.
+
+    ``sim`` alimenta a simulação (posições, nascimentos, raios) e
+    ``cosmetic`` os efeitos puramente visuais (glitches, piscadas), para que
+    mudar um efeito não desloque os sorteios da simulação. ``numpy()``
+    cria geradores NumPy derivados da simulação (sistemas de partículas).
+    Os sorteios acontecem nos passos de simulação, nunca no ``paintEvent``:
+    pintar o mesmo estado duas vezes dá os mesmos pixels, e a mesma semente
+    com os mesmos passos reproduz uma execução.
+    """
+
+    def __init__(self, seed=None):
+        self.seed = seed_from_environment() if seed is None else seed
+        self.sim = self.stream('sim')
+        self.cosmetic = self.stream('cosmetic')
+
+    def stream(self, name):
+        # Semente em texto: derivação estável (SHA-512), sem depender do hash do Python
+        return random.Random(f'{self.seed}:{name}')
+
+    def numpy(self):
+        return np.random.default_rng(self.sim.getrandbits(128))
+
+    def pool(self, name='sim'):
+        # Pool de sorteios em bloco semeado pela fonte name
+        return RandomPool(getattr(self, name))
+
+
+def glitch_text(text, rng, chance, alphabet):
+    # Troca cada caractere por um de alphabet com probabilidade chance
+    return ''.join(rng.choice(alphabet) if rng.random() < chance else char for char in text)
+
+
+class _Block:
+    # Um tipo de sorteio: o bloco atual e o próximo, gerado em segundo plano
+    def __init__(self, fill, size):
+        self.fill = fill
+        self.size = size
+        self.data = fill(size)
+        self.pos = 0
+        self.prefetch()
+
+    def prefetch(self):
+        pool = layer_pool()
+        self.next = pool.submit(self.fill, self.size) if pool is not None else None
+
+    def refill(self):
+        self.data = self.next.result() if self.next is not None else self.fill(self.size)
+        self.pos = 0
+        self.prefetch()
+
+    def take(self, n):
+        end = self.pos + n
+        if end <= len(self.data):
+            values = self.data[self.pos:end]
+            self.pos = end
+            return values
+        parts = [self.data[self.pos:]]
+        missing = n - len(parts[0])
+        while missing > 0:
+            self.refill()
+            count = min(missing, len(self.data))
+            parts.append(self.data[:count])
+            self.pos = count
+            missing -= count
+        return np.concatenate(parts)
+
+
+class RandomPool:
+    """Sorteios NumPy gerados em blocos e entregues em fatias.
+
+    Troca milhares de chamadas escalares a ``random`` por quadro por uma
+    fatia de um array já pronto. Cada tipo (uniformes, normais) tem o seu
+    gerador, semeado por ``rng`` (``self.random`` ou ``self.cosmetic``), e
+    o próximo bloco é gerado no pool de threads enquanto o atual é
+    consumido. Os blocos saem sempre na mesma ordem: com a mesma semente,
+    a sequência não depende de haver threads.
+    """
+
+    BLOCK = 4096
+
+    def __init__(self, rng, block=BLOCK):
+        seed = rng.getrandbits(64)
+        self.uniforms = _Block(np.random.default_rng([seed, 0]).random, block)
+        self.normals = _Block(np.random.default_rng([seed, 1]).standard_normal, block)
+
+    def random(self, n):
+        return self.uniforms.take(n)
+
+    def uniform(self, low, high, n):
+        return low + (high - low) * self.random(n)
+
+    def normal(self, n, loc=0.0, scale=1.0):
+        return loc + scale * self.normals.take(n)
+
+    def indices(self, count, n):
+        # Índices em 0..count-1, como random.randrange(count)
+        return (self.random(n) * count).astype(np.intp)
+
+    def choice(self, items, k):
+        return [items[i] for i in self.indices(len(items), k).tolist()]
@@ -0,0 +1,104 @@
+import time
+
+from PySide6.QtCore import QObject, QEvent, QTimer, Qt
+from PySide6.QtGui import QRegion
+
+
+class RenderScheduler(QObject):
+    """Agenda repinturas sob demanda para um widget.
+
+    Pedidos de frame são agrupados e limitados à taxa alvo. Um pedido pode
+    trazer só a região alterada; as regiões pendentes se unem e o widget
+    recebe ``update(QRegion)``, ou ``update()`` se algum pedido não disse
+    o que mudou. Enquanto a janela está escondida, minimizada ou sem área
+    exposta nada é pintado e o widget é avisado para suspender a simulação.
+    """
+
+    def __init__(self, widget, max_fps=60, time_source=time.perf_counter):
+        super().__init__(widget)
+        self.widget = widget
+        self.frame_interval = 1.0 / max_fps
+        self.time_source = time_source
+
+        self.pending = False
+        # Região a repintar no próximo frame; None = o widget inteiro
+        self.dirty = None
+        self.last_frame_time = None
+        # Começa suspenso até o widget ser exibido
+        self.suspended = True
+        self.watched_window = None
+
+        self.frame_timer = QTimer(self)
+        self.frame_timer.setSingleShot(True)
+        self.frame_timer.setTimerType(Qt.PreciseTimer)
+        self.frame_timer.timeout.connect(self.flush)
+
+    def set_max_fps(self, max_fps):
+        self.frame_interval = 1.0 / max_fps
+
+    def request_frame(self, region=None):
+        if region is None or (self.pending and self.dirty is None):
+            self.dirty = None
+        elif self.pending:
+            self.dirty = self.dirty.united(region)
+        else:
+            self.dirty = QRegion(region)
+        self.pending = True
+        if self.suspended or self.frame_timer.isActive():
+            return
+
+        now = self.time_source()
+        if self.last_frame_time is None:
+            wait = 0.0
+        else:
+            wait = self.frame_interval - (now - self.last_frame_time)
+
+        if wait <= 0:
+            self.flush()
+        else:
+            self.frame_timer.start(int(wait * 1000))
+
+    def flush(self):
+        if not self.pending or self.suspended:
+            return
+        self.pending = False
+        self.last_frame_time = self.time_source()
+        dirty, self.dirty = self.dirty, None
+        if dirty is None:
+            self.widget.update()
+        else:
+            self.widget.update(dirty)
+
+    def is_presentable(self):
+        widget = self.widget
+        if not widget.isVisible() or widget.isMinimized():
+            return False
+        window = widget.window().windowHandle()
+        return window is None or window.isExposed()
+
+    def refresh_visibility(self):
+        self.watch_window()
+        presentable = self.is_presentable()
+        if presentable and self.suspended:
+            self.suspended = False
+            self.widget.resume_animation()
+            self.request_frame()
+        elif not presentable and not self.suspended:
+            self.suspended = True
+            self.frame_timer.stop()
+            self.widget.suspend_animation()
+
+    def watch_window(self):
+        # A janela nativa só existe depois do primeiro show()
+        window = self.widget.window().windowHandle()
+        if window is not None and window is not self.watched_window:
+            if self.watched_window is not None:
+                self.watched_window.removeEventFilter(self)
+            window.installEventFilter(self)
+            self.watched_window = window
+
+    def eventFilter(self, obj, event):
+        if obj is self.watched_window and event.type() == QEvent.Expose:
+            # Adiado: isExposed() só reflete o novo estado após o evento
+            QTimer.singleShot(0, self.refresh_visibility)
+        return False
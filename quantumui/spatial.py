@@ -0,0 +1,102 @@
+import numpy as np
+
+# Células vizinhas visitadas a partir de cada célula: metade da vizinhança
+# 3x3, para que cada par de células seja comparado uma única vez
+FORWARD_CELLS = ((0, 1), (1, -1), (1, 0), (1, 1))
+
+
+def expand_ranges(starts, counts):
+    # Concatena os intervalos [start, start + count) sem laço em Python
+    total = int(counts.sum())
+    offsets = np.repeat(np.cumsum(counts) - counts, counts)
+    return np.arange(total) - offsets + np.repeat(starts, counts)
+
+
+def grid_pairs(x, y, radius):
+    """Pares ``(i, j)`` de pontos em células iguais ou vizinhas de uma grade.
+
+    A grade uniforme tem células de lado ``radius``, então todo par a menos
+    de ``radius`` de distância aparece no resultado (junto com alguns mais
+    distantes, que o chamador filtra). Custa O(n + pares) em vez de O(n²).
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    count = len(x)
+    if count < 2:
+        return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp)
+
+    cell_x = np.floor(x / radius).astype(np.int64)
+    cell_y = np.floor(y / radius).astype(np.int64)
+    cell_x -= cell_x.min()
+    cell_y -= cell_y.min() - 1  # uma linha livre acima para o deslocamento -1
+    span = int(cell_y.max()) + 2
+    keys = cell_x * span + cell_y
+
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    rank = np.empty(count, dtype=np.intp)
+    rank[order] = np.arange(count)
+
+    # Mesma célula: só os que vêm depois na ordenação
+    ends = np.searchsorted(sorted_keys, keys, side='right')
+    firsts = [np.repeat(np.arange(count), ends - rank - 1)]
+    seconds = [order[expand_ranges(rank + 1, ends - rank - 1)]]
+
+    for dx, dy in FORWARD_CELLS:
+        target = keys + dx * span + dy
+        starts = np.searchsorted(sorted_keys, target, side='left')
+        counts = np.searchsorted(sorted_keys, target, side='right') - starts
+        firsts.append(np.repeat(np.arange(count), counts))
+        seconds.append(order[expand_ranges(starts, counts)])
+
+    return np.concatenate(firsts), np.concatenate(seconds)
+
+
+class NeighborList:
+    """Pares de pontos a menos de ``radius``, atualizados incrementalmente.
+
+    Os candidatos vêm de ``grid_pairs`` com uma folga (``skin``) além do
+    raio. Enquanto nenhum ponto se deslocar mais de ``skin / 2`` desde a
+    última reconstrução, nenhum par novo pode ter surgido fora da lista, e
+    cada ``update`` só mede a distância dos candidatos. Arestas entram e
+    saem exatamente no limiar a cada quadro.
+    """
+
+    def __init__(self, radius, skin=None):
+        self.radius = radius
+        self.skin = radius * 0.1 if skin is None else skin
+        self.reference = None
+        self.candidates = (np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp))
+        self.first = self.candidates[0]
+        self.second = self.candidates[1]
+        self.distance = np.zeros(0)
+        self.rebuilds = 0
+
+    def __len__(self):
+        return len(self.first)
+
+    def pair(self, index):
+        return int(self.first[index]), int(self.second[index])
+
+    def needs_rebuild(self, x, y):
+        if self.reference is None or len(self.reference[0]) != len(x):
+            return True
+        ref_x, ref_y = self.reference
+        moved = (x - ref_x) ** 2 + (y - ref_y) ** 2
+        return bool(moved.max(initial=0) > (self.skin / 2) ** 2)
+
+    def update(self, x, y):
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        if self.needs_rebuild(x, y):
+            first, second = grid_pairs(x, y, self.radius + self.skin)
+            near = np.hypot(x[first] - x[second], y[first] - y[second]) < self.radius + self.skin
+            self.candidates = first[near], second[near]
+            self.reference = x.copy(), y.copy()
+            self.rebuilds += 1
+
+        first, second = self.candidates
+        distance = np.hypot(x[first] - x[second], y[first] - y[second])
+        near = distance < self.radius
+        self.first, self.second, self.distance = first[near], second[near], distance[near]
+        return self
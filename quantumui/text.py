@@ -0,0 +1,130 @@
+import math
+import threading
+from collections import OrderedDict, namedtuple
+
+from PySide6.QtCore import QPointF, Qt
+from PySide6.QtGui import QFont, QFontMetricsF, QStaticText, QTransform
+
+TextLayout = namedtuple('TextLayout', 'static width height')
+
+# Transformações em que as contas de posição do draw batem com as do drawText
+_TRANSLATIONS = frozenset((QTransform.TxNone, QTransform.TxTranslate))
+
+
+def _fixed(value):
+    # drawText trunca a posição para 1/64 de pixel (QFixed) antes de aplicar
+    # a transformação; drawStaticText só arredonda no destino
+    return math.trunc(value * 64) / 64
+
+
+def _alignment(flags):
+    # Frações da folga do retângulo à esquerda e acima do texto; None para
+    # flags que só o drawText entende (quebra de linha, TextDontClip...)
+    if int(flags) & ~int(Qt.AlignHorizontal_Mask | Qt.AlignVertical_Mask):
+        return None
+    horizontal = 0.5 if flags & Qt.AlignHCenter else 1.0 if flags & Qt.AlignRight else 0.0
+    vertical = 0.5 if flags & Qt.AlignVCenter else 1.0 if flags & Qt.AlignBottom else 0.0
+    return horizontal, vertical
+
+
+class TextCache:
+    """Fontes, métricas e layouts de texto compartilhados entre quadros.
+
+    ``font(família, tamanho, peso)`` devolve sempre o mesmo ``QFont``: não
+    altere o objeto, peça outro tamanho. ``metrics(font)`` guarda o
+    ``QFontMetricsF`` de cada fonte e ``layout(text, font, dpr)`` o
+    ``QStaticText`` já preparado, com largura e altura, então um texto
+    repetido (os passes de brilho, os rótulos de cada quadro) é moldado uma
+    vez e cada quadro só o posiciona.
+
+    ``draw`` substitui ``QPainter.drawText(rect, flags, text)`` com os
+    mesmos pixels enquanto o painter só estiver transladado. Com escala ou
+    rotação o arredondamento das posições já não é o do ``drawText``, então
+    a chamada volta para ele, como tudo o que um layout estático não
+    reproduz: várias linhas, quebra de palavras, texto maior que o
+    retângulo (que o ``drawText`` recorta). Vale a pena em textos longos ou
+    grandes que cabem no retângulo (linhas de status, títulos); passes de
+    brilho curtos e recortados ficam no ``drawText``, que pelo PySide sai
+    mais barato. Para comparar os dois caminhos, renderize cada um num
+    processo novo: o primeiro quadro com texto grande escalado já varia
+    alguns níveis entre a primeira pintura do processo e as seguintes, pelo
+    cache de glifos do próprio Qt, com qualquer um dos dois.
+
+    Os objetos de texto do Qt não podem ser usados por duas threads ao
+    mesmo tempo (``drawStaticText`` reposiciona os glifos do layout), então
+    métricas e layouts são guardados por thread, como as das camadas em
+    paralelo.
+    """
+
+    def __init__(self, capacity=1024):
+        self.capacity = capacity
+        self.fonts = {}
+        self.font_metrics = {}
+        self.layouts = OrderedDict()
+        self.alignments = {}
+        self.lock = threading.Lock()
+
+    def font(self, family, point_size, weight=QFont.Normal):
+        key = (family, point_size, weight)
+        with self.lock:
+            font = self.fonts.get(key)
+            if font is None:
+                font = self.fonts[key] = QFont(family, point_size, weight)
+            return font
+
+    def metrics(self, font):
+        key = (font, threading.get_ident())
+        with self.lock:
+            metrics = self.font_metrics.get(key)
+            if metrics is None:
+                metrics = self.font_metrics[key] = QFontMetricsF(font)
+            return metrics
+
+    def layout(self, text, font, dpr=1.0):
+        key = (text, font, dpr, threading.get_ident())
+        with self.lock:
+            layout = self.layouts.get(key)
+            if layout is not None:
+                self.layouts.move_to_end(key)
+                return layout
+        static = QStaticText(text)
+        static.setTextFormat(Qt.PlainText)
+        static.prepare(QTransform.fromScale(dpr, dpr), font)
+        metrics = self.metrics(font)
+        layout = TextLayout(static, metrics.horizontalAdvance(text), metrics.height())
+        with self.lock:
+            self.layouts[key] = layout
+            if len(self.layouts) > self.capacity:
+                self.layouts.popitem(last=False)
+        return layout
+
+    def draw(self, painter, rect, flags, text):
+        """Como ``painter.drawText(rect, flags, text)`` com a fonte do painter."""
+        alignment = self.alignments.get(flags)
+        if alignment is None and flags not in self.alignments:
+            alignment = self.alignments[flags] = _alignment(flags)
+        if alignment is None or '\n' in text or painter.transform().type() not in _TRANSLATIONS:
+            painter.drawText(rect, flags, text)
+            return
+        layout = self.layout(text, painter.font(), painter.device().devicePixelRatioF())
+        width, height = rect.width(), rect.height()
+        if layout.width > width or layout.height > height:
+            # Texto maior que o retângulo: o drawText o recorta, mais barato
+            # que recortar daqui
+            painter.drawText(rect, flags, text)
+            return
+        # Mesmas contas do drawText (x + folga * fração), para os mesmos arredondamentos
+        horizontal, vertical = alignment
+        x = rect.x() + (width - layout.width) * horizontal
+        y = rect.y() + (height - layout.height) * vertical
+        painter.drawStaticText(QPointF(_fixed(x), _fixed(y)), layout.static)
+
+    def clear(self):
+        with self.lock:
+            self.fonts.clear()
+            self.font_metrics.clear()
+            self.layouts.clear()
+
+
+# Cache compartilhado pelas animações
+text_cache = TextCache()
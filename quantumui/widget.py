@@ -0,0 +1,161 @@
+import time
+
+from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import Qt, QEvent, QPointF, QRectF, QTimer
+from PySide6.QtGui import QRegion
+
+from . import profiling, replay
+from .clock import FrameClock
+from .layers import LayerCache
+from .quality import QualityGovernor, level_from_environment
+from .rng import RandomStreams
+from .scheduler import RenderScheduler
+
+
+class AnimatedWidget(QWidget):
+    """Base comum das animações: um único caminho controla o ritmo.
+
+    As subclasses implementam ``update_animation`` (um passo de simulação)
+    e ``paintEvent``. O passo atual, em segundos, fica em ``self.dt``.
+    Repinturas passam pelo ``RenderScheduler``; nunca chame ``self.update()``
+    de dentro do ``paintEvent``. Animações que só mudam partes da janela
+    marcam essas áreas com ``damage`` a cada passo e pulam no
+    ``paintEvent`` o que não estiver exposto (``exposed``). Parâmetros de
+    qualidade declarados em ``self.quality`` são ajustados pelo tempo
+    medido de cada quadro. Sorteios usam ``self.random`` (simulação) ou
+    ``self.cosmetic`` (efeitos visuais), sempre dentro de
+    ``update_animation``: o ``paintEvent`` só lê o estado.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.frame_clock = None
+        self.animation_running = False
+        self.dt = 0.0
+        self.update_ms = 0.0
+        self.damaged = QRegion()
+
+        # Fontes aleatórias do widget; QUANTUMUI_SEED fixa a semente
+        self.streams = RandomStreams()
+        self.random = self.streams.sim
+        self.cosmetic = self.streams.cosmetic
+
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self.tick)
+
+        self.scheduler = RenderScheduler(self)
+        self.layers = LayerCache(self)
+        self.quality = QualityGovernor(self.scheduler.frame_interval * 1000)
+        self.quality.pin(level_from_environment())
+        # QUANTUMUI_PROFILE=1 mede cada draw_* sem editar os scripts
+        profiling.attach_from_environment(self)
+        # QUANTUMUI_RECORD=arquivo.json grava a execução para o harness reproduzir
+        self.recorder = replay.attach_from_environment(self)
+
+    def start_animation(self, step_ms, variable_dt=False):
+        # step_ms é o intervalo original do timer: um passo de simulação
+        self.frame_clock = FrameClock(step_ms / 1000, variable_dt=variable_dt)
+        self.animation_running = True
+        if self.scheduler.suspended:
+            self.scheduler.refresh_visibility()
+        else:
+            self.resume_animation()
+
+    def stop_animation(self):
+        self.animation_running = False
+        self.suspend_animation()
+
+    def suspend_animation(self):
+        self.timer.stop()
+        if self.frame_clock is not None:
+            self.frame_clock.reset()
+
+    def resume_animation(self):
+        if not self.animation_running or self.frame_clock is None:
+            return
+        # Recomeça a contagem: o tempo em que a janela ficou oculta é descartado
+        self.frame_clock.start()
+        self.timer.start(round(self.frame_clock.step * 1000))
+
+    def tick(self):
+        self.run_steps(self.frame_clock.tick())
+
+    def advance(self, elapsed):
+        # Avança a simulação por um tempo explícito (usado fora do timer)
+        if self.frame_clock is None:
+            return 0
+        return self.run_steps(self.frame_clock.advance(elapsed))
+
+    def run_steps(self, steps):
+        start = time.perf_counter()
+        for dt in steps:
+            self.dt = dt
+            self.update_animation()
+        self.update_ms += (time.perf_counter() - start) * 1000
+        if self.recorder is not None:
+            self.recorder.steps(steps)
+        if steps:
+            # Sem áreas marcadas nos passos, repinta o widget inteiro
+            damaged, self.damaged = self.damaged, QRegion()
+            self.scheduler.request_frame(None if damaged.isEmpty() else damaged)
+        return len(steps)
+
+    def update_animation(self):
+        pass
+
+    @staticmethod
+    def damage_rect(rect):
+        # Retângulo inteiro com 1 px de folga para o antialiasing
+        if isinstance(rect, QRectF):
+            rect = rect.toAlignedRect()
+        return rect.adjusted(-1, -1, 1, 1)
+
+    def damage(self, rect):
+        # Marca uma área (QRect/QRectF) alterada neste passo de simulação
+        self.damaged = self.damaged.united(self.damage_rect(rect))
+
+    def exposed(self, event, rect):
+        # Se um elemento em rect precisa ser pintado neste paintEvent
+        return event.region().intersects(self.damage_rect(rect))
+
+    def draw_layer(self, painter, name, paint, x=0, y=0, size=None, key=None, opacity=1.0):
+        # Fundo invariante: pintado uma vez por tamanho/DPR e depois só copiado
+        pixmap = self.layers.layer(name, paint, size, key)
+        if opacity >= 1.0:
+            painter.drawPixmap(QPointF(x, y), pixmap)
+            return
+        painter.save()
+        painter.setOpacity(painter.opacity() * opacity)
+        painter.drawPixmap(QPointF(x, y), pixmap)
+        painter.restore()
+
+    def event(self, event):
+        if event.type() != QEvent.Paint:
+            return super().event(event)
+        # Tempo do quadro = passos de simulação desde a última pintura + pintura
+        level = self.quality.level
+        start = time.perf_counter()
+        handled = super().event(event)
+        self.quality.record(self.update_ms + (time.perf_counter() - start) * 1000)
+        self.update_ms = 0.0
+        if self.recorder is not None:
+            self.recorder.frame(level)
+        return handled
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.layers.invalidate()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.scheduler.refresh_visibility()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.scheduler.refresh_visibility()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == event.Type.WindowStateChange:
+            self.scheduler.refresh_visibility()
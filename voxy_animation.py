@@ -1,11 +1,15 @@
 import sys
-from PySide6.QtWidgets import QApplication, QWidget
-from PySide6.QtGui import QPainter, QPen, QColor, QFont, QRadialGradient, QPainterPath, QLinearGradient, QBrush
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF, QEasingCurve
-from math import cos, sin, pi, exp
-import random
+from PySide6.QtWidgets import QApplication
+from PySide6.QtGui import QPainter, QPen, QColor, QRadialGradient
+from PySide6.QtCore import Qt, QPointF, QRectF, QEasingCurve
+from math import sin, pi, exp
+import numpy as np
+from quantumui import AnimatedWidget, ParticleSystem, angular_basis, paint_pool, polar_polygon
 
-class GhostlyAssistantWidget(QWidget):
+class GhostlyAssistantWidget(AnimatedWidget):
+    # Cores do gradiente de cada segmento das ondas de voz
+    WAVE_STOPS = ((0, (0, 255, 255)), (0.5, (100, 200, 255)), (1, (0, 255, 0)))
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Ghostly Assistant")
@@ -13,6 +17,9 @@ class GhostlyAssistantWidget(QWidget):
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.setWindowFlags(Qt.FramelessWindowHint)
         
+        # Parâmetros de qualidade, do nível mais caro ao mais leve
+        self.quality.declare(wave_points=(180, 120, 72), antialiasing=(True, True, False))
+        
         # Estados da animação
         self.is_listening = False
         self.is_speaking = True
@@ -32,28 +39,22 @@ class GhostlyAssistantWidget(QWidget):
         self.pulse = 0
         self.particle_time = 0
         self.ghost_movement = 0
-        self.ghost_particles = []
+        self.ghost_particles = ParticleSystem(30, extra=('opacity',), rng=self.streams.numpy())
         self.generate_ghost_particles()
         
         # Easing curve para movimento fantasmagórico
         self.easing = QEasingCurve(QEasingCurve.InOutSine)
         
         # Configurar timer
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(16)  # 60 FPS
+        self.start_animation(16)  # 60 FPS
     
     def generate_ghost_particles(self):
-        for _ in range(30):
-            particle = {
-                'x': random.uniform(0, self.width()),
-                'y': random.uniform(0, self.height()),
-                'size': random.uniform(5, 15),
-                'speed': random.uniform(0.2, 1.0),
-                'angle': random.uniform(0, 2*pi),
-                'opacity': random.uniform(50, 150)
-            }
-            self.ghost_particles.append(particle)
+        particles = self.ghost_particles
+        particles.x = particles.uniform(0, self.width())
+        particles.y = particles.uniform(0, self.height())
+        particles.size = particles.uniform(5, 15)
+        particles.set_polar_velocity(particles.uniform(0, 2*pi), particles.uniform(0.2, 1.0))
+        particles.opacity = particles.uniform(50, 150)
     
     def update_animation(self):
         # Atualizar variáveis de animação
@@ -88,8 +89,6 @@ class GhostlyAssistantWidget(QWidget):
             
             # Movimento flutuante contínuo
             self.ghost_y_offset = -10 + 5 * sin(self.ghost_movement)
-        
-        self.update()
     
     def draw_ghost_effects(self, painter, center_x, center_y):
         # Aura fantasmagórica
@@ -104,27 +103,13 @@ class GhostlyAssistantWidget(QWidget):
         painter.drawEllipse(QPointF(center_x, center_y), ghost_radius, ghost_radius)
     
     def draw_wave_circle(self, painter, center_x, center_y, base_radius):
-        num_points = 180
-        path = QPainterPath()
-        first_point = None
-        
-        for i in range(num_points + 1):
-            angle = (i * 360 / num_points) * pi / 180
-            # Raio variável baseado em várias ondas
-            radius = base_radius + 20 * sin(4 * angle + self.wave_time) * self.energy_level
-            radius += 10 * cos(8 * angle - self.wave_time * 2) * self.energy_level
-            
-            x = center_x + radius * cos(angle)
-            y = center_y + radius * sin(angle)
-            
-            if i == 0:
-                path.moveTo(x, y)
-                first_point = (x, y)
-            else:
-                path.lineTo(x, y)
+        num_points = self.quality['wave_points']
+        angles, _, _ = angular_basis(num_points)
         
-        if first_point:
-            path.lineTo(first_point[0], first_point[1])
+        # Raio variável baseado em várias ondas
+        radius = base_radius + 20 * np.sin(4 * angles + self.wave_time) * self.energy_level
+        radius += 10 * np.cos(8 * angles - self.wave_time * 2) * self.energy_level
+        polygon = polar_polygon(center_x, center_y, radius, num_points)
         
         # Desenhar com gradiente
         gradient = QRadialGradient(center_x, center_y, base_radius * 2)
@@ -134,11 +119,33 @@ class GhostlyAssistantWidget(QWidget):
         
         painter.setPen(QPen(QColor(0, 255, 255, 100), 2))
         painter.setBrush(gradient)
-        painter.drawPath(path)
+        painter.drawPolygon(polygon)
+    
+    def paint_ghost_background(self, painter, width, height):
+        radius = width / 2
+        gradient = QRadialGradient(radius, radius, radius)
+        gradient.setColorAt(0, QColor(20, 30, 50, 40))
+        gradient.setColorAt(1, QColor(0, 0, 20, 0))
+        painter.fillRect(0, 0, width, height, gradient)
+    
+    def draw_ghost_background(self, painter, center_x, center_y):
+        # Só o alfa e a posição variam a cada quadro: a camada é pintada com o
+        # alfa máximo em coordenadas de tela e copiada com opacidade e deslocamento
+        radius = round(500 * self.ghost_scale)
+        alpha = int(20 * (1 + sin(self.ghost_movement))) / 40
+        clip = painter.transform().mapRect(QRectF(0, 0, self.width(), self.height()))
+        
+        painter.save()
+        painter.resetTransform()
+        painter.setClipRect(clip)
+        self.draw_layer(painter, 'ghost_background', self.paint_ghost_background,
+                        center_x - radius, center_y - radius, size=(2 * radius, 2 * radius),
+                        opacity=alpha)
+        painter.restore()
     
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.Antialiasing, self.quality['antialiasing'])
         
         # Centro da tela com offset fantasmagórico
         center_x = self.width() / 2
@@ -153,10 +160,7 @@ class GhostlyAssistantWidget(QWidget):
         painter.setOpacity(self.ghost_opacity / 255.0)
         
         # Fundo com gradiente fantasmagórico
-        gradient = QRadialGradient(center_x, center_y, 500)
-        gradient.setColorAt(0, QColor(20, 30, 50, int(20 * (1 + sin(self.ghost_movement)))))
-        gradient.setColorAt(1, QColor(0, 0, 20, 0))
-        painter.fillRect(0, 0, self.width(), self.height(), gradient)
+        self.draw_ghost_background(painter, center_x, center_y)
         
         # Efeitos fantasmagóricos
         self.draw_ghost_effects(painter, center_x, center_y)
@@ -189,15 +193,8 @@ class GhostlyAssistantWidget(QWidget):
                     opacity = int(200 * exp(-abs(x - center_x)/(wave_width/3)))
                     
                     # Gradiente para as ondas com efeito fantasma
-                    gradient = QLinearGradient(prev_x, prev_y1, x, y1)
-                    gradient.setColorAt(0, QColor(0, 255, 255, opacity))
-                    gradient.setColorAt(0.5, QColor(100, 200, 255, opacity))
-                    gradient.setColorAt(1, QColor(0, 255, 0, opacity))
-                    
-                    pen = QPen(QBrush(gradient), wave_thickness)
-                    pen.setCapStyle(Qt.RoundCap)
-                    pen.setJoinStyle(Qt.RoundJoin)
-                    painter.setPen(pen)
+                    painter.setPen(paint_pool.gradient_pen(self.WAVE_STOPS, opacity, wave_thickness,
+                                                           prev_x, prev_y1, x, y1))
                     
                     painter.drawLine(QPointF(prev_x, prev_y1), QPointF(x, y1))
                     painter.drawLine(QPointF(prev_x, prev_y2), QPointF(x, y2))
@@ -205,13 +202,11 @@ class GhostlyAssistantWidget(QWidget):
                     # Pontos de brilho nas intersecções com efeito fantasma
                     glow_size = wave_thickness * 1.5
                     painter.setPen(Qt.NoPen)
-                    painter.setBrush(QColor(0, 255, 255, opacity))
+                    painter.setBrush(paint_pool.brush(0, 255, 255, opacity))
                     painter.drawEllipse(QPointF(x, y1), glow_size/2, glow_size/2)
                     painter.drawEllipse(QPointF(x, y2), glow_size/2, glow_size/2)
                 
                 prev_x, prev_y1, prev_y2 = x, y1, y2
-        
-        self.update()
 
     def mousePressEvent(self, event):
         self.old_pos = event.globalPosition().toPoint()